@@ -1,7 +1,8 @@
 # AgriSenseGuardian Forecast Agent - Advanced Agricultural Risk Assessment Specialist
 # Leverages Real-Time Weather, Satellite, And Climate Data For Comprehensive Farm Analysis
 
-from typing import Dict, Any
+import asyncio
+from typing import Awaitable, Dict, Any, Iterable, List, Optional, Tuple
 from google.adk.tools.tool_context import ToolContext
 from google.adk.agents.llm_agent import Agent
 
@@ -10,6 +11,13 @@ from Tools.WeatherTool import WeatherTool
 from Tools.SatelliteTool import GetSatelliteData
 from Tools.CopernicusTool import CopernicusTool
 from Tools.SoilTestTool import SoilTestTool
+from Services.ForecastCache import get_forecast_cache
+from Services.Geocoder import get_geocoder
+from Services.NdviHistory import NdviReading, get_ndvi_history
+from Agents.WorkflowContext import EmitStage
+from Services.RiskEngine import RiskColumns, evaluate_risks, region_code, regional_adjustments
+from Config.Settings import get_settings
+from Utils.Observability import inc_source
 
 
 class ForecastAgent:
@@ -40,7 +48,7 @@ class ForecastAgent:
         """
         pass
     
-    def ComputeRiskFromSources(self, weather: Dict[str, Any], satellite: Dict[str, Any], copernicus: Dict[str, Any], soil: Dict[str, Any], location: str) -> Dict[str, Any]:
+    def ComputeRiskFromSources(self, weather: Dict[str, Any], satellite: Dict[str, Any], copernicus: Dict[str, Any], soil: Dict[str, Any], location: str, ndvi: Optional[float] = None) -> Dict[str, Any]:
         """
         Fuse Multi-Source Environmental Data Into Comprehensive Agricultural Risk Assessments.
         
@@ -54,261 +62,39 @@ class ForecastAgent:
             satellite: Satellite-Derived Agroclimatology From NASA POWER
             copernicus: ESA Climate Data Including Soil Moisture And NDVI
             soil: Soil Profile Data From ISRIC SoilGrids Including Texture, pH, Nutrients
-            location: Geographic Location String For Regional Pattern Adjustments
+            location: Geographic Location String; Regional Adjustments Use The Tools'
+                Geocoded Coordinates When Present And Fall Back To This Text
+            ndvi: Latest NDVI From The Field's History, Used When copernicus Has None
             
         Returns:
             Structured Risk Assessment With Categories, Levels, Confidence Scores,
             And Overall Risk Classification For Agricultural Decision Making
         """
-        # Initialize Risk Levels With Conservative Baseline Assumptions
-        DroughtLevel = 'Low'
-        FloodLevel = 'Low'
-        HeatLevel = 'Low'
-        DiseaseLevel = 'Low'
-        PestLevel = 'Low'
-        SoilErosionLevel = 'Low'
-        NutrientLeachingLevel = 'Low'
-        ColdStressLevel = 'Low'
-        VegetationStressLevel = 'Low'
-
-        # Extract Weather Signals
-        try:
-            PrecipTotal = weather.get('Precipitation', {}).get('Total', 0)
-            PrecipProb = weather.get('Precipitation', {}).get('Probability', 0)
-            TMax = weather.get('Temperature', {}).get('Max', 0)
-            Humidity = weather.get('Humidity', {}).get('Average', weather.get('Humidity', {}).get('Mean', 0))
-        except Exception:
-            PrecipTotal = 0; PrecipProb = 0; TMax = 0; Humidity = 0
-
-        # Extract Satellite (NASA) Signals
-        NasaPrecip = satellite.get('Precipitation', {}).get('Total', 0)
-        NasaTempAvg = satellite.get('Temperature', {}).get('Average', 0)
-        NasaRadiation = satellite.get('SolarRadiation', {}).get('Average', 0)
-
-        # Extract Copernicus Signals
-        CopernicusSoil = copernicus.get('SoilMoisture', {}) if copernicus else {}
-        SoilLevel = CopernicusSoil.get('Level', None)
-        Et = copernicus.get('Evapotranspiration', {}).get('Rate', None) if copernicus else None
-        Ndvi = copernicus.get('VegetationHealth', {}).get('NDVI', None) if copernicus else None
-
-        # Extract Soil Profile Signals
-        SoilProfile = soil.get('SoilProfile', {}) if soil else {}
-        SoilPh = SoilProfile.get('pH', None)
-        SoilTexture = SoilProfile.get('SoilTexture', '')
-        SoilClay = SoilProfile.get('ClayContent', None)
-        SoilSand = SoilProfile.get('SandContent', None)
-        SoilNitrogen = SoilProfile.get('TotalNitrogen', None)
-        SoilOrganicCarbon = SoilProfile.get('SoilOrganicCarbon', None)
-
-        # Determine Regional Agricultural Patterns
-        RegionalAdjustments = self._GetRegionalAdjustments(location)
-
-        # Drought: Low Precip + High ET + Low Soil Moisture + Soil Type Factors
-        DroughtRisk = 0
-        if SoilLevel is not None and SoilLevel < 30:
-            DroughtRisk += 3
-        elif PrecipTotal < 10 and NasaPrecip < 10:
-            DroughtRisk += 2
-
-        if Et is not None and Et >= 6:
-            DroughtRisk += 2
-
-        # Soil Texture Affects Drought Risk
-        if SoilTexture:
-            if 'Sandy' in SoilTexture:
-                DroughtRisk += 1  # Sandy Soils Drain Faster, Higher Drought Risk
-            elif 'Clay' in SoilTexture:
-                DroughtRisk -= 1  # Clay Soils Retain Water Better
-
-        # Regional Adjustments
-        DroughtRisk += RegionalAdjustments.get('drought_modifier', 0)
-
-        if DroughtRisk >= 4:
-            DroughtLevel = 'High'
-        elif DroughtRisk >= 2:
-            DroughtLevel = 'Medium'
-
-        # Flood: Very High Precip Totals/Probability
-        if PrecipTotal is not None and PrecipTotal > 200:
-            FloodLevel = 'High'
-        elif PrecipTotal > 100 or PrecipProb > 70:
-            FloodLevel = 'Medium'
-
-        # Soil Erosion: High Precip Intensity + Low Vegetation Cover (NDVI Low)
-        if PrecipProb > 65 and Ndvi is not None and Ndvi < 0.5:
-            SoilErosionLevel = 'Medium'
-        if PrecipProb > 75 and Ndvi is not None and Ndvi < 0.45:
-            SoilErosionLevel = 'High'
-
-        # Nutrient Leaching: Very high Precipitation + High Soil Moisture + Soil Texture
-        LeachingRisk = 0
-        if PrecipTotal > 120 and SoilLevel is not None and SoilLevel > 60:
-            LeachingRisk += 2
-        if PrecipTotal > 180 and SoilLevel is not None and SoilLevel > 70:
-            LeachingRisk += 2
-
-        # Soil Texture Affects Leaching
-        if SoilTexture:
-            if 'Sandy' in SoilTexture:
-                LeachingRisk += 2  # Sandy Soils Leach Nutrients Easily
-            elif 'Clay' in SoilTexture:
-                LeachingRisk -= 1  # Clay Soils Retain Nutrients Better
-        if LeachingRisk >= 3:
-            NutrientLeachingLevel = 'High'
-        elif LeachingRisk >= 1:
-            NutrientLeachingLevel = 'Medium'
-
-        # Heat Stress: High Max Temps
-        if TMax >= 40 or NasaTempAvg >= 38:
-            HeatLevel = 'High'
-        elif TMax >= 35:
-            HeatLevel = 'Medium'
-
-        # Cold Stress: Unusually Low Max Temps or Avg Temps During Growing Period
-        if TMax <= 20 or NasaTempAvg <= 18:
-            ColdStressLevel = 'Medium'
-        if TMax <= 15 or NasaTempAvg <= 15:
-            ColdStressLevel = 'High'
-
-        # Disease: High Humidity + Moderate Temps + Soil pH Factors
-        DiseaseRisk = 0
-        if Humidity >= 80 and 20 <= NasaTempAvg <= 35:
-            DiseaseRisk += 3
-        elif Humidity >= 65:
-            DiseaseRisk += 2
-
-        # Soil pH Affects Disease Susceptibility
-        if SoilPh is not None:
-            if SoilPh < 5.5 or SoilPh > 8.0:
-                DiseaseRisk += 1  # Extreme pH Increases Disease Risk
-
-        if DiseaseRisk >= 3:
-            DiseaseLevel = 'High'
-        elif DiseaseRisk >= 1:
-            DiseaseLevel = 'Medium'
-
-        # Pest: Heuristic From NDVI Moderate Drop Or Vegetation Cover Signals
-        if Ndvi is not None and Ndvi < 0.45:
-            PestLevel = 'Medium'
-
-        # Vegetation Stress: Low NDVI + High ET Or High Temperature Extremes
-        if Ndvi is not None and Ndvi < 0.50 and (Et and Et > 5 or TMax > 37):
-            VegetationStressLevel = 'Medium'
-        if Ndvi is not None and Ndvi < 0.45 and (Et and Et > 6 or TMax > 39):
-            VegetationStressLevel = 'High'
-
-        # Confidence From Number Of Sources Available
-        Sources = 0
-        Sources += 1 if weather else 0
-        Sources += 1 if satellite else 0
-        Sources += 1 if copernicus else 0
-        Sources += 1 if soil else 0
-        BaseConf = {1: 65, 2: 75, 3: 85, 4: 95}.get(Sources, 60)
-
-        return {
-            'OverallRiskLevel': max([
-                DroughtLevel, FloodLevel, HeatLevel, DiseaseLevel, PestLevel,
-                SoilErosionLevel, NutrientLeachingLevel, ColdStressLevel, VegetationStressLevel
-            ], key=['Low','Medium','High','Critical'].index),
-            'RiskCategories': {
-                'DroughtRisk': {'Level': DroughtLevel, 'Confidence': BaseConf},
-                'FloodRisk': {'Level': FloodLevel, 'Confidence': BaseConf},
-                'PestOutbreakRisk': {'Level': PestLevel, 'Confidence': BaseConf-5},
-                'DiseaseRisk': {'Level': DiseaseLevel, 'Confidence': BaseConf-5},
-                'HeatStressRisk': {'Level': HeatLevel, 'Confidence': BaseConf},
-                'SoilErosionRisk': {'Level': SoilErosionLevel, 'Confidence': BaseConf-5},
-                'NutrientLeachingRisk': {'Level': NutrientLeachingLevel, 'Confidence': BaseConf-5},
-                'ColdStressRisk': {'Level': ColdStressLevel, 'Confidence': BaseConf-5},
-                'VegetationStressRisk': {'Level': VegetationStressLevel, 'Confidence': BaseConf-5}
-            }
-        }
+        # Thresholds, Regional Overrides And Confidence Come From The Shared Rule
+        # Table (Config/RiskRules.json); A Single Farm Is A Batch Of One
+        return evaluate_risks(RiskColumns.from_sources([(weather, satellite, copernicus, soil, location, ndvi)])).record(0)
     
-    def _GetRegionalAdjustments(self, location: str) -> Dict[str, int]:
+    def _GetRegionalAdjustments(self, location: str, coordinates: Optional[Tuple[float, float]] = None) -> Dict[str, int]:
         """
         Determine Regional Agricultural Patterns And Risk Adjustments For Indian Locations.
         
         Based On Major Agricultural Zones In India, Adjust Risk Thresholds To Account For
-        Local Climate Patterns, Soil Types, And Historical Agricultural Challenges.
+        Local Climate Patterns, Soil Types, And Historical Agricultural Challenges. Zones
+        And Their Modifiers Are Defined In The Risk Rule Table (Config/RiskRules.json);
+        Coordinates Are Resolved Through Its Precomputed Grid, Text Only As A Fallback.
         """
-        LocationLower = location.lower()
-        
-        # Default Adjustments
-        adjustments = {
-            'drought_modifier': 0,
-            'flood_modifier': 0,
-            'heat_modifier': 0,
-            'disease_modifier': 0,
-            'pest_modifier': 0,
-            'erosion_modifier': 0,
-            'leaching_modifier': 0,
-            'cold_modifier': 0,
-            'stress_modifier': 0
-        }
-        
-        # Northern India (Punjab, Haryana, Delhi) - Canal Irrigation, Wheat/Rice
-        if any(state in LocationLower for state in ['punjab', 'haryana', 'delhi', 'uttar pradesh', 'rajasthan']):
-            adjustments.update({
-                'drought_modifier': -1,  # Canal Systems Reduce Drought Risk
-                'flood_modifier': 1,    # Monsoon Flooding In Some Areas
-                'heat_modifier': 1,     # Hot Summers
-                'disease_modifier': 0,  # Balanced
-                'pest_modifier': 1      # Intensive Farming Increases Pest Pressure
-            })
-        
-        # Western India (Gujarat, Maharashtra) - Cotton, Sugarcane
-        elif any(state in LocationLower for state in ['gujarat', 'maharashtra', 'goa']):
-            adjustments.update({
-                'drought_modifier': 1,  # Arid Regions
-                'flood_modifier': 0,   # Coastal Areas
-                'heat_modifier': 2,    # Very Hot
-                'disease_modifier': 1, # Humid Coastal Areas
-                'erosion_modifier': 1  # Hilly Areas
-            })
-        
-        # Southern India (Karnataka, Tamil Nadu, Kerala) - Rice, Spices
-        elif any(state in LocationLower for state in ['karnataka', 'tamil nadu', 'kerala', 'andhra pradesh', 'telangana']):
-            adjustments.update({
-                'drought_modifier': 0,
-                'flood_modifier': 1,   # Monsoon Flooding
-                'heat_modifier': 1,    # Hot Climate
-                'disease_modifier': 2, # High Humidity Increases Disease
-                'pest_modifier': 1,    # Tropical Pests
-                'leaching_modifier': 1 # High Rainfall Causes Leaching
-            })
-        
-        # Eastern India (West Bengal, Odisha, Bihar) - Rice Dominant
-        elif any(state in LocationLower for state in ['west bengal', 'odisha', 'bihar', 'jharkhand']):
-            adjustments.update({
-                'drought_modifier': 0,
-                'flood_modifier': 2,   # Frequent Flooding
-                'heat_modifier': 1,
-                'disease_modifier': 2, # High Humidity
-                'erosion_modifier': 1, # River Systems
-                'leaching_modifier': 1
-            })
-        
-        # North-Eastern India - Diverse Crops, Hilly Terrain
-        elif any(state in LocationLower for state in ['assam', 'meghalaya', 'tripura', 'manipur', 'nagaland', 'arunachal pradesh', 'sikkim']):
-            adjustments.update({
-                'drought_modifier': 0,
-                'flood_modifier': 1,   # Monsoon Flooding
-                'heat_modifier': 0,
-                'disease_modifier': 1, # Humid Climate
-                'erosion_modifier': 2, # Hilly Terrain Increases Erosion
-                'cold_modifier': 1     # Higher Altitudes
-            })
-        
-        # Central India (Madhya Pradesh, Chhattisgarh) - Soybean, Wheat
-        elif any(state in LocationLower for state in ['madhya pradesh', 'chhattisgarh']):
-            adjustments.update({
-                'drought_modifier': 1,  # Semi-Arid
-                'flood_modifier': 0,
-                'heat_modifier': 1,    # Hot Climate
-                'disease_modifier': 0,
-                'erosion_modifier': 1
-            })
+        return regional_adjustments(region_code(location, coordinates))
+
+    def ComputeRiskBatch(self, Farms: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """
+        Risk Assessments For Many Farms At Once.
         
-        return adjustments
+        Each Farm Is A (weather, satellite, copernicus, soil, location[, ndvi[, coordinates]])
+        Tuple As For ComputeRiskFromSources, Evaluated By The Same Compiled Rules.
+        Inputs Are Laid Out As Columns And All Rules Run As NumPy Masks, For
+        Sweeps Over Tens Of Thousands Of Farms.
+        """
+        return evaluate_risks(RiskColumns.from_sources(Farms)).records()
 
     async def ExtractCleanLocation(self, location: str) -> str:
         """
@@ -336,6 +122,235 @@ class ForecastAgent:
         
         return location
     
+    async def _ReadNdviHistory(self, location: str) -> Optional[NdviReading]:
+        """
+        Read The Latest Stored NDVI For A Location From The Field History.
+        
+        Never Downloads Imagery: The Field Is Registered So The Scheduled
+        Ingest (When Enabled) Starts Tracking It, And None Is Returned Until
+        It Has Data.
+        """
+        try:
+            Geo = await get_geocoder().geocode(location)
+            if isinstance(Geo, dict):
+                return None
+            Lat, Lon = Geo
+            History = get_ndvi_history()
+            await History.register([(Lat, Lon)])
+            return History.latest(Lat, Lon)
+        except Exception as e:
+            print(f"[ForecastAgent] NDVI History Unavailable: {e}")
+            return None
+    
+    @staticmethod
+    def _IsUsable(Payload: Any) -> bool:
+        """True For A Tool Payload That Carries Data ('Status': 'Success')."""
+        return isinstance(Payload, dict) and Payload.get('Status') == 'Success'
+    
+    async def _FetchWithDeadline(self, Name: str, Call: Awaitable[Any], Timeout: float) -> Optional[Any]:
+        """
+        Await One Data Source Within Its Deadline.
+        
+        A Source That Misses The Deadline Is Cancelled, And One That Raises Or
+        Returns A Non-Success Payload Is Dropped; All Come Back As None So The
+        Fusion Proceeds Without Them And Counts Them As Missing.
+        """
+        try:
+            Result = await asyncio.wait_for(Call, timeout=Timeout)
+        except asyncio.TimeoutError:
+            print(f"[ForecastAgent] {Name} Missed Its {Timeout:g}s Deadline")
+            inc_source(Name, 'timeout')
+            EmitStage('SourceArrived', Source=Name, Result='timeout')
+            return None
+        except Exception as e:
+            print(f"[ForecastAgent] {Name} Failed: {e}")
+            inc_source(Name, 'error')
+            EmitStage('SourceArrived', Source=Name, Result='error')
+            return None
+        if not self._IsUsable(Result):
+            print(f"[ForecastAgent] {Name} Returned No Data: {Result.get('Message', Result.get('Status')) if isinstance(Result, dict) else Result}")
+            inc_source(Name, 'error')
+            EmitStage('SourceArrived', Source=Name, Result='error')
+            return None
+        inc_source(Name, 'ok')
+        EmitStage('SourceArrived', Source=Name, Result='ok')
+        return Result
+    
+    async def _GatherSources(self, CleanLocation: str, DaysAhead: int, Reuse: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch Weather, Satellite, Copernicus And Soil Concurrently, Each Under Its Own Deadline.
+        
+        Reuse Maps Source Name To The {'Location', 'Horizon', 'Data'} Fetched Earlier In The
+        Same Workflow And Is Updated In Place. A Source Is Fetched Again Only If It Was Missing
+        Or Failed (Soil, Whose Horizon Never Changes, Would Otherwise Never Be Retried) Or Its
+        Effective Horizon (After The Tools' Own Caps) Changed, So A Refinement Pass That
+        Lengthens The Horizon Fetches Just The Sources Whose Window Actually Grew.
+        """
+        Settings = get_settings()
+        Requests = {
+            'WeatherTool': (min(max(DaysAhead, 1), 14), lambda Horizon: WeatherTool(CleanLocation, Horizon, None), Settings.forecast_weather_timeout_seconds),
+            'SatelliteTool': (min(max(DaysAhead, 1), 30), lambda Horizon: GetSatelliteData(CleanLocation, Horizon), Settings.forecast_satellite_timeout_seconds),
+            'CopernicusTool': (min(max(DaysAhead, 1), 30), lambda Horizon: CopernicusTool(CleanLocation, Horizon, None), Settings.forecast_copernicus_timeout_seconds),
+            'SoilTestTool': (0, lambda Horizon: SoilTestTool(CleanLocation, None), Settings.forecast_soil_timeout_seconds),
+        }
+        Reuse = {} if Reuse is None else Reuse
+        Pending = {}
+        for Name, (Horizon, Fetch, Timeout) in Requests.items():
+            Previous = Reuse.get(Name)
+            if Previous and self._IsUsable(Previous['Data']) and (Previous['Location'], Previous['Horizon']) == (CleanLocation, Horizon):
+                continue
+            Pending[Name] = self._FetchWithDeadline(Name, Fetch(Horizon), Timeout)
+        if len(Pending) < len(Requests):
+            print(f"[ForecastAgent] Reusing {', '.join(Name for Name in Requests if Name not in Pending)} From Earlier In This Workflow")
+        for Name, Data in zip(Pending, await asyncio.gather(*Pending.values())):
+            Reuse[Name] = {'Location': CleanLocation, 'Horizon': Requests[Name][0], 'Data': Data}
+        return {Name: Reuse[Name]['Data'] for Name in Requests}
+    
+    def _AssembleForecast(
+        self,
+        Location: str,
+        UserQuery: str,
+        DaysAhead: int,
+        Sources: Dict[str, Any],
+        NdviHistory: Optional[NdviReading],
+        risks: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build The Forecast Result From Fetched Tool Payloads And Evaluated Risks.
+        
+        Shared By GenerateForecast And The Batch Path, So A Farm Forecast Looks
+        The Same Whichever Route Produced It.
+        """
+        Weather, Satellite, Copernicus, Soil = (
+            Sources['WeatherTool'], Sources['SatelliteTool'], Sources['CopernicusTool'], Sources['SoilTestTool']
+        )
+        MissingSources = [
+            Name for Name, Value in (
+                ('WeatherTool', Weather), ('SatelliteTool', Satellite),
+                ('CopernicusTool', Copernicus), ('SoilTestTool', Soil)
+            ) if not self._IsUsable(Value)
+        ]
+
+        # Extract soil variables for drivers
+        SoilProfile = Soil.get('SoilProfile', {}) if Soil else {}
+        SoilPh = SoilProfile.get('pH', None)
+        SoilTexture = SoilProfile.get('SoilTexture', '')
+        CopernicusSoil = Copernicus.get('SoilMoisture', {}) if Copernicus else {}
+        NdviValue = (Copernicus or {}).get('VegetationHealth', {}).get('NDVI')
+        if NdviValue is None and NdviHistory is not None:
+            NdviValue = NdviHistory.mean
+
+        # Assemble Drivers
+        Drivers = {
+            'DroughtRisk': ['Low Precipitation Totals', 'High Evapotranspiration' if Copernicus else 'Low Soil Moisture Signal', f'{SoilTexture} Soil Texture' if SoilTexture else ''],
+            'FloodRisk': ['High Precipitation Totals Or Probability'],
+            'PestOutbreakRisk': [f'Low NDVI ({NdviValue:.2f}) Indicating Stress' if (NdviValue is not None and NdviValue<0.45) else 'Seasonal Baseline'],
+            'DiseaseRisk': ['High Humidity With Moderate Temperatures', f'Soil pH {SoilPh:.1f}' if SoilPh else ''],
+            'HeatStressRisk': ['High Max Temperature Forecast'],
+            'SoilErosionRisk': ['High Rainfall Probability', 'Low Vegetation Cover' if (NdviValue is not None and NdviValue<0.5) else 'Moderate Vegetation'],
+            'NutrientLeachingRisk': ['High Precipitation Totals', 'High Soil Moisture Levels' if (Copernicus and CopernicusSoil.get('Level',100)>60) else 'Moderate Moisture', f'{SoilTexture} Soil Type' if SoilTexture else ''],
+            'ColdStressRisk': ['Low Max Temperature', 'Low Avg Temperature'],
+            'VegetationStressRisk': [f'NDVI {NdviValue:.2f} ({NdviHistory.trend} Trend)' if NdviHistory is not None else 'Low NDVI', 'High ET Rate' if (Copernicus and Copernicus.get('Evapotranspiration',{}).get('Rate',0)>5) else 'Moderate ET']
+        }
+
+        result = {
+            'Status': 'Success',
+            'AgentName': 'ForecastAgent',
+            'Location': Location,
+            'UserQuery': UserQuery,
+            'ForecastHorizonDays': DaysAhead,
+            'OverallRiskLevel': risks['OverallRiskLevel'],
+            'RiskCategories': {
+                'DroughtRisk': {**risks['RiskCategories']['DroughtRisk'], 'Drivers': Drivers['DroughtRisk']},
+                'FloodRisk': {**risks['RiskCategories']['FloodRisk'], 'Drivers': Drivers['FloodRisk']},
+                'PestOutbreakRisk': {**risks['RiskCategories']['PestOutbreakRisk'], 'Drivers': Drivers['PestOutbreakRisk']},
+                'DiseaseRisk': {**risks['RiskCategories']['DiseaseRisk'], 'Drivers': Drivers['DiseaseRisk']},
+                'HeatStressRisk': {**risks['RiskCategories']['HeatStressRisk'], 'Drivers': Drivers['HeatStressRisk']},
+                'SoilErosionRisk': {**risks['RiskCategories']['SoilErosionRisk'], 'Drivers': Drivers['SoilErosionRisk']},
+                'NutrientLeachingRisk': {**risks['RiskCategories']['NutrientLeachingRisk'], 'Drivers': Drivers['NutrientLeachingRisk']},
+                'ColdStressRisk': {**risks['RiskCategories']['ColdStressRisk'], 'Drivers': Drivers['ColdStressRisk']},
+                'VegetationStressRisk': {**risks['RiskCategories']['VegetationStressRisk'], 'Drivers': Drivers['VegetationStressRisk']}
+            },
+            'VegetationIndex': {
+                'NDVI': round(NdviHistory.mean, 3),
+                'ObservedOn': NdviHistory.date,
+                'Trend': NdviHistory.trend,
+                'ChangePer30Days': round(NdviHistory.trend_per_30_days, 3) if NdviHistory.trend_per_30_days is not None else None
+            } if NdviHistory is not None else None,
+            'MonitoringFrequency': 'Weekly' if DaysAhead <= 30 else 'Twice Weekly',
+            'DataSources': [
+                Source.get('DataSource', Default) for Source, Default in (
+                    (Weather, 'Open-Meteo'), (Satellite, 'NASA POWER'),
+                    (Copernicus, 'CopernicusCDS'), (Soil, 'ISRIC SoilGrids')
+                ) if isinstance(Source, dict)
+            ] + (['Sentinel-2 NDVI History'] if NdviHistory is not None else []),
+            'MissingSources': MissingSources,
+            'GeneratedAt': risks.get('Timestamp', '2025-11-17T12:00:00Z')
+        }
+        return result
+    
+    async def GenerateCellForecasts(self, Farms: List[Dict[str, Any]], DaysAhead: int) -> List[Dict[str, Any]]:
+        """
+        Forecast Every Farm In One Grid Cell From A Single Set Of Tool Calls.
+        
+        Farms Are {'Location', 'Lat', 'Lon', 'UserQuery', 'DaysAhead'} Dicts Already
+        Geocoded Into The Same Cell And Horizon Bucket; DaysAhead Is The Longest
+        Horizon Among Them, So Every Farm's Window Is Covered. The Tools Run Once
+        At The First Farm's Coordinates (Concurrent Cells Share Open-Meteo
+        Batches); Each Farm Then Gets Its Own NDVI History Reading And Zone, And
+        All Risks Are Evaluated In One Vectorised Pass.
+        """
+        First = Farms[0]
+        Sources = await self._GatherSources(f"{First['Lat']:.5f},{First['Lon']:.5f}", DaysAhead)
+        History = get_ndvi_history()
+        try:
+            await History.register((Farm['Lat'], Farm['Lon']) for Farm in Farms)
+        except Exception as e:
+            print(f"[ForecastAgent] NDVI History Registration Failed: {e}")
+        Readings: List[Optional[NdviReading]] = []
+        for Farm in Farms:
+            try:
+                Readings.append(History.latest(Farm['Lat'], Farm['Lon']))
+            except Exception as e:
+                print(f"[ForecastAgent] NDVI History Unavailable: {e}")
+                Readings.append(None)
+        Payloads = [Sources[Name] or {} for Name in ('WeatherTool', 'SatelliteTool', 'CopernicusTool', 'SoilTestTool')]
+        Risks = self.ComputeRiskBatch(
+            (*Payloads, Farm['Location'], Reading.mean if Reading is not None else None, (Farm['Lat'], Farm['Lon']))
+            for Farm, Reading in zip(Farms, Readings)
+        )
+        return [
+            self._AssembleForecast(Farm['Location'], Farm.get('UserQuery', ''), Farm.get('DaysAhead', DaysAhead), Sources, Reading, Risk)
+            for Farm, Reading, Risk in zip(Farms, Readings, Risks)
+        ]
+    
+    @staticmethod
+    def _IsProvisional(Sources: Dict[str, Any]) -> bool:
+        """
+        True When A Better Result Is Expected Soon: A Source Is Missing Or Returned
+        Anything But 'Status': 'Success', Or ERA5 Is Still Downloading.
+        """
+        if not all(ForecastAgent._IsUsable(Payload) for Payload in Sources.values()):
+            return True
+        Copernicus = Sources.get('CopernicusTool') or {}
+        if any(Job.get('State') in ('Queued', 'Running') for Job in Copernicus.get('Era5Jobs') or []):
+            return True
+        return Copernicus.get('DataSource') == 'CopernicusFallbackUsingNASAPOWER' and bool(get_settings().copernicus_api_key)
+    
+    @staticmethod
+    def _WithRequestFields(Shared: Dict[str, Any], Location: str, UserQuery: str, DaysAhead: int) -> Dict[str, Any]:
+        """Layer The Per-Request Fields Onto A Cached Forecast."""
+        Result = {
+            'Status': Shared.get('Status'),
+            'AgentName': Shared.get('AgentName'),
+            'Location': Location,
+            'UserQuery': UserQuery,
+            'ForecastHorizonDays': DaysAhead,
+        }
+        Result.update(Shared)
+        Result['MonitoringFrequency'] = 'Weekly' if DaysAhead <= 30 else 'Twice Weekly'
+        return Result
+    
     async def GenerateForecast(
         self,
         Location: str,
@@ -377,60 +392,40 @@ class ForecastAgent:
             CleanLocation = Location
         
         # Always Call Real Tools And Fuse Results
-        try:            
-            Weather = await WeatherTool(CleanLocation, min(max(DaysAhead, 1), 14), None)
-            Satellite = await GetSatelliteData(CleanLocation, min(max(DaysAhead, 1), 30))
-            Copernicus = await CopernicusTool(CleanLocation, min(max(DaysAhead, 1), 30), None)
-            Soil = await SoilTestTool(CleanLocation, None)
-
-            # Extract soil variables for drivers
-            SoilProfile = Soil.get('SoilProfile', {}) if Soil else {}
-            SoilPh = SoilProfile.get('pH', None)
-            SoilTexture = SoilProfile.get('SoilTexture', '')
-            CopernicusSoil = Copernicus.get('SoilMoisture', {}) if Copernicus else {}
-
-            risks = self.ComputeRiskFromSources(Weather or {}, Satellite or {}, Copernicus or {}, Soil or {}, Location)
-
-            # Assemble Drivers
-            Drivers = {
-                'DroughtRisk': ['Low Precipitation Totals', 'High Evapotranspiration' if Copernicus else 'Low Soil Moisture Signal', f'{SoilTexture} Soil Texture' if SoilTexture else ''],
-                'FloodRisk': ['High Precipitation Totals Or Probability'],
-                'PestOutbreakRisk': ['Low NDVI Indicating Stress' if (Copernicus and Copernicus.get('VegetationHealth',{}).get('NDVI',1)<0.45) else 'Seasonal Baseline'],
-                'DiseaseRisk': ['High Humidity With Moderate Temperatures', f'Soil pH {SoilPh:.1f}' if SoilPh else ''],
-                'HeatStressRisk': ['High Max Temperature Forecast'],
-                'SoilErosionRisk': ['High Rainfall Probability', 'Low Vegetation Cover' if (Copernicus and Copernicus.get('VegetationHealth',{}).get('NDVI',1)<0.5) else 'Moderate Vegetation'],
-                'NutrientLeachingRisk': ['High Precipitation Totals', 'High Soil Moisture Levels' if (Copernicus and CopernicusSoil.get('Level',100)>60) else 'Moderate Moisture', f'{SoilTexture} Soil Type' if SoilTexture else ''],
-                'ColdStressRisk': ['Low Max Temperature', 'Low Avg Temperature'],
-                'VegetationStressRisk': ['Low NDVI', 'High ET Rate' if (Copernicus and Copernicus.get('Evapotranspiration',{}).get('Rate',0)>5) else 'Moderate ET']
-            }
-
-            result = {
-                'Status': 'Success',
-                'AgentName': 'ForecastAgent',
-                'Location': Location,
-                'UserQuery': UserQuery,
-                'ForecastHorizonDays': DaysAhead,
-                'OverallRiskLevel': risks['OverallRiskLevel'],
-                'RiskCategories': {
-                    'DroughtRisk': {**risks['RiskCategories']['DroughtRisk'], 'Drivers': Drivers['DroughtRisk']},
-                    'FloodRisk': {**risks['RiskCategories']['FloodRisk'], 'Drivers': Drivers['FloodRisk']},
-                    'PestOutbreakRisk': {**risks['RiskCategories']['PestOutbreakRisk'], 'Drivers': Drivers['PestOutbreakRisk']},
-                    'DiseaseRisk': {**risks['RiskCategories']['DiseaseRisk'], 'Drivers': Drivers['DiseaseRisk']},
-                    'HeatStressRisk': {**risks['RiskCategories']['HeatStressRisk'], 'Drivers': Drivers['HeatStressRisk']},
-                    'SoilErosionRisk': {**risks['RiskCategories']['SoilErosionRisk'], 'Drivers': Drivers['SoilErosionRisk']},
-                    'NutrientLeachingRisk': {**risks['RiskCategories']['NutrientLeachingRisk'], 'Drivers': Drivers['NutrientLeachingRisk']},
-                    'ColdStressRisk': {**risks['RiskCategories']['ColdStressRisk'], 'Drivers': Drivers['ColdStressRisk']},
-                    'VegetationStressRisk': {**risks['RiskCategories']['VegetationStressRisk'], 'Drivers': Drivers['VegetationStressRisk']}
-                },
-                'MonitoringFrequency': 'Weekly' if DaysAhead <= 30 else 'Twice Weekly',
-                'DataSources': [
-                    Weather.get('DataSource', 'Open-Meteo') if isinstance(Weather, dict) else 'WeatherTool',
-                    Satellite.get('DataSource', 'NASA POWER') if isinstance(Satellite, dict) else 'SatelliteTool',
-                    Copernicus.get('DataSource', 'CopernicusCDS') if isinstance(Copernicus, dict) else 'CopernicusTool',
-                    Soil.get('DataSource', 'ISRIC SoilGrids') if isinstance(Soil, dict) else 'SoilTestTool'
-                ],
-                'GeneratedAt': risks.get('Timestamp', '2025-11-17T12:00:00Z')
-            }
+        try:
+            Settings = get_settings()
+            NdviHistory = await self._FetchWithDeadline('NdviHistory', self._ReadNdviHistory(CleanLocation), Settings.forecast_ndvi_history_timeout_seconds)
+            
+            # Farms In The Same Grid Cell, Horizon And Data Epoch Share One Risk Picture;
+            # The Field's Own NDVI Reading Is Part Of The Key Since It Varies Within A Cell
+            Cache, CacheKey, CacheBoundary = get_forecast_cache(), None, 0.0
+            try:
+                Geo = await get_geocoder().geocode(CleanLocation)
+                if not isinstance(Geo, dict):
+                    EmitStage('Geocoded', Location=CleanLocation, Lat=Geo[0], Lon=Geo[1])
+                    Field = (NdviHistory.date, round(NdviHistory.mean, 4)) if NdviHistory is not None else None
+                    CacheKey, CacheBoundary = Cache.key(Geo[0], Geo[1], DaysAhead, field=Field)
+                    Cached = Cache.get(CacheKey)
+                    if Cached is not None:
+                        print(f"[ForecastAgent] Cached Forecast For '{CleanLocation}'")
+                        EmitStage('RisksComputed', OverallRiskLevel=Cached.get('OverallRiskLevel'), Cached=True)
+                        return self._WithRequestFields(Cached, Location, UserQuery, DaysAhead)
+            except Exception as e:
+                print(f"[ForecastAgent] Forecast Cache Unavailable: {e}")
+                CacheKey = None
+            
+            # Fetch All Sources Concurrently, Each Under Its Own Deadline, So Latency
+            # Is The Slowest Source Rather Than The Sum; Late Sources Are Left Out.
+            # Payloads Fetched Earlier In The Same Workflow Are Reused Where Still Valid
+            Sources = await self._GatherSources(CleanLocation, DaysAhead, SessionState.get('Sources'))
+            risks = self.ComputeRiskFromSources(
+                Sources['WeatherTool'] or {}, Sources['SatelliteTool'] or {}, Sources['CopernicusTool'] or {}, Sources['SoilTestTool'] or {},
+                Location, ndvi=NdviHistory.mean if NdviHistory is not None else None
+            )
+            result = self._AssembleForecast(Location, UserQuery, DaysAhead, Sources, NdviHistory, risks)
+            EmitStage('RisksComputed', OverallRiskLevel=result['OverallRiskLevel'], MissingSources=result['MissingSources'], Cached=False)
+            if CacheKey is not None:
+                Cache.put(CacheKey, result, CacheBoundary, provisional=self._IsProvisional(Sources))
             return result
         except Exception as e:
             import traceback
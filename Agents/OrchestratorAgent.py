@@ -5,12 +5,14 @@ from google.adk.agents.llm_agent import Agent
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.agents.callback_context import CallbackContext
 from google.genai import types
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List
 import asyncio
 
 from Agents.ForecastAgent import ForecastAgent
 from Agents.VerifyAgent import VerifyAgent
 from Agents.PlannerAgent import PlannerAgent
+from Agents.WorkflowContext import WorkflowContext, CurrentWorkflow
+from Config.Settings import get_settings
 
 
 class OrchestratorAgent:
@@ -22,7 +24,7 @@ class OrchestratorAgent:
     The Central Intelligence That:
     
     - Routes User Requests To Specialized Agent Teams
-    - Maintains Comprehensive Session State And Execution History
+    - Maintains Per-Workflow Session State And Bounded Execution History
     - Controls Sequential And Parallel Agent Execution Flows
     - Handles Confidence-Based Iteration And Quality Assurance
     - Implements ADK Agent Engine Patterns For Reliable Coordination
@@ -47,11 +49,8 @@ class OrchestratorAgent:
         # Create The Core ADK Orchestrator Agent
         self.Agent = self.CreateAgent()
         
-        # Initialize Session Tracking For Observability And Debugging
-        self.SessionState = {
-            'SessionId': None,
-            'ExecutionHistory': []
-        }
+        # No Per-Request State Lives On The Instance: Each ExecuteWorkflow Call
+        # Builds Its Own WorkflowContext, So One Orchestrator Serves Concurrent Requests
     
     def CreateAgent(self) -> Agent:
         """
@@ -149,8 +148,8 @@ Important Guidelines:
         """
         Pre-Processing Hook Executed Before Each Model Invocation.
         
-        This Callback Manages Session State Initialization And Maintains
-        Observability Logs For Tracking Agent Execution Patterns.
+        This Callback Manages Session State Initialization And Records The
+        Call On The Workflow Running In The Current Task, If Any.
         
         Args:
             CallbackContextInstance: ADK Callback Context For State Management
@@ -162,13 +161,23 @@ Important Guidelines:
             CallbackContextInstance.state['SessionActive'] = True
         
         # Maintain Execution History For Debugging And Analysis
-        if 'Callbacks' not in self.SessionState:
-            self.SessionState['Callbacks'] = []
-        
-        self.SessionState['Callbacks'].append({
-            'Type': 'BeforeModel',
-            'Timestamp': '2025-11-17T12:00:00Z'
-        })
+        Context = CurrentWorkflow.get()
+        if Context is not None:
+            Context.Callbacks.append({
+                'Type': 'BeforeModel',
+                'Timestamp': '2025-11-17T12:00:00Z'
+            })
+    
+    @staticmethod
+    def _PlanInputs(ForecastResults: Dict[str, Any]) -> tuple:
+        """The Forecast Fields PlannerAgent.PreparePlan Reads; For The Same Location, Equal Inputs Give An Equal Plan."""
+        return (ForecastResults.get('UserQuery', ''), ForecastResults.get('RiskCategories', {}))
+    
+    @staticmethod
+    def _CancelPlan(Speculative) -> None:
+        """Cancel A Speculative Plan That Will Not Be Used."""
+        if Speculative is not None and not Speculative[1].done():
+            Speculative[1].cancel()
     
     async def ExecuteWorkflow(
         self,
@@ -179,7 +188,9 @@ Important Guidelines:
         DaysAhead: int = 30,
         ConfidenceThreshold: int = 75,
         MaxIterations: int = 2,
-        TaskId: str | None = None
+        TaskId: str | None = None,
+        SpeculativePlanning: bool | None = None,
+        EventChannel: str | None = None
     ) -> Dict[str, Any]:
         """
         Execute The Complete End-To-End Multi-Agent Agricultural Analysis Workflow.
@@ -187,6 +198,8 @@ Important Guidelines:
         This Is The Core Orchestration Method That Coordinates The Sequential Execution
         Of Forecast, Verification, And Planning Agents. It Implements Confidence-Based
         Iteration For Quality Assurance And Provides Comprehensive Session Tracking.
+        Plan Preparation Overlaps Verification Unless SpeculativePlanning Is False;
+        The Plan Is Only Emailed Once Verification Has Passed.
         
         Args:
             UserQuery: The Farmer's Specific Question Or Request For Analysis
@@ -197,6 +210,8 @@ Important Guidelines:
             ConfidenceThreshold: Minimum Confidence Score Required (0-100)
             MaxIterations: Maximum Number Of Refinement Cycles Allowed
             TaskId: Optional Identifier For Long-Running Task Management
+            SpeculativePlanning: Prepare The Plan While Verification Runs (Default: WORKFLOW_SPECULATIVE_PLANNING)
+            EventChannel: EventBus Channel For Stage Events (Defaults To TaskId; None Publishes Nothing)
             
         Returns:
             Comprehensive Dictionary Containing All Agent Outputs, Execution Metrics,
@@ -209,7 +224,35 @@ Important Guidelines:
         # Initialize Session
         import uuid
         SessionId = str(uuid.uuid4())
-        self.SessionState['SessionId'] = SessionId
+        Context = WorkflowContext(SessionId, MaxHistory=get_settings().workflow_history_limit, EventChannel=EventChannel or TaskId)
+        ContextToken = CurrentWorkflow.set(Context)
+        Context.Emit('Started', SessionId=SessionId, Location=Location, DaysAhead=DaysAhead)
+        try:
+            return await self._RunWorkflow(
+                Context, StartTime, UserQuery, Location, FarmerPhone, FarmerEmail,
+                DaysAhead, ConfidenceThreshold, MaxIterations, TaskId, SpeculativePlanning
+            )
+        finally:
+            CurrentWorkflow.reset(ContextToken)
+    
+    async def _RunWorkflow(
+        self,
+        Context: WorkflowContext,
+        StartTime: float,
+        UserQuery: str,
+        Location: str,
+        FarmerPhone: str | None,
+        FarmerEmail: str,
+        DaysAhead: int,
+        ConfidenceThreshold: int,
+        MaxIterations: int,
+        TaskId: str | None,
+        SpeculativePlanning: bool | None
+    ) -> Dict[str, Any]:
+        """Body Of ExecuteWorkflow, Recording Everything On The Given Context."""
+        
+        import time
+        SessionId = Context.SessionId
         
         # Create Session In SessionManager
         from Utils.SessionManager import GlobalSessionManager
@@ -234,7 +277,7 @@ Important Guidelines:
             
             if RelevantMemories:
                 # Add Historical Context To Session State
-                self.SessionState['HistoricalContext'] = [
+                Context.HistoricalContext = [
                     {
                         'Content': mem.content if hasattr(mem, 'content') else str(mem),
                         'Relevance': 'High'
@@ -243,7 +286,7 @@ Important Guidelines:
                 ]
                 
                 # Log Memory Retrieval
-                self.SessionState['ExecutionHistory'].append({
+                Context.ExecutionHistory.append({
                     'Agent': 'SessionManager',
                     'Status': 'Success',
                     'Action': 'MemoryRecall',
@@ -251,7 +294,7 @@ Important Guidelines:
                 })
         except Exception as MemoryError:
             # Don't Fail If Memory Recall Has Issues
-            self.SessionState['ExecutionHistory'].append({
+            Context.ExecutionHistory.append({
                 'Agent': 'SessionManager',
                 'Status': 'Warning',
                 'Message': f'Memory Recall Error: {str(MemoryError)}'
@@ -266,79 +309,109 @@ Important Guidelines:
             LastVerification = None
             LastForecast = None
             LastAction = None
+            Pipelined = get_settings().workflow_speculative_planning if SpeculativePlanning is None else SpeculativePlanning
+            Speculative = None  # (Plan Inputs, PreparePlan Task) Started Ahead Of Verification
 
-            while True:
-                Iterations += 1
-
-                # Support Pause/Resume Points If Running As Long-Running Task
-                if TaskId:
-                    await TaskMgr.wait_if_paused(TaskId)
-
-                # Step 1: Forecast Agent
-                ForecastStartTime = time.time()
-                with record_agent_duration("ForecastAgent"), use_span("Orchestrator.Forecast"):
-                    ForecastResults = await self.ForecastAgentInstance.GenerateForecast(
-                        Location=Location,
-                        DaysAhead=DaysAhead,
-                        UserQuery=UserQuery,
-                        SessionState=self.SessionState
-                    )
-                ForecastDuration = time.time() - ForecastStartTime
-                LastForecast = ForecastResults
-                self.SessionState['ExecutionHistory'].append({
-                    'Agent': 'ForecastAgent', 'Status': ForecastResults.get('Status', 'Unknown'), 'Duration': ForecastDuration,
-                    'HorizonDays': DaysAhead
-                })
+            try:
+                while True:
+                    Iterations += 1
 
-                if TaskId:
-                    await TaskMgr.wait_if_paused(TaskId)
+                    # Support Pause/Resume Points If Running As Long-Running Task
+                    if TaskId:
+                        await TaskMgr.wait_if_paused(TaskId)
 
-                # Step 2: Verify Agent
-                VerifyStartTime = time.time()
-                with record_agent_duration("VerifyAgent"), use_span("Orchestrator.Verify"):
-                    VerificationResults = await self.VerifyAgentInstance.VerifyForecast(
-                        ForecastData=ForecastResults,
-                        Location=Location,
-                        SessionState=self.SessionState
-                    )
-                VerifyDuration = time.time() - VerifyStartTime
-                LastVerification = VerificationResults
-                self.SessionState['ExecutionHistory'].append({
-                    'Agent': 'VerifyAgent', 'Status': VerificationResults.get('Status', 'Unknown'), 'Duration': VerifyDuration,
-                    'Confidence': VerificationResults.get('Confidence')
-                })
+                    # Step 1: Forecast Agent
+                    ForecastStartTime = time.time()
+                    with record_agent_duration("ForecastAgent"), use_span("Orchestrator.Forecast"):
+                        ForecastResults = await self.ForecastAgentInstance.GenerateForecast(
+                            Location=Location,
+                            DaysAhead=DaysAhead,
+                            UserQuery=UserQuery,
+                            SessionState=Context
+                        )
+                    ForecastDuration = time.time() - ForecastStartTime
+                    LastForecast = ForecastResults
+                    Context.ExecutionHistory.append({
+                        'Agent': 'ForecastAgent', 'Status': ForecastResults.get('Status', 'Unknown'), 'Duration': ForecastDuration,
+                        'HorizonDays': DaysAhead
+                    })
 
-                # Decide loop Break/Continue
-                if (VerificationResults.get('Confidence', 0) >= ConfidenceThreshold) or (Iterations >= MaxIterations):
-                    # Step 3: Planner Agent
                     if TaskId:
                         await TaskMgr.wait_if_paused(TaskId)
-                    # Compact Session Context Before LLM-Heavy Planning
-                    from Utils.SessionManager import GlobalSessionManager
-                    self.SessionState['CompactContext'] = await GlobalSessionManager.CompactContext(SessionId, max_tokens=1500)
-                    PlannerStartTime = time.time()
-                    with record_agent_duration("PlannerAgent"), use_span("Orchestrator.Plan"):
-                        ActionPlanResults = await self.PlannerAgentInstance.GeneratePlan(
+
+                    # Speculative Planning: The Plan Only Depends On The Forecast, So Prepare It
+                    # While Verification Runs. A Plan Started For An Earlier Iteration Is Kept If
+                    # The Refined Forecast Left Its Inputs Unchanged, Otherwise It Is Cancelled
+                    if Pipelined:
+                        PlanKey = self._PlanInputs(ForecastResults)
+                        if Speculative is None or Speculative[0] != PlanKey:
+                            self._CancelPlan(Speculative)
+                            Speculative = (PlanKey, asyncio.create_task(self.PlannerAgentInstance.PreparePlan(
+                                ForecastData=ForecastResults,
+                                Location=Location,
+                                SessionState=Context
+                            )))
+
+                    # Step 2: Verify Agent
+                    VerifyStartTime = time.time()
+                    with record_agent_duration("VerifyAgent"), use_span("Orchestrator.Verify"):
+                        VerificationResults = await self.VerifyAgentInstance.VerifyForecast(
                             ForecastData=ForecastResults,
-                            VerificationData=VerificationResults,
-                            FarmerPhone=FarmerPhone,
-                            FarmerEmail=FarmerEmail,
                             Location=Location,
-                            SessionState=self.SessionState
+                            SessionState=Context
                         )
-                    PlannerDuration = time.time() - PlannerStartTime
-                    LastAction = ActionPlanResults
-                    self.SessionState['ExecutionHistory'].append({
-                        'Agent': 'PlannerAgent', 'Status': ActionPlanResults.get('Status', 'Unknown'), 'Duration': PlannerDuration
-                    })
-                    break
-                else:
-                    # Refine Inputs: Increase Forecast Horizon To Gain Stability
-                    DaysAhead = min(DaysAhead + 7, 60)
-                    self.SessionState['ExecutionHistory'].append({
-                        'Agent': 'Orchestrator', 'Status': 'Refine', 'Reason': 'LowConfidence',
-                        'NewHorizonDays': DaysAhead
+                    VerifyDuration = time.time() - VerifyStartTime
+                    Context.Emit('Verified', Iteration=Iterations, Confidence=VerificationResults.get('Confidence'))
+                    LastVerification = VerificationResults
+                    Context.ExecutionHistory.append({
+                        'Agent': 'VerifyAgent', 'Status': VerificationResults.get('Status', 'Unknown'), 'Duration': VerifyDuration,
+                        'Confidence': VerificationResults.get('Confidence')
                     })
+
+                    # Decide loop Break/Continue
+                    if (VerificationResults.get('Confidence', 0) >= ConfidenceThreshold) or (Iterations >= MaxIterations):
+                        # Step 3: Planner Agent
+                        if TaskId:
+                            await TaskMgr.wait_if_paused(TaskId)
+                        # Compact Session Context Before LLM-Heavy Planning
+                        from Utils.SessionManager import GlobalSessionManager
+                        Context.CompactContext = await GlobalSessionManager.CompactContext(SessionId, max_tokens=1500)
+                        PlannerStartTime = time.time()
+                        with record_agent_duration("PlannerAgent"), use_span("Orchestrator.Plan"):
+                            if Speculative is not None:
+                                PreparedPlan = await Speculative[1]
+                                Speculative = None
+                            else:
+                                PreparedPlan = await self.PlannerAgentInstance.PreparePlan(
+                                    ForecastData=ForecastResults,
+                                    Location=Location,
+                                    SessionState=Context
+                                )
+                            Context.Emit('PlanReady', Plan=PreparedPlan)
+                            # Email Goes Out Only Now That Verification Has Settled
+                            Context.Emit('EmailQueued', HasRecipient=bool(FarmerEmail and FarmerEmail.strip()))
+                            ActionPlanResults = await self.PlannerAgentInstance.DeliverPlan(
+                                PreparedPlan, Location=Location, FarmerEmail=FarmerEmail
+                            )
+                            Context.Emit('EmailSent', Status=ActionPlanResults.get('EmailDeliveryStatus', {}).get('Status'))
+                        PlannerDuration = time.time() - PlannerStartTime
+                        LastAction = ActionPlanResults
+                        Context.ExecutionHistory.append({
+                            'Agent': 'PlannerAgent', 'Status': ActionPlanResults.get('Status', 'Unknown'), 'Duration': PlannerDuration,
+                            'Speculative': Pipelined
+                        })
+                        break
+                    else:
+                        # Refine Inputs: Increase Forecast Horizon To Gain Stability. Tool Payloads
+                        # Kept On The Context Are Reused, So Only Sources Whose Window Grows Refetch
+                        DaysAhead = min(DaysAhead + 7, 60)
+                        Context.Emit('Refining', Reason='LowConfidence', NewHorizonDays=DaysAhead)
+                        Context.ExecutionHistory.append({
+                            'Agent': 'Orchestrator', 'Status': 'Refine', 'Reason': 'LowConfidence',
+                            'NewHorizonDays': DaysAhead
+                        })
+            finally:
+                self._CancelPlan(Speculative)
             
             # Calculate Total Execution Time
             TotalDuration = time.time() - StartTime
@@ -380,7 +453,7 @@ Important Guidelines:
                     
             except Exception as MemoryError:
                 # Don't Fail The Whole Workflow If Memory Storage Fails
-                self.SessionState['ExecutionHistory'].append({
+                Context.ExecutionHistory.append({
                     'Agent': 'SessionManager',
                     'Status': 'Warning',
                     'Message': f'Memory Storage Error: {str(MemoryError)}'
@@ -397,7 +470,7 @@ Important Guidelines:
                 'ActionPlan': LastAction,
                 'ExecutionSummary': {
                     'TotalDuration': round(TotalDuration, 3),
-                    'AgentExecutions': self.SessionState['ExecutionHistory'],
+                    'AgentExecutions': Context.History(),
                     'Iterations': Iterations,
                     'ConfidenceThreshold': ConfidenceThreshold
                 },
@@ -410,5 +483,139 @@ Important Guidelines:
                 'Status': 'Error',
                 'SessionId': SessionId,
                 'Message': f'Orchestration Failed: {str(Error)}',
-                'ExecutionHistory': self.SessionState['ExecutionHistory']
-            }
\ No newline at end of file
+                'ExecutionHistory': Context.History()
+            }
+
+    async def ExecuteBatch(
+        self,
+        Farms: List[Dict[str, Any]],
+        IncludePlans: bool = True,
+        Concurrency: int | None = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Forecast Many Farms, Paying Once Per Grid Cell Instead Of Once Per Farm.
+        
+        Farms Are Geocoded, Grouped By Forecast-Cache Cell And Horizon Bucket, And
+        Each Cell Runs ForecastAgent.GenerateCellForecasts (One Set Of Tool Calls
+        For All Its Farms) And One Verification. Plans Are Prepared Once Per
+        Location And Distinct Set Of Plan Inputs Within A Cell, And Emailed Only
+        To Farms That Gave An Address.
+        Results Are Yielded As Each Cell Finishes, One Line Per Farm, Followed By
+        A Summary Line; Closing The Generator Cancels Cells Still In Flight.
+        
+        Args:
+            Farms: Dicts With Line, FarmId, Location And/Or Lat+Lon, DaysAhead, UserQuery, FarmerEmail
+            IncludePlans: Attach An Action Plan To Every Farm
+            Concurrency: Cells, Geocoding Lookups And Planner Calls In Flight (Default: FORECAST_BATCH_CONCURRENCY)
+        """
+        import time
+        from Services.ForecastCache import get_forecast_cache, horizon_bucket
+        from Services.Geocoder import get_geocoder, parse_coordinates
+        
+        StartTime = time.time()
+        Width = max(1, Concurrency or get_settings().forecast_batch_concurrency)
+        Limit = asyncio.Semaphore(Width)
+        PlanLimit = asyncio.Semaphore(Width)  # LLM, Search And Email Calls Made After A Cell Releases Limit
+        Cache = get_forecast_cache()
+        
+        def FarmLine(Farm: Dict[str, Any], **Fields: Any) -> Dict[str, Any]:
+            return {'Line': Farm.get('Line'), 'FarmId': Farm.get('FarmId'), 'Location': Farm.get('Location'), **Fields}
+        
+        Lookups: Dict[str, asyncio.Task] = {}
+        
+        async def Geocode(Location: str) -> Any:
+            async with Limit:
+                Clean = await self.ForecastAgentInstance.ExtractCleanLocation(Location)
+                return await get_geocoder().geocode(Clean)
+        
+        async def Locate(Farm: Dict[str, Any]) -> Dict[str, Any]:
+            if Farm.get('Lat') is not None and Farm.get('Lon') is not None:
+                return Farm
+            Point = parse_coordinates(Farm['Location'])
+            if Point is not None:
+                return {**Farm, 'Lat': Point[0], 'Lon': Point[1]}
+            # A Cooperative's Farms Often Share A Village Name: Look Each One Up Once
+            Key = ' '.join(Farm['Location'].lower().split())
+            if Key not in Lookups:
+                Lookups[Key] = asyncio.ensure_future(Geocode(Farm['Location']))
+            try:
+                Geo = await Lookups[Key]
+            except Exception as Error:
+                Geo = {'Message': f'Geocoding Failed: {Error}'}
+            if isinstance(Geo, dict):
+                return {**Farm, 'Error': Geo.get('Message', 'Geocoding Failed')}
+            return {**Farm, 'Lat': Geo[0], 'Lon': Geo[1]}
+        
+        Cells: Dict[tuple, List[Dict[str, Any]]] = {}
+        Failed = 0
+        for Farm in await asyncio.gather(*(Locate(Farm) for Farm in Farms)):
+            if 'Error' in Farm:
+                Failed += 1
+                yield FarmLine(Farm, Status='Error', Message=Farm['Error'])
+                continue
+            if not Farm.get('Location'):
+                Farm['Location'] = f"{Farm['Lat']},{Farm['Lon']}"
+            Cells.setdefault((Cache.cell(Farm['Lat'], Farm['Lon']), horizon_bucket(Farm['DaysAhead'])), []).append(Farm)
+        
+        Plans: Dict[str, asyncio.Task] = {}
+        
+        def SharedPlan(Cell: tuple, Location: str, Forecast: Dict[str, Any]) -> asyncio.Task:
+            # PreparePlan Also Writes The Location Into Its Prompts, Searches And Result, So
+            # Only Farms Of One Cell And Place Whose Forecasts Give The Same Plan Inputs Share A Call
+            import json
+            Key = json.dumps([Cell, ' '.join(Location.lower().split()), self._PlanInputs(Forecast)], sort_keys=True, default=str)
+            if Key not in Plans:
+                Plans[Key] = asyncio.create_task(Prepare(Forecast, Location))
+            return Plans[Key]
+        
+        async def Prepare(Forecast: Dict[str, Any], Location: str) -> Dict[str, Any]:
+            async with PlanLimit:
+                return await self.PlannerAgentInstance.PreparePlan(ForecastData=Forecast, Location=Location)
+        
+        async def RunCell(Cell: tuple, Members: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with Limit:
+                try:
+                    # Fetch For The Longest Horizon In The Bucket, So Every Farm's Window Is Covered
+                    Horizon = max(Member['DaysAhead'] for Member in Members)
+                    Forecasts = await self.ForecastAgentInstance.GenerateCellForecasts(Members, Horizon)
+                    Verification = await self.VerifyAgentInstance.VerifyForecast(
+                        ForecastData=Forecasts[0], Location=Members[0]['Location']
+                    )
+                except Exception as Error:
+                    return [FarmLine(Farm, Status='Error', Message=f'Cell Forecast Failed: {Error}') for Farm in Members]
+            Summary = {'Status': Verification.get('Status'), 'Confidence': Verification.get('Confidence'), 'SharedWithFarms': len(Members)}
+            Lines = []
+            for Farm, Forecast in zip(Members, Forecasts):
+                Line = FarmLine(Farm, Status=Forecast.get('Status', 'Success'), Coordinates=[Farm['Lat'], Farm['Lon']],
+                                Cell=list(Cell[0]), ForecastResults=Forecast, VerificationResults=Summary)
+                if IncludePlans:
+                    try:
+                        Plan = await SharedPlan(Cell, Farm['Location'], Forecast)
+                        if Farm.get('FarmerEmail'):
+                            async with PlanLimit:
+                                Plan = await self.PlannerAgentInstance.DeliverPlan(Plan, Location=Farm['Location'], FarmerEmail=Farm['FarmerEmail'])
+                        Line['ActionPlan'] = Plan
+                    except Exception as Error:
+                        Line['ActionPlan'] = {'Status': 'Error', 'Message': f'Planning Failed: {Error}'}
+                Lines.append(Line)
+            return Lines
+        
+        Pending = [asyncio.create_task(RunCell(Cell, Members)) for Cell, Members in Cells.items()]
+        try:
+            for Next in asyncio.as_completed(Pending):
+                for Line in await Next:
+                    Failed += Line['Status'] == 'Error'
+                    yield Line
+        finally:
+            for Task in (*Pending, *Plans.values()):
+                if not Task.done():
+                    Task.cancel()
+        
+        yield {
+            'Status': 'Summary',
+            'Farms': len(Farms),
+            'Failed': Failed,
+            'Cells': len(Cells),
+            'Plans': len(Plans),
+            'Duration': round(time.time() - StartTime, 3)
+        }
@@ -177,6 +177,10 @@ Important Guidelines:
         To Provide Context-Aware Responses To Specific Farmer Questions While Incorporating
         Real-Time Risk Data From Multiple Sources.
         
+        Runs PreparePlan Then DeliverPlan. Nothing Here Depends On VerificationData,
+        So The Orchestrator Can Call PreparePlan As Soon As The Forecast Is Ready
+        And Only Hold Email Delivery Back Until Verification Has Passed.
+        
         Args:
             ForecastData: Risk Assessment Output From ForecastAgent Including
                          RiskCategories, DataSources, And UserQuery Information.
@@ -201,6 +205,29 @@ Important Guidelines:
                 - GeneratedAt: Timestamp Of Plan Generation
         """
         
+        Plan = await self.PreparePlan(ForecastData, Location, SessionState)
+        return await self.DeliverPlan(Plan, Location, FarmerEmail)
+    
+    async def PreparePlan(
+        self,
+        ForecastData: Dict[str, Any],
+        Location: str,
+        SessionState: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Build The Prioritized Action Plan From The Forecast Alone, Without Sending It.
+        
+        Covers The User-Query Analysis And Answer, Per-Risk Action Text And The
+        Advisory-Office Search. Reads ForecastData['UserQuery'],
+        ForecastData['RiskCategories'] And Location (Prompts, Price And Advisory
+        Searches, And The Result's 'Location'), So A Plan Prepared For One
+        Forecast Stays Valid For Any Forecast Of The Same Location With The Same
+        Two Fields.
+        
+        Returns:
+            The GeneratePlan Result Without 'EmailDeliveryStatus'
+        """
+        
         if SessionState is None:
             SessionState = {}
         
@@ -267,6 +294,7 @@ Important Guidelines:
                 from google import genai
                 from google.genai import types
                 from Tools.GoogleSearchTool import GoogleSearchTool
+                from Utils.Observability import inc_tool
                 import re
                 settings = get_settings()
                 api_key = settings.google_api_key
@@ -526,6 +554,30 @@ Use bullet points, **bold text** for emphasis, and clear structure for better re
         except Exception:
             pass
 
+        return {
+            'Status': 'Success',
+            'AgentName': 'PlannerAgent',
+            'Location': Location,
+            'P1': P1Actions,
+            'P2': P2Actions,
+            'P3': P3Actions,
+            'AdvisoryResources': advisory_links if 'advisory_links' in locals() else [],
+            'UserQuestion': user_query,
+            'ImmediateAction': immediate_action,
+            'ThisWeekAction': this_week_action,
+            'UserQueryResponse': user_question_response,
+            'GeneratedAt': '2025-11-18T00:00:00Z'
+        }
+    
+    async def DeliverPlan(self, Plan: Dict[str, Any], Location: str, FarmerEmail: str = "") -> Dict[str, Any]:
+        """
+        Email A Prepared Plan To The Farmer.
+        
+        Returns:
+            The Plan With 'EmailDeliveryStatus' Added
+        """
+        P1Actions, P2Actions, P3Actions = Plan.get('P1', []), Plan.get('P2', []), Plan.get('P3', [])
+        
         # Send Email Notification
         email_status = {'Status': 'Skipped', 'Reason': 'No Email Provided'}
         try:
@@ -568,21 +620,7 @@ AgriSense Guardian Team
         except Exception as e:
             email_status = {'Status': 'Error', 'Message': f'Email Exception: {str(e)}'}
 
-        return {
-            'Status': 'Success',
-            'AgentName': 'PlannerAgent',
-            'Location': Location,
-            'P1': P1Actions,
-            'P2': P2Actions,
-            'P3': P3Actions,
-            'AdvisoryResources': advisory_links if 'advisory_links' in locals() else [],
-            'EmailDeliveryStatus': email_status,
-            'UserQuestion': user_query,
-            'ImmediateAction': immediate_action,
-            'ThisWeekAction': this_week_action,
-            'UserQueryResponse': user_question_response,
-            'GeneratedAt': '2025-11-18T00:00:00Z'
-        }
+        return {**Plan, 'EmailDeliveryStatus': email_status}
     
     async def _generate_dynamic_action_description(self, risk_name: str, level: str, drivers: list, location: str) -> str:
         """Generate User-Friendly, Dynamic Action Descriptions Using LLM With Safe Fallback."""
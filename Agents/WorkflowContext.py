@@ -0,0 +1,80 @@
+# AgriSenseGuardian Workflow Context - Per-Invocation State For Orchestrated Workflows
+# Each ExecuteWorkflow Call Owns One Context, So Concurrent Workflows Never Share History
+
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+
+class WorkflowContext:
+    """
+    State Of A Single Orchestrator Workflow Invocation.
+
+    Created Fresh For Every ExecuteWorkflow Call And Handed To The Sub-Agents
+    In Place Of A Shared SessionState Dictionary. History Lists Are Bounded
+    Deques, So A Runaway Refinement Loop Or Chatty Model Callbacks Cannot Grow
+    Memory Without Limit, And __slots__ Keeps Each Context Small Enough To Run
+    Hundreds Concurrently.
+
+    Read Access Also Works Mapping-Style (Context['SessionId'], Context.get(...))
+    For Code Written Against The Old SessionState Dictionary.
+    """
+
+    __slots__ = ('SessionId', 'ExecutionHistory', 'Callbacks', 'HistoricalContext', 'CompactContext', 'Sources', 'EventChannel')
+
+    def __init__(self, SessionId: str, MaxHistory: int = 64, EventChannel: Optional[str] = None):
+        """
+        Initialize An Empty Context.
+
+        Args:
+            SessionId: Session Identifier Registered With The SessionManager
+            MaxHistory: Entries Kept In ExecutionHistory And Callbacks (Oldest Dropped First)
+            EventChannel: EventBus Channel That Receives Progress Events (None: No Events)
+        """
+        self.SessionId = SessionId
+        self.ExecutionHistory: Deque[Dict[str, Any]] = deque(maxlen=max(1, MaxHistory))
+        self.Callbacks: Deque[Dict[str, Any]] = deque(maxlen=max(1, MaxHistory))
+        self.HistoricalContext: List[Dict[str, Any]] = []
+        self.CompactContext: Optional[Dict[str, Any]] = None
+        # Tool Payloads Fetched By ForecastAgent, Reused When A Refinement Pass Reruns It
+        self.Sources: Dict[str, Dict[str, Any]] = {}
+        self.EventChannel = EventChannel
+
+    def Emit(self, Stage: str, **Data: Any) -> None:
+        """Publish A Progress Event To This Workflow's Channel, If It Has One."""
+        if self.EventChannel:
+            from Services.EventBus import get_event_bus
+            get_event_bus().publish(self.EventChannel, Stage, Data)
+
+    def History(self) -> List[Dict[str, Any]]:
+        """Execution History As A Plain List (For JSON Responses)."""
+        return list(self.ExecutionHistory)
+
+    def get(self, Key: str, Default: Any = None) -> Any:
+        return getattr(self, Key, Default) if Key in self.__slots__ else Default
+
+    def __getitem__(self, Key: str) -> Any:
+        if Key not in self.__slots__:
+            raise KeyError(Key)
+        return getattr(self, Key)
+
+    def __contains__(self, Key: object) -> bool:
+        return Key in self.__slots__
+
+
+# Workflow Running In The Current Task; Lets ADK Callbacks Find Their Own Context
+CurrentWorkflow: ContextVar[Optional[WorkflowContext]] = ContextVar('CurrentWorkflow', default=None)
+
+
+def EmitStage(Stage: str, **Data: Any) -> None:
+    """Publish A Progress Event For The Workflow Running In The Current Task (No-Op Outside One)."""
+    Context = CurrentWorkflow.get()
+    if Context is not None:
+        Context.Emit(Stage, **Data)
+
+
+__all__ = [
+    'WorkflowContext',
+    'CurrentWorkflow',
+    'EmitStage',
+]
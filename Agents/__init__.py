@@ -5,6 +5,7 @@ from Agents.ForecastAgent import ForecastAgent, RootAgent as ForecastRootAgent
 from Agents.VerifyAgent import VerifyAgent, RootAgent as VerifyRootAgent
 from Agents.PlannerAgent import PlannerAgent, RootAgent as PlannerRootAgent
 from Agents.OrchestratorAgent import OrchestratorAgent
+from Agents.WorkflowContext import WorkflowContext
 
 __all__ = [
     'ForecastAgent',
@@ -13,5 +14,6 @@ __all__ = [
     'VerifyRootAgent',
     'PlannerAgent',
     'PlannerRootAgent',
-    'OrchestratorAgent'
+    'OrchestratorAgent',
+    'WorkflowContext'
 ]
\ No newline at end of file
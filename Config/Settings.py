@@ -80,6 +80,98 @@ class Settings(BaseSettings):
     sender_email: Optional[str] = Field(default=None, env="SENDER_EMAIL")
     sender_name: Optional[str] = Field(default="AgriSenseGuardian", env="SENDER_NAME")
 
+    # Local Caches (Shared By All Tools And Agent Processes)
+    cache_dir: str = Field(default=str(Path(__file__).resolve().parent.parent / "Data" / "Cache"), env="CACHE_DIR")
+
+    # Geocoding
+    geocode_cache_size: int = Field(default=4096, env="GEOCODE_CACHE_SIZE")
+    geocode_ttl_seconds: int = Field(default=30 * 24 * 3600, env="GEOCODE_TTL_SECONDS")
+    geocode_negative_ttl_seconds: int = Field(default=6 * 3600, env="GEOCODE_NEGATIVE_TTL_SECONDS")
+    geocode_approximate_ttl_seconds: int = Field(default=3600, env="GEOCODE_APPROXIMATE_TTL_SECONDS")
+    gazetteer_path: Optional[str] = Field(default=str(Path(__file__).resolve().parent.parent / "Data" / "Gazetteer" / "India.gaz"), env="GAZETTEER_PATH")
+
+    # NASA POWER (Local Grid-Cell Store Under <cache_dir>/NasaPower)
+    nasa_power_refresh_seconds: int = Field(default=6 * 3600, env="NASA_POWER_REFRESH_SECONDS")
+    nasa_power_daily_window_days: int = Field(default=30, env="NASA_POWER_DAILY_WINDOW_DAYS")
+
+    # Weather Forecast Cache (Entries Expire When The Next Model Run Is Published)
+    weather_cache_size: int = Field(default=4096, env="WEATHER_CACHE_SIZE")
+    weather_cache_decimals: int = Field(default=2, env="WEATHER_CACHE_DECIMALS")
+    weather_model_run_hours: str = Field(default="0,6,12,18", env="WEATHER_MODEL_RUN_HOURS")
+    weather_model_publish_delay_minutes: int = Field(default=240, env="WEATHER_MODEL_PUBLISH_DELAY_MINUTES")
+    weather_cache_max_stale_seconds: int = Field(default=6 * 3600, env="WEATHER_CACHE_MAX_STALE_SECONDS")
+
+    # Open-Meteo Micro-Batching (Points Requested Within The Window Share One Call)
+    open_meteo_batch_window_ms: int = Field(default=20, env="OPEN_METEO_BATCH_WINDOW_MS")
+    open_meteo_batch_size: int = Field(default=50, env="OPEN_METEO_BATCH_SIZE")
+
+    # Copernicus ERA5 Background Jobs (Downloads Cached Under <cache_dir>/Era5)
+    era5_max_concurrent_jobs: int = Field(default=2, env="ERA5_MAX_CONCURRENT_JOBS")
+    era5_retry_seconds: int = Field(default=900, env="ERA5_RETRY_SECONDS")
+    era5_stats_workers: int = Field(default=2, env="ERA5_STATS_WORKERS")
+    era5_job_retention_hours: float = Field(default=168.0, env="ERA5_JOB_RETENTION_HOURS")
+    era5_data_retention_days: int = Field(default=90, env="ERA5_DATA_RETENTION_DAYS")
+    era5_fallback_max_age_days: int = Field(default=14, env="ERA5_FALLBACK_MAX_AGE_DAYS")
+
+    # Regional ERA5-Land Pre-Fetch (Whole States Downloaded Daily, Farms Served By Point Extraction)
+    era5_prefetch_enabled: bool = Field(default=False, env="ERA5_PREFETCH_ENABLED")
+    era5_prefetch_regions: str = Field(default="", env="ERA5_PREFETCH_REGIONS")
+    era5_prefetch_days: int = Field(default=30, env="ERA5_PREFETCH_DAYS")
+    era5_prefetch_interval_hours: float = Field(default=24.0, env="ERA5_PREFETCH_INTERVAL_HOURS")
+
+    # Sentinel Hub NDVI Cache (Entries Live For One Sentinel-2 Revisit Window)
+    sentinel_ndvi_cache_size: int = Field(default=2048, env="SENTINEL_NDVI_CACHE_SIZE")
+    sentinel_revisit_days: int = Field(default=5, env="SENTINEL_REVISIT_DAYS")
+    sentinel_ndvi_mode: str = Field(default="statistics", env="SENTINEL_NDVI_MODE")  # statistics | process
+
+    # Per-Field NDVI History (Arrays Under <cache_dir>/NdviHistory, Filled By A Scheduled Ingest)
+    ndvi_ingest_enabled: bool = Field(default=False, env="NDVI_INGEST_ENABLED")
+    ndvi_ingest_interval_hours: float = Field(default=24.0, env="NDVI_INGEST_INTERVAL_HOURS")
+    ndvi_backfill_days: int = Field(default=60, env="NDVI_BACKFILL_DAYS")
+    ndvi_max_age_days: int = Field(default=30, env="NDVI_MAX_AGE_DAYS")
+    ndvi_field_hectares: float = Field(default=1.0, env="NDVI_FIELD_HECTARES")
+    ndvi_max_fields: int = Field(default=1000, env="NDVI_MAX_FIELDS")
+    ndvi_field_expiry_days: int = Field(default=30, env="NDVI_FIELD_EXPIRY_DAYS")
+
+    # Risk Rule Table (Thresholds And Regional Overrides, Reloaded When The File Changes)
+    risk_rules_path: str = Field(default=str(Path(__file__).resolve().parent / "RiskRules.json"), env="RISK_RULES_PATH")
+    risk_rules_check_seconds: float = Field(default=5.0, env="RISK_RULES_CHECK_SECONDS")
+
+    # Orchestrator Workflows (Each Request Keeps Its Own Bounded History)
+    workflow_history_limit: int = Field(default=64, env="WORKFLOW_HISTORY_LIMIT")
+    workflow_speculative_planning: bool = Field(default=True, env="WORKFLOW_SPECULATIVE_PLANNING")
+
+    # Progress Events (Server-Sent Events For /forecast/stream And /tasks/{id}/events)
+    event_history_size: int = Field(default=256, env="EVENT_HISTORY_SIZE")
+    event_retention_seconds: int = Field(default=600, env="EVENT_RETENTION_SECONDS")
+    event_keepalive_seconds: float = Field(default=15.0, env="EVENT_KEEPALIVE_SECONDS")
+
+    # Forecast Result Cache (Shared Per Grid Cell Until An Upstream Source Publishes New Data)
+    forecast_cache_size: int = Field(default=2048, env="FORECAST_CACHE_SIZE")
+    forecast_cache_cell_degrees: float = Field(default=0.1, env="FORECAST_CACHE_CELL_DEGREES")
+    forecast_cache_ttl_seconds: int = Field(default=3 * 3600, env="FORECAST_CACHE_TTL_SECONDS")
+    forecast_cache_provisional_seconds: int = Field(default=300, env="FORECAST_CACHE_PROVISIONAL_SECONDS")
+
+    # Forecast Source Deadlines (Seconds; Sources Are Fetched Concurrently And Late Ones Are Left Out)
+    forecast_weather_timeout_seconds: float = Field(default=10.0, env="FORECAST_WEATHER_TIMEOUT_SECONDS")
+    forecast_satellite_timeout_seconds: float = Field(default=20.0, env="FORECAST_SATELLITE_TIMEOUT_SECONDS")
+    forecast_copernicus_timeout_seconds: float = Field(default=15.0, env="FORECAST_COPERNICUS_TIMEOUT_SECONDS")
+    forecast_soil_timeout_seconds: float = Field(default=15.0, env="FORECAST_SOIL_TIMEOUT_SECONDS")
+    forecast_ndvi_history_timeout_seconds: float = Field(default=5.0, env="FORECAST_NDVI_HISTORY_TIMEOUT_SECONDS")
+
+    # Bulk Forecasts (/forecast/batch: Farms Per Request And Grid Cells Forecast At Once)
+    forecast_batch_max_farms: int = Field(default=5000, env="FORECAST_BATCH_MAX_FARMS")
+    forecast_batch_max_bytes: int = Field(default=8 * 1024 * 1024, env="FORECAST_BATCH_MAX_BYTES")
+    forecast_batch_concurrency: int = Field(default=8, env="FORECAST_BATCH_CONCURRENCY")
+
+    # Outbound HTTP Connection Pool
+    http_pool_size: int = Field(default=100, env="HTTP_POOL_SIZE")
+    http_pool_per_host: int = Field(default=16, env="HTTP_POOL_PER_HOST")
+    http_dns_ttl_seconds: int = Field(default=300, env="HTTP_DNS_TTL_SECONDS")
+    http_keepalive_seconds: float = Field(default=30.0, env="HTTP_KEEPALIVE_SECONDS")
+    http_timeout_seconds: float = Field(default=30.0, env="HTTP_TIMEOUT_SECONDS")
+    http_connect_timeout_seconds: float = Field(default=10.0, env="HTTP_CONNECT_TIMEOUT_SECONDS")
+
     model_config = SettingsConfigDict(
         env_file=os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env")) if os.path.exists(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env"))) else None,
         env_file_encoding='utf-8',
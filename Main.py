@@ -22,8 +22,12 @@ The System Integrates Real-World Data From Weather APIs, Satellite Imagery,
 And Climate Models To Deliver Accurate, Localized Agricultural Insights.
 """
 
+import csv
+import io
+import json
 import os
 import sys
+import uuid
 import asyncio
 import logging
 from pathlib import Path
@@ -36,14 +40,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, HTMLResponse, Response
+from fastapi.responses import JSONResponse, HTMLResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, Field, EmailStr, ValidationError, field_validator, model_validator
 
 # Internal Module Imports For Core Functionality
 from Config.Settings import get_settings
 from Services.AgentBootstrap import AgentBootstrap
 from Services.HealthService import HealthService
+from Services.Era5Jobs import get_era5_jobs
+from Services.Era5Regions import get_era5_regions
+from Services.Era5Stats import shutdown_process_pool
+from Services.EventBus import format_sse, get_event_bus
+from Services.HttpClient import get_http_client
+from Services.NdviHistory import get_ndvi_history
 from Agents.OrchestratorAgent import OrchestratorAgent
 from Utils.Logger import SetupLogger as GetLogger
 from Services.TaskManager import get_task_manager
@@ -57,6 +67,9 @@ Logger = GetLogger(__name__)
 AgentBootstrapInstance = None
 OrchestratorInstance = None
 HealthServiceInstance = None
+Era5PrefetchTask = None
+NdviIngestTask = None
+StreamTasks: set = set()  # Workflows Behind /forecast/stream, Referenced Until They Finish
 
 # ===== REQUEST/RESPONSE MODELS =====
 
@@ -129,6 +142,44 @@ class TaskStartRequest(LongForecastRequest):
     pass
 
 
+class BatchFarm(BaseModel):
+    """One Farm Row Of A /forecast/batch Upload (A CSV Row Or A JSON Line).
+
+    A Farm Needs Either A Location Or Lat+Lon; Rows Without A FarmerEmail
+    Still Get A Forecast And Plan, They Are Just Not Emailed.
+    """
+    FarmId: str | None = Field(None, description="Caller's Identifier, Echoed Back On The Result Line")
+    Location: str | None = Field(None, description="Farm Location (City, Village, Or Coordinates)")
+    Lat: float | None = Field(None, ge=-90, le=90)
+    Lon: float | None = Field(None, ge=-180, le=180)
+    FarmerEmail: EmailStr | None = Field(None, description="Send This Farm's Action Plan By Email")
+    DaysAhead: int = Field(default=30, ge=1, le=90, description="Forecast Horizon In Days")
+    UserQuery: str = Field(default="What Are The Agricultural Risks For My Farm?", description="Custom User Query")
+
+    @field_validator('FarmId', 'Location', 'FarmerEmail', mode='before')
+    @classmethod
+    def blank_to_none(cls, v):
+        """Treat Empty CSV Cells As Missing."""
+        return v.strip() or None if isinstance(v, str) else v
+
+    @field_validator('Lat', 'Lon', mode='before')
+    @classmethod
+    def blank_coordinate(cls, v):
+        return None if isinstance(v, str) and not v.strip() else v
+
+    @field_validator('UserQuery', mode='before')
+    @classmethod
+    def default_query(cls, v):
+        return v if v and str(v).strip() else "What Are The Agricultural Risks For My Farm?"
+
+    @model_validator(mode='after')
+    def require_place(self):
+        """Ensure The Farm Can Be Located."""
+        if not self.Location and (self.Lat is None or self.Lon is None):
+            raise ValueError('Each Farm Needs A Location Or Both Lat And Lon')
+        return self
+
+
 # ===== LIFESPAN MANAGEMENT =====
 @asynccontextmanager
 async def Lifespan(App: FastAPI):
@@ -144,7 +195,7 @@ async def Lifespan(App: FastAPI):
     The Lifespan Approach Guarantees That Resources Are Properly Managed
     And That The Application State Remains Consistent Throughout Its Runtime.
     """
-    global AgentBootstrapInstance, OrchestratorInstance, HealthServiceInstance
+    global AgentBootstrapInstance, OrchestratorInstance, HealthServiceInstance, Era5PrefetchTask, NdviIngestTask
     
     Logger.info("🚀 Starting AgriSenseGuardian Application...")
     
@@ -166,6 +217,9 @@ async def Lifespan(App: FastAPI):
     except Exception:
         pass
     
+    # Open The Shared Outbound HTTP Connection Pool
+    await get_http_client().start()
+    
     # Start A2A Agents If Enabled
     if Settings.start_a2a_on_startup:
         Logger.info("🤖 A2A Auto-Start Enabled - Launching Multi-Agent System...")
@@ -191,6 +245,22 @@ async def Lifespan(App: FastAPI):
     else:
         Logger.info("ℹ️ A2A Auto-Start Disabled (Set START_A2A_ON_STARTUP=true To Enable)")
     
+    # Schedule The Daily Regional ERA5-Land Pre-Fetch (Downloads Run In Background Jobs)
+    if Settings.era5_prefetch_enabled and Settings.copernicus_api_key:
+        Logger.info("🛰️ Scheduling Regional ERA5-Land Pre-Fetch...")
+        Era5PrefetchTask = asyncio.create_task(
+            get_era5_regions().run_scheduler(Settings.copernicus_api_key, Settings.era5_prefetch_interval_hours * 3600)
+        )
+    
+    # Schedule NDVI History Ingest (Forecasts Read The Stored Series, Never Imagery)
+    if Settings.ndvi_ingest_enabled and Settings.sentinel_client_id and Settings.sentinel_client_secret:
+        Logger.info("🌿 Scheduling NDVI History Ingest...")
+        NdviIngestTask = asyncio.create_task(
+            get_ndvi_history().run_scheduler(
+                Settings.sentinel_client_id, Settings.sentinel_client_secret, Settings.ndvi_ingest_interval_hours * 3600
+            )
+        )
+    
     # Initialize Core Orchestrator Agent For Workflow Coordination
     Logger.info("🧠 Initializing Orchestrator Agent...")
     OrchestratorInstance = OrchestratorAgent()
@@ -213,6 +283,15 @@ async def Lifespan(App: FastAPI):
         Logger.info("🔄 Stopping A2A Agents...")
         AgentBootstrapInstance.stop_all()
     
+    if Era5PrefetchTask:
+        Era5PrefetchTask.cancel()
+    if NdviIngestTask:
+        NdviIngestTask.cancel()
+    
+    await get_http_client().close()
+    get_era5_jobs().shutdown()
+    shutdown_process_pool()
+    
     Logger.info("👋 AgriSenseGuardian Stopped Successfully")
 
 
@@ -378,6 +457,177 @@ async def Forecast(ForecastReq: ForecastRequest):
         )
 
 
+def _EventStream(Channel: str, Request: Request) -> StreamingResponse:
+    """
+    Server-Sent Events Response Replaying And Following An EventBus Channel.
+    
+    Honours The Last-Event-ID Header So A Reconnecting EventSource Resumes
+    Where It Left Off, And Sends Keep-Alive Comments While Stages Are Quiet.
+    """
+    try:
+        After = int(Request.headers.get("last-event-id", "0"))
+    except ValueError:
+        After = 0
+    
+    async def Frames():
+        async for Event in get_event_bus().subscribe(Channel, after=After, keepalive_seconds=Settings.event_keepalive_seconds):
+            yield format_sse(Event)
+    
+    return StreamingResponse(
+        Frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@App.post("/forecast/stream")
+async def ForecastStream(ForecastReq: ForecastRequest, Request: Request):
+    """
+    Run The Forecast Workflow And Stream Its Stages As Server-Sent Events.
+    
+    Emits Started, Geocoded, One SourceArrived Per Data Source, RisksComputed,
+    Verified, PlanReady, EmailQueued And EmailSent As They Happen, Then A Final
+    Completed (Or Error) Event Carrying The Same Body /forecast Returns. The
+    Workflow Keeps Running If The Client Disconnects, So The Email Still Goes Out.
+    """
+    if not OrchestratorInstance:
+        raise HTTPException(status_code=503, detail="Orchestrator Agent Not Initialized")
+    
+    Channel = f"forecast:{uuid.uuid4()}"
+    Bus = get_event_bus()
+    Bus.publish(Channel, "Accepted", {"Location": ForecastReq.Location})
+    
+    async def Run():
+        try:
+            with record_agent_duration("OrchestratorWorkflow"), use_span("HTTP.ForecastStream"):
+                Result = await OrchestratorInstance.ExecuteWorkflow(
+                    Location=ForecastReq.Location,
+                    DaysAhead=ForecastReq.DaysAhead,
+                    FarmerPhone=ForecastReq.FarmerPhone,
+                    FarmerEmail=ForecastReq.FarmerEmail,
+                    UserQuery=ForecastReq.UserQuery,
+                    EventChannel=Channel
+                )
+            Bus.publish(Channel, "Error" if Result.get('Status') == 'Error' else "Completed", {"Result": Result})
+        except Exception as E:
+            Logger.error(f"❌ Streamed Forecast Failed: {str(E)}", exc_info=True)
+            Bus.publish(Channel, "Error", {"Message": f"Forecast Generation Failed: {str(E)}"})
+        finally:
+            Bus.close(Channel)
+    
+    Task = asyncio.create_task(Run(), name=f"ForecastStream:{Channel}")
+    StreamTasks.add(Task)
+    Task.add_done_callback(StreamTasks.discard)
+    return _EventStream(Channel, Request)
+
+
+def _BatchTooLarge(Detail: str) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"Batch Too Large: {Detail}")
+
+
+async def _ReadBatchBody(Request: Request) -> bytes:
+    """
+    Read A /forecast/batch Upload, Refusing It As Soon As It Passes forecast_batch_max_bytes.
+    
+    A Declared Content-Length Over The Limit Is Refused Before Any Of The Body
+    Is Read; Chunked Uploads Are Cut Off Once Enough Has Arrived.
+    """
+    Limit = Settings.forecast_batch_max_bytes
+    Declared = Request.headers.get("content-length", "")
+    if Declared.isdigit() and int(Declared) > Limit:
+        raise _BatchTooLarge(f"At Most {Limit} Bytes Per Request")
+    Chunks, Size = [], 0
+    async for Chunk in Request.stream():
+        Size += len(Chunk)
+        if Size > Limit:
+            raise _BatchTooLarge(f"At Most {Limit} Bytes Per Request")
+        Chunks.append(Chunk)
+    return b"".join(Chunks)
+
+
+def _ParseBatch(Body: bytes, ContentType: str, DaysAhead: int, MaxFarms: int):
+    """
+    Split A /forecast/batch Upload Into Valid Farms And Rejected Rows.
+    
+    text/csv Bodies Are Read With A Header Row (Column Names As In BatchFarm,
+    Case-Insensitive); Anything Else Is Treated As JSON Lines, One Farm Object
+    Per Line. Rows Without Their Own DaysAhead Use The Query Parameter's.
+    
+    Returns:
+        (Farms As Dicts With Their 1-Based Line Number, Error Lines For Rejected Rows)
+    
+    Raises:
+        HTTPException: 413 As Soon As The Upload Has More Than MaxFarms Rows,
+            Before Any Row Is Validated
+    """
+    Text = Body.decode("utf-8-sig", errors="replace")
+    Fields = {Name.lower(): Name for Name in BatchFarm.model_fields}
+    Rows = []
+    if "csv" in ContentType.lower():
+        Reader = csv.DictReader(io.StringIO(Text))
+        for Row in Reader:
+            if len(Rows) == MaxFarms:
+                raise _BatchTooLarge(f"At Most {MaxFarms} Farms Per Request")
+            Rows.append((Reader.line_num, {Fields.get((Key or "").strip().lower(), Key): Value for Key, Value in Row.items()}))
+    else:
+        for Number, Raw in enumerate(Text.splitlines(), start=1):
+            if not Raw.strip():
+                continue
+            if len(Rows) == MaxFarms:
+                raise _BatchTooLarge(f"At Most {MaxFarms} Farms Per Request")
+            try:
+                Rows.append((Number, json.loads(Raw)))
+            except json.JSONDecodeError as E:
+                Rows.append((Number, E))
+    
+    Farms, Rejected = [], []
+    for Number, Row in Rows:
+        try:
+            if isinstance(Row, Exception):
+                raise ValueError(f"Invalid JSON: {Row}")
+            if not isinstance(Row, dict):
+                raise ValueError(f"Not A JSON Object: {Row}")
+            if Row.get("DaysAhead") in (None, ""):
+                Row["DaysAhead"] = DaysAhead
+            Farms.append({"Line": Number, **BatchFarm.model_validate(Row).model_dump()})
+        except (ValidationError, ValueError) as E:
+            Message = "; ".join(f"{'.'.join(map(str, Err['loc'])) + ': ' if Err['loc'] else ''}{Err['msg']}" for Err in E.errors()) if isinstance(E, ValidationError) else str(E)
+            Rejected.append({"Line": Number, "FarmId": Row.get("FarmId") if isinstance(Row, dict) else None, "Status": "Error", "Message": Message})
+    return Farms, Rejected
+
+
+@App.post("/forecast/batch")
+async def ForecastBatch(Request: Request, days_ahead: int = 30, plans: bool = True):
+    """
+    Forecast Many Farms In One Request And Stream The Results As NDJSON.
+    
+    Accepts A CSV Upload (Content-Type: text/csv) Or JSON Lines, One Farm Per
+    Row. Farms Are Grouped By Grid Cell So Each Cell's Data Sources Are Fetched
+    Once, Whatever The Number Of Farms In It; Result Lines Are Written As Each
+    Cell Finishes, Rejected Rows Come First, And A Final Summary Line Reports
+    Farms, Cells And Duration.
+    """
+    if not OrchestratorInstance:
+        raise HTTPException(status_code=503, detail="Orchestrator Agent Not Initialized")
+    if not 1 <= days_ahead <= 90:
+        raise HTTPException(status_code=422, detail="days_ahead Must Be Between 1 And 90")
+    
+    Farms, Rejected = _ParseBatch(
+        await _ReadBatchBody(Request), Request.headers.get("content-type", ""), days_ahead, Settings.forecast_batch_max_farms
+    )
+    Logger.info(f"🌾 Batch Forecast: {len(Farms)} Farms ({len(Rejected)} Rejected Rows)")
+    
+    async def Lines():
+        for Line in Rejected:
+            yield json.dumps(Line) + "\n"
+        async for Line in OrchestratorInstance.ExecuteBatch(Farms, IncludePlans=plans):
+            if Line.get("Status") == "Summary":
+                Line["Rejected"] = len(Rejected)
+            yield json.dumps(Line, default=str) + "\n"
+    
+    return StreamingResponse(Lines(), media_type="application/x-ndjson", headers={"X-Accel-Buffering": "no"})
+
+
 @App.get("/agents/status")
 async def AgentsStatus():
     """
@@ -502,6 +752,28 @@ async def TaskStatus(task_id: str):
     return Mgr.status(task_id)
 
 
+@App.get("/tasks/{task_id}/events")
+async def TaskEvents(task_id: str, Request: Request):
+    """Stream A Task's Stage And State Events As Server-Sent Events (Replaces Status Polling)."""
+    if not get_event_bus().exists(task_id):
+        raise HTTPException(status_code=404, detail="Task Not Found Or Its Events Have Expired")
+    return _EventStream(task_id, Request)
+
+
+# ===== ERA5-Land Job Endpoints =====
+
+@App.get("/era5/jobs")
+async def ListEra5Jobs(limit: int = 50):
+    """List Recent Background ERA5-Land Retrievals, Newest First."""
+    return get_era5_jobs().list_jobs(limit=limit)
+
+
+@App.get("/era5/jobs/{job_id}")
+async def Era5JobStatus(job_id: str):
+    """Retrieve The State Of A Background ERA5-Land Retrieval."""
+    return get_era5_jobs().status(job_id)
+
+
 # ===== EXCEPTION HANDLERS =====
 
 @App.exception_handler(404)
@@ -0,0 +1,550 @@
+from __future__ import annotations
+
+import datetime
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+
+try:
+    import cdsapi
+    CDSAPI_AVAILABLE = True
+except ImportError:
+    CDSAPI_AVAILABLE = False
+
+
+ERA5_LAND_DATASET = "reanalysis-era5-land"
+ERA5_LAND_VARIABLES = [
+    "volumetric_soil_water_layer_1",  # Soil Moisture 0-7cm
+    "2m_temperature",
+    "total_precipitation",
+    "potential_evaporation",
+]
+
+
+# ERA5-Land Is Published Roughly Five Days Behind Real Time
+ERA5_LAND_LATENCY_DAYS = 5
+
+# Sidecars Written Before Requests Used Exact Day Lists May Not Hold The Days
+# They Claim, So Coverage Only Trusts Files Of The Current Version
+CACHE_VERSION = 2
+
+# Directory mtimes Newer Than This Are Not Trusted To Cover Every File Yet
+INDEX_SETTLE_NS = 2_000_000_000
+
+
+def latest_available_day(today: Optional[datetime.date] = None) -> datetime.date:
+    """Most Recent Day ERA5-Land Can Be Expected To Have Published."""
+    return (today or datetime.datetime.utcnow().date()) - datetime.timedelta(days=ERA5_LAND_LATENCY_DAYS)
+
+
+def month_chunks(start: datetime.date, end: datetime.date) -> List[Tuple[datetime.date, datetime.date]]:
+    """Split [start, end] Into Per-Calendar-Month (First, Last) Day Ranges."""
+    chunks = []
+    while start <= end:
+        next_month = (start.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        last = min(end, next_month - datetime.timedelta(days=1))
+        chunks.append((start, last))
+        start = next_month
+    return chunks
+
+
+def era5_land_request(area: List[float], start: datetime.date, end: datetime.date) -> Dict[str, Any]:
+    """
+    Build The CDS Request For ERA5-Land Over An Area And A Range Within One Month.
+
+    CDS Takes The Cross-Product Of The year/month/day Lists, So A Request Is
+    Only Exact When It Stays Inside One Calendar Month; Use month_chunks For
+    Longer Windows.
+
+    Args:
+        area: [North, West, South, East] In Degrees
+        start: First Day Of The Range
+        end: Last Day Of The Range (Same Month As start)
+
+    Raises:
+        ValueError: If The Range Crosses A Month Boundary
+    """
+    if (start.year, start.month) != (end.year, end.month) or end < start:
+        raise ValueError(f"ERA5-Land Request Must Cover Days Within One Month, Got {start} → {end}")
+    return {
+        "variable": list(ERA5_LAND_VARIABLES),
+        "year": [str(start.year)],
+        "month": [f"{start.month:02d}"],
+        "day": [f"{d:02d}" for d in range(start.day, end.day + 1)],
+        "time": ["00:00", "06:00", "12:00", "18:00"],
+        "area": list(area),
+        "format": "netcdf",
+    }
+
+
+def request_key(dataset: str, request: Dict[str, Any]) -> str:
+    """Content Address For A CDS Request: Identical Requests Share One File."""
+    canonical = json.dumps({"dataset": dataset, "request": request}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+@dataclass
+class Era5Job:
+    id: str
+    key: str
+    dataset: str
+    request: Dict[str, Any]
+    area: List[float]
+    start: str
+    end: str
+    status: str = "Queued"  # Queued | Running | Completed | Error
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    path: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("Queued", "Running")
+
+
+class Era5JobManager:
+    """
+    Background Job Queue For Copernicus CDS Retrievals.
+
+    CDS Requests Often Wait Minutes In The Remote Queue, So They Never Run
+    Inside A Forecast Request. Callers Submit A Request And Return
+    Immediately; A Dedicated Thread Pool (Separate From The Event Loop's
+    Default Executor) Runs The Blocking cdsapi Retrieve.
+
+    Downloads Land In A Content-Addressed Cache (<cache_dir>/Era5/Data/<key>.nc,
+    Keyed By A Hash Of The Full Request, I.e. Area, Dates And Variables) With A
+    JSON Sidecar Describing Area And Period. Sidecars Are Indexed In Memory By
+    (Dataset, Area); The Index Is Rescanned Only When Another Process Changes
+    The Data Directory. Job Records Are Written To
+    <cache_dir>/Era5/Jobs/<id>.json On Every State Change, So The Web Process
+    Can Report On Jobs Submitted By The A2A Forecast Agent Process.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_workers: Optional[int] = None):
+        settings = get_settings()
+        self.root = root or os.path.join(settings.cache_dir, "Era5")
+        self.data_dir = os.path.join(self.root, "Data")
+        self.jobs_dir = os.path.join(self.root, "Jobs")
+        os.makedirs(self.data_dir, exist_ok=True)
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.era5_max_concurrent_jobs,
+            thread_name_prefix="Era5Job",
+        )
+        self._jobs: Dict[str, Era5Job] = {}
+        self._active: Dict[str, Era5Job] = {}  # Content Key → Running/Queued Job
+        self._failed: Dict[str, Era5Job] = {}  # Content Key → Last Failed Job (Retry Backoff)
+        self._completed: Dict[str, Era5Job] = {}  # Content Key → Job That Produced (Or Found) The File
+        self.retry_seconds = settings.era5_retry_seconds
+        self.retention_seconds = settings.era5_job_retention_hours * 3600
+        self.data_retention_days = settings.era5_data_retention_days
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+        # (Dataset, Area) → Sidecars Of The Current Version, Rebuilt When Another Process Changes data_dir
+        self._index: Dict[Tuple[str, Tuple[float, ...]], List[Dict[str, Any]]] = {}
+        self._index_mtime: Optional[int] = None
+
+    # ===== Result Cache =====
+
+    def data_path(self, key: str) -> str:
+        return os.path.join(self.data_dir, f"{key}.nc")
+
+    def cached(self, dataset: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return Metadata (With 'Path') For An Already Downloaded Request, Else None."""
+        return self._read_meta(request_key(dataset, request))
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.data_path(key)
+        try:
+            with open(path[:-3] + ".json", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("Version") != CACHE_VERSION or not os.path.exists(path):
+            return None
+        meta["Path"] = path
+        return meta
+
+    def _sidecars(self, area: List[float], dataset: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            try:
+                mtime = os.stat(self.data_dir).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime is None or mtime != self._index_mtime:
+                self._rebuild_index()
+                # A Write Landing In The Same mtime Tick As The Scan Would Go Unseen,
+                # So A Directory Changed Within The Last Few Seconds Is Scanned Again
+                recent = mtime is not None and time.time_ns() - mtime < INDEX_SETTLE_NS
+                self._index_mtime = None if recent else mtime
+            return list(self._index.get((dataset, tuple(area)), ()))
+
+    def _rebuild_index(self) -> None:
+        index: Dict[Tuple[str, Tuple[float, ...]], List[Dict[str, Any]]] = {}
+        for sidecar in glob.glob(os.path.join(self.data_dir, "*.json")):
+            try:
+                with open(sidecar, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if meta.get("Version") != CACHE_VERSION or not isinstance(meta.get("Area"), list):
+                continue
+            index.setdefault((meta.get("Dataset"), tuple(meta["Area"])), []).append(meta)
+        self._index = index
+
+    def _index_sidecar(self, meta: Dict[str, Any]) -> None:
+        """Add A Sidecar This Process Just Wrote, Ahead Of The Rescan Its Write Triggers."""
+        with self._lock:
+            self._index.setdefault((meta["Dataset"], tuple(meta["Area"])), []).append(meta)
+
+    def latest(self, area: List[float], dataset: str = ERA5_LAND_DATASET) -> Optional[Dict[str, Any]]:
+        """
+        Most Recent Completed Download Covering Exactly This Area.
+
+        Returns:
+            Sidecar Metadata With 'Path', Or None If Nothing Is Cached Yet
+        """
+        best = None
+        for meta in self._sidecars(area, dataset):
+            if best is None or (meta.get("End"), meta.get("CompletedAt", 0)) > (best.get("End"), best.get("CompletedAt", 0)):
+                best = meta
+        if best is None:
+            return None
+        return self._read_meta(best["Key"])
+
+    def plan_window(
+        self, area: List[float], start: datetime.date, end: datetime.date, dataset: str = ERA5_LAND_DATASET
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[datetime.date, datetime.date]]]:
+        """
+        Split A Window Into Cached Files And The Day Ranges Still To Download.
+
+        Missing Days Are Grouped Into Contiguous Runs That Never Cross A
+        Month Boundary, So Each Run Maps To One Exact CDS Request.
+
+        Returns:
+            (Cached Files Overlapping The Window, Oldest First; Missing (First, Last) Ranges)
+        """
+        files = []
+        covered = set()
+        for meta in self._sidecars(area, dataset):
+            first = max(start, datetime.date.fromisoformat(meta["Start"]))
+            last = min(end, datetime.date.fromisoformat(meta["End"]))
+            if first > last:
+                continue
+            meta = self._read_meta(meta["Key"])
+            if meta is None:
+                continue
+            files.append(meta)
+            covered.update(first + datetime.timedelta(days=i) for i in range((last - first).days + 1))
+        files.sort(key=lambda m: m["Start"])
+
+        missing = []
+        for chunk_start, chunk_end in month_chunks(start, end):
+            run_start = None
+            day = chunk_start
+            while day <= chunk_end:
+                if day not in covered and run_start is None:
+                    run_start = day
+                elif day in covered and run_start is not None:
+                    missing.append((run_start, day - datetime.timedelta(days=1)))
+                    run_start = None
+                day += datetime.timedelta(days=1)
+            if run_start is not None:
+                missing.append((run_start, chunk_end))
+        return files, missing
+
+    def submit_window(
+        self, api_key: str, area: List[float], start: datetime.date, end: datetime.date
+    ) -> Tuple[List[Dict[str, Any]], List[Era5Job]]:
+        """
+        Queue ERA5-Land Downloads For Every Uncached Day Of A Window.
+
+        Each Missing Run Becomes Its Own Job, So Runs Download Concurrently
+        (Up To era5_max_concurrent_jobs) And Later Windows Reuse Them.
+
+        Returns:
+            (Cached Files Overlapping The Window, Jobs For The Missing Ranges)
+        """
+        files, missing = self.plan_window(area, start, end)
+        jobs = [
+            self.submit(api_key, ERA5_LAND_DATASET, era5_land_request(area, first, last), area, first.isoformat(), last.isoformat())
+            for first, last in missing
+        ]
+        return files, jobs
+
+    # ===== Jobs =====
+
+    def submit(self, api_key: str, dataset: str, request: Dict[str, Any], area: List[float], start: str, end: str) -> Era5Job:
+        """
+        Queue A CDS Retrieval Unless It Is Already Cached Or In Flight.
+
+        Returns Immediately. A Cached Request Yields A Completed Job Record; An
+        Identical Request Already Queued Or Running Returns That Job, And One
+        That Failed Less Than era5_retry_seconds Ago Returns The Failed Job.
+        """
+        self.prune()
+        key = request_key(dataset, request)
+        with self._lock:
+            existing = self._active.get(key)
+            if existing is not None:
+                return existing
+            failed = self._failed.get(key)
+            if failed is not None and time.time() - (failed.finished_at or 0) < self.retry_seconds:
+                return failed
+            if self._read_meta(key) is not None:
+                done = self._completed.get(key)
+                if done is None:
+                    done = Era5Job(id=str(uuid.uuid4()), key=key, dataset=dataset, request=request, area=list(area), start=start, end=end)
+                    done.status = "Completed"
+                    done.finished_at = time.time()
+                    done.path = self.data_path(key)
+                    self._jobs[done.id] = done
+                    self._completed[key] = done
+                return done
+            job = Era5Job(id=str(uuid.uuid4()), key=key, dataset=dataset, request=request, area=list(area), start=start, end=end)
+            self._jobs[job.id] = job
+            self._active[key] = job
+        self._save(job)
+        self._executor.submit(self._run, job, api_key)
+        print(f"[Era5Jobs] Queued Job {job.id} ({start} → {end}, Area {area})")
+        return job
+
+    def _run(self, job: Era5Job, api_key: str) -> None:
+        job.status = "Running"
+        job.started_at = time.time()
+        self._save(job)
+        target = self.data_path(job.key)
+        partial = f"{target}.part{os.getpid()}"
+        try:
+            if not CDSAPI_AVAILABLE:
+                raise RuntimeError("cdsapi Is Not Installed")
+            client = cdsapi.Client(key=api_key)
+            client.retrieve(job.dataset, job.request, partial)
+            os.replace(partial, target)
+            meta = {
+                "Version": CACHE_VERSION,
+                "Key": job.key,
+                "Dataset": job.dataset,
+                "Area": job.area,
+                "Start": job.start,
+                "End": job.end,
+                "Variables": job.request.get("variable", []),
+                "CompletedAt": time.time(),
+            }
+            sidecar = target[:-3] + ".json"
+            with open(sidecar + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(sidecar + ".tmp", sidecar)
+            self._index_sidecar(meta)
+            job.path = target
+            job.status = "Completed"
+            print(f"[Era5Jobs] Job {job.id} Completed In {time.time() - job.started_at:.0f}s")
+        except Exception as e:
+            job.status = "Error"
+            job.error = str(e)
+            print(f"[Era5Jobs] Job {job.id} Failed: {e}")
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._active.pop(job.key, None)
+                if job.status == "Error":
+                    self._failed[job.key] = job
+                else:
+                    self._failed.pop(job.key, None)
+                    self._completed[job.key] = job
+            self._save(job)
+
+    def prune(self, force: bool = False) -> int:
+        """
+        Forget Finished Jobs Older Than era5_job_retention_hours And Old Downloads.
+
+        Drops Jobs From Memory And Deletes Their Records Under jobs_dir,
+        Including Records Written By Other Processes And Records Left Queued
+        Or Running By A Process That Exited, Then Evicts Downloads Past
+        era5_data_retention_days (See _evict_data). Runs At Most Once Per
+        retry_seconds Unless Forced.
+
+        Returns:
+            Number Of Job Records And Downloads Deleted From Disk
+        """
+        now = time.time()
+        cutoff = now - self.retention_seconds
+        with self._lock:
+            if not force and now - self._last_prune < min(self.retry_seconds, self.retention_seconds):
+                return 0
+            self._last_prune = now
+            for job_id, job in list(self._jobs.items()):
+                if not job.active and (job.finished_at or job.created_at) < cutoff:
+                    del self._jobs[job_id]
+            for jobs in (self._failed, self._completed):
+                for key, job in list(jobs.items()):
+                    if job.id not in self._jobs:
+                        del jobs[key]
+            live = {job.id for job in self._active.values()}
+            downloading = set(self._active)
+
+        removed = 0
+        for path in glob.glob(os.path.join(self.jobs_dir, "*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            # Queued/Running Records Past The Window Belong To Processes That Died Mid-Job
+            if record.get("id") in live:
+                continue
+            if (record.get("finished_at") or record.get("created_at") or now) >= cutoff:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+        if removed:
+            print(f"[Era5Jobs] Pruned {removed} Job Records Older Than {self.retention_seconds / 3600:.0f}h")
+        return removed + self._evict_data(downloading, now)
+
+    def _evict_data(self, downloading: Set[str], now: float) -> int:
+        """
+        Delete Downloads No Forecast Window Can Reach Any More.
+
+        A File Goes Once Its Last Day Is More Than data_retention_days Before
+        The Newest Published Day, Or When Its Sidecar Is From An Older
+        CACHE_VERSION. Files Without A Sidecar (Partial Or Abandoned Downloads)
+        Go After A Day Unless This Process Is Still Downloading Them.
+
+        Returns:
+            Number Of Downloads Deleted
+        """
+        oldest = (latest_available_day() - datetime.timedelta(days=self.data_retention_days)).isoformat()
+        evicted = 0
+        described = set()
+        for sidecar in glob.glob(os.path.join(self.data_dir, "*.json")):
+            key = os.path.basename(sidecar)[:-5]
+            try:
+                with open(sidecar, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if meta.get("Version") == CACHE_VERSION and str(meta.get("End", "")) >= oldest:
+                described.add(key)
+                continue
+            try:
+                # Sidecar First, So No Reader Finds Metadata Pointing At A Deleted File
+                os.remove(sidecar)
+                os.remove(self.data_path(key))
+            except OSError:
+                pass
+            evicted += 1
+        for path in glob.glob(os.path.join(self.data_dir, "*.nc*")):
+            key = os.path.basename(path).split(".", 1)[0]
+            if key in described or key in downloading:
+                continue
+            try:
+                if now - os.path.getmtime(path) < 86400:
+                    continue
+                os.remove(path)
+                evicted += 1
+            except OSError:
+                continue
+        if evicted:
+            print(f"[Era5Jobs] Evicted {evicted} Stale Downloads (Retention {self.data_retention_days} Days)")
+        return evicted
+
+    def _save(self, job: Era5Job) -> None:
+        record = asdict(job)
+        path = os.path.join(self.jobs_dir, f"{job.id}.json")
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"[Era5Jobs] Could Not Persist Job {job.id}: {e}")
+
+    @staticmethod
+    def _describe(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Id": record["id"],
+            "State": record["status"],
+            "Dataset": record["dataset"],
+            "Area": record["area"],
+            "Start": record["start"],
+            "End": record["end"],
+            "CreatedAt": record["created_at"],
+            "StartedAt": record.get("started_at"),
+            "FinishedAt": record.get("finished_at"),
+            "Error": record.get("error"),
+        }
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get Current State Of A Job, Including Jobs Submitted By Other Processes.
+        """
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return {"Status": "Success", "Job": self._describe(asdict(job))}
+        try:
+            with open(os.path.join(self.jobs_dir, f"{os.path.basename(job_id)}.json"), encoding="utf-8") as f:
+                return {"Status": "Success", "Job": self._describe(json.load(f))}
+        except (OSError, ValueError, KeyError):
+            return {"Status": "Error", "Message": "Job Not Found"}
+
+    def list_jobs(self, limit: int = 50) -> Dict[str, Any]:
+        """List The Most Recent Jobs Across All Processes, Newest First."""
+        self.prune()
+        records = []
+        for path in glob.glob(os.path.join(self.jobs_dir, "*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        records.sort(key=lambda r: r.get("created_at", 0), reverse=True)
+        jobs = [self._describe(r) for r in records[:limit]]
+        return {
+            "Status": "Success",
+            "Active": sum(1 for j in jobs if j["State"] in ("Queued", "Running")),
+            "Jobs": jobs,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton Accessor
+_era5_jobs: Optional[Era5JobManager] = None
+
+
+def get_era5_jobs() -> Era5JobManager:
+    global _era5_jobs
+    if _era5_jobs is None:
+        _era5_jobs = Era5JobManager()
+    return _era5_jobs
+
+
+__all__ = [
+    "Era5JobManager",
+    "Era5Job",
+    "get_era5_jobs",
+    "request_key",
+    "era5_land_request",
+    "month_chunks",
+    "latest_available_day",
+    "ERA5_LAND_DATASET",
+    "ERA5_LAND_VARIABLES",
+]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+from Services.Era5Jobs import Era5Job, Era5JobManager, get_era5_jobs, latest_available_day
+
+
+# Bounding Boxes (North, West, South, East) Of The Main Agricultural States,
+# Snapped Outwards To The 0.1° ERA5-Land Grid
+REGIONS: Dict[str, Tuple[float, float, float, float]] = {
+    "Punjab": (32.6, 73.8, 29.5, 77.0),
+    "Haryana": (31.0, 74.4, 27.6, 77.6),
+    "UttarPradesh": (30.5, 77.0, 23.8, 84.7),
+    "Bihar": (27.6, 83.3, 24.2, 88.3),
+    "WestBengal": (27.3, 85.8, 21.5, 89.9),
+    "Odisha": (22.6, 81.3, 17.8, 87.5),
+    "MadhyaPradesh": (26.9, 74.0, 21.0, 82.9),
+    "Rajasthan": (30.2, 69.4, 23.0, 78.3),
+    "Gujarat": (24.8, 68.1, 20.1, 74.5),
+    "Maharashtra": (22.1, 72.6, 15.6, 80.9),
+    "Telangana": (19.95, 77.2, 15.8, 81.4),
+    "AndhraPradesh": (19.2, 76.7, 12.6, 84.8),
+    "Karnataka": (18.5, 74.0, 11.5, 78.6),
+    "TamilNadu": (13.6, 76.2, 8.0, 80.4),
+    "Kerala": (12.8, 74.8, 8.2, 77.5),
+}
+
+
+class Era5RegionalStore:
+    """
+    Regional ERA5-Land Pre-Fetch With Per-Farm Point Extraction.
+
+    Instead Of One ±0.25° Download Per Farm, Whole States Are Pulled Once Per
+    Day Through The ERA5 Job Manager (So Downloads Share Its Content-Addressed
+    Cache, Retry Backoff And Job Endpoints). Farm Requests Then Open The
+    Regional Files Lazily And Read Only The Nearest Grid Point, So Per-Request
+    Latency No Longer Depends On The CDS Queue.
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[Era5JobManager] = None,
+        regions: Optional[List[str]] = None,
+        window_days: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.jobs = jobs or get_era5_jobs()
+        if regions is None:
+            regions = [r.strip() for r in settings.era5_prefetch_regions.split(",") if r.strip()] or list(REGIONS)
+        unknown = [r for r in regions if r not in REGIONS]
+        if unknown:
+            print(f"[Era5Regions] Ignoring Unknown Regions: {', '.join(unknown)}")
+        self.regions = {r: REGIONS[r] for r in regions if r in REGIONS}
+        self.window_days = window_days or settings.era5_prefetch_days
+
+    def region_for(self, lat: float, lon: float) -> Optional[str]:
+        """Smallest Configured Region Whose Box Contains The Point, Else None."""
+        best = None
+        best_size = None
+        for name, (north, west, south, east) in self.regions.items():
+            if south <= lat <= north and west <= lon <= east:
+                size = (north - south) * (east - west)
+                if best_size is None or size < best_size:
+                    best, best_size = name, size
+        return best
+
+    def window(self, today: Optional[datetime.date] = None) -> Tuple[datetime.date, datetime.date]:
+        """The (First, Last) Days Kept Pre-Fetched, Ending At The Newest Published Day."""
+        end = latest_available_day(today)
+        return end - datetime.timedelta(days=self.window_days), end
+
+    def prefetch(self, api_key: str) -> List[Era5Job]:
+        """
+        Submit Downloads For Any Day Of The Window Not Yet Cached, Per Region (Non-Blocking).
+
+        After The First Run Only The Newly Published Day Is Fetched Each Time.
+        """
+        start, end = self.window()
+        submitted = []
+        for area in self.regions.values():
+            _, jobs = self.jobs.submit_window(api_key, list(area), start, end)
+            submitted.extend(jobs)
+        return submitted
+
+    def lookup(self, lat: float, lon: float, start: datetime.date, end: datetime.date) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Regional Files Covering A Point Over [start, end].
+
+        Returns:
+            (Region Name, Sidecar Metadata With 'Path' For Each File), Or None
+            Unless The Containing Region Has Every Day Of The Window Cached
+        """
+        name = self.region_for(lat, lon)
+        if name is None:
+            return None
+        files, missing = self.jobs.plan_window(list(self.regions[name]), start, end)
+        if missing or not files:
+            return None
+        return name, files
+
+    async def run_scheduler(self, api_key: str, interval_seconds: float) -> None:
+        """Submit The Regional Pre-Fetch Now And Then Every interval_seconds Until Cancelled."""
+        while True:
+            try:
+                jobs = self.prefetch(api_key)
+                active = sum(1 for j in jobs if j.active)
+                print(f"[Era5Regions] Pre-Fetch Checked {len(self.regions)} Regions ({active} Downloads Queued)")
+            except Exception as e:
+                print(f"[Era5Regions] Pre-Fetch Failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+
+# Singleton Accessor
+_era5_regions: Optional[Era5RegionalStore] = None
+
+
+def get_era5_regions() -> Era5RegionalStore:
+    global _era5_regions
+    if _era5_regions is None:
+        _era5_regions = Era5RegionalStore()
+    return _era5_regions
+
+
+__all__ = ["Era5RegionalStore", "get_era5_regions", "REGIONS"]
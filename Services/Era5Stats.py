@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Config.Settings import get_settings  # type: ignore
+
+try:
+    import xarray as xr
+    XR_AVAILABLE = True
+except ImportError:
+    XR_AVAILABLE = False
+
+# Optional: With dask Installed Files Are Opened In Chunks And All Reductions
+# Share One Scheduled Read; Without It Each Variable Is Loaded Once Into Memory
+try:
+    import dask
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+
+# One Month Of 6-Hourly Steps Per Chunk
+TIME_CHUNK = 124
+
+# Accepted Names Per Variable (Short CDS Names First)
+VARIABLES = {
+    "soil": ("swvl1", "volumetric_soil_water_layer_1"),
+    "t2m": ("t2m", "2m_temperature"),
+    "tp": ("tp", "total_precipitation"),
+    "pev": ("pev", "potential_evaporation"),
+}
+
+Profile = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _open(paths: Sequence[str], window: Tuple[str, str], point: Optional[Tuple[float, float]]):
+    chunks = {"time": TIME_CHUNK} if DASK_AVAILABLE else None
+    sources = [xr.open_dataset(path, chunks=chunks) for path in paths]
+    parts = sources
+    if point is not None:
+        parts = [part.sel(latitude=point[0], longitude=point[1], method="nearest") for part in parts]
+    ds = parts[0] if len(parts) == 1 else xr.concat(parts, dim="time").sortby("time")
+    if ds.sizes.get("time", 0):
+        ds = ds.isel(time=np.unique(ds["time"].values, return_index=True)[1])
+        ds = ds.sel(time=slice(window[0], window[1]))
+    return sources, ds
+
+
+def _time_profile(var) -> tuple:
+    """Per-Time-Step (Sum, Count, Min, Max) Over All Non-Time Dimensions."""
+    if "time" not in var.dims:
+        var = var.expand_dims("time")
+    spatial = [d for d in var.dims if d != "time"]
+    if not spatial:
+        # Single Grid Point: The Series Is Its Own Profile
+        return var.fillna(0.0), var.notnull().astype(int), var, var
+    return (
+        var.sum(dim=spatial, skipna=True),
+        var.count(dim=spatial),
+        var.min(dim=spatial, skipna=True),
+        var.max(dim=spatial, skipna=True),
+    )
+
+
+def _profiles(ds) -> Dict[str, Profile]:
+    """
+    Reduce Every Variable To Small Per-Time-Step Profiles In A Single Read.
+
+    Every Statistic (Means, Extremes, Trend Windows) Is Derived From These
+    Profiles, So The Full Array Is Scanned Once Instead Of Once Per Statistic.
+    """
+    found = {}
+    for name, candidates in VARIABLES.items():
+        var = next((ds[c] for c in candidates if c in ds.variables), None)
+        if var is not None:
+            found[name] = var
+    if DASK_AVAILABLE:
+        lazy = {name: _time_profile(var) for name, var in found.items()}
+        (computed,) = dask.compute(lazy)
+    else:
+        computed = {name: _time_profile(var.load()) for name, var in found.items()}
+    return {name: tuple(np.asarray(p.values, dtype=float) for p in profile) for name, profile in computed.items()}
+
+
+def _mean(profile: Optional[Profile], lo: Optional[int] = None, hi: Optional[int] = None) -> Optional[float]:
+    if profile is None:
+        return None
+    sums, counts = profile[0][lo:hi], profile[1][lo:hi]
+    total = counts.sum()
+    return float(sums.sum() / total) if total else None
+
+
+def _extremes(profile: Optional[Profile]) -> Tuple[Optional[float], Optional[float]]:
+    if profile is None or not np.isfinite(profile[2]).any():
+        return None, None
+    return float(np.nanmin(profile[2])), float(np.nanmax(profile[3]))
+
+
+def _trend(profile: Optional[Profile]) -> str:
+    if profile is None:
+        return "Unknown"
+    n = len(profile[0])
+    if n < 8:
+        return "Unknown"
+    q = max(n // 4, 1)
+    first, last = _mean(profile, 0, q), _mean(profile, -q, None)
+    if first is None or last is None:
+        return "Unknown"
+    delta = (last - first) * 100
+    if delta > 1.0:
+        return "Increasing"
+    if delta < -1.0:
+        return "Decreasing"
+    return "Stable"
+
+
+def summarise_era5_land(
+    paths: List[str],
+    window: Tuple[str, str],
+    days_back: int,
+    point: Optional[Tuple[float, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Compute Soil Moisture, Temperature, Precipitation And ET From ERA5-Land Files.
+
+    Files (One Per Downloaded Day Range) Are Opened Lazily, Joined Along Time
+    And Cut To window ('YYYY-MM-DD', 'YYYY-MM-DD'). Per-Farm Boxes Are
+    Averaged Over The Whole Area; With point (lat, lon) - Used For Regional
+    Files - Only The Nearest Grid Point Is Read.
+
+    Returns:
+        Raw (Unrounded) Values, None Where A Variable Is Missing
+    """
+    sources, ds = _open(paths, window, point)
+    try:
+        profiles = _profiles(ds)
+    finally:
+        for source in sources:
+            try:
+                source.close()
+            except Exception:
+                pass
+
+    soil = profiles.get("soil")
+    soil_mean = _mean(soil)
+    temp_k_mean = _mean(profiles.get("t2m"))
+    temp_k_min, temp_k_max = _extremes(profiles.get("t2m"))
+    precip_m = _mean(profiles.get("tp"))
+    et_m = _mean(profiles.get("pev"))
+    return {
+        "SoilPercent": soil_mean * 100.0 if soil_mean is not None else None,
+        "SoilTrend": _trend(soil),
+        "TempMean": (temp_k_mean - 273.15) if temp_k_mean is not None else None,
+        "TempMin": (temp_k_min - 273.15) if temp_k_min is not None else None,
+        "TempMax": (temp_k_max - 273.15) if temp_k_max is not None else None,
+        "PrecipMm": precip_m * 1000.0 if precip_m is not None else None,
+        "EtMmDay": abs(et_m) * 1000.0 / max(days_back, 1) if et_m is not None else None,
+    }
+
+
+# Process Pool (Reductions Hold The GIL, So Threads Would Stall The Event Loop)
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Shared Worker Pool For ERA5 Processing, Or None When era5_stats_workers Is 0."""
+    global _process_pool
+    workers = get_settings().era5_stats_workers
+    if workers <= 0:
+        return None
+    if _process_pool is None:
+        # Spawn, Not Fork: The Parent Runs An Event Loop And Worker Threads
+        _process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def summarise_era5_land_async(
+    paths: List[str],
+    window: Tuple[str, str],
+    days_back: int,
+    point: Optional[Tuple[float, float]] = None,
+) -> Dict[str, Any]:
+    """Run summarise_era5_land In The Process Pool, Falling Back To A Thread If The Pool Breaks."""
+    global _process_pool
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, summarise_era5_land, paths, window, days_back, point)
+    except BrokenProcessPool as e:
+        print(f"[Era5Stats] Process Pool Unavailable, Using A Thread: {e}")
+        _process_pool = None
+        return await loop.run_in_executor(None, summarise_era5_land, paths, window, days_back, point)
+
+
+__all__ = [
+    "summarise_era5_land",
+    "summarise_era5_land_async",
+    "get_process_pool",
+    "shutdown_process_pool",
+    "DASK_AVAILABLE",
+]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+from Config.Settings import get_settings  # type: ignore
+
+
+@dataclass
+class _Channel:
+    history: Deque[Dict[str, Any]]
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    seq: int = 0
+    closed_at: Optional[float] = None
+
+
+class EventBus:
+    """
+    In-Process Fan-Out Of Workflow Progress Events, One Channel Per Task Or Stream.
+
+    Publishers (OrchestratorAgent, ForecastAgent, TaskManager) Append Stage
+    Events To A Channel; Each Subscriber Gets Its Own Queue. Every Channel
+    Keeps A Bounded History So A Client That Connects After The Work Started,
+    Or Reconnects With Last-Event-ID, Replays What It Missed Before Going Live.
+    Closed Channels Are Kept For retention_seconds And Then Dropped.
+
+    Publishing Never Blocks: A Subscriber Whose Queue Is Full Is Disconnected
+    And Can Resume From Its Last Event Id.
+    """
+
+    def __init__(self, history_size: Optional[int] = None, retention_seconds: Optional[float] = None):
+        settings = get_settings()
+        self.history_size = max(1, history_size or settings.event_history_size)
+        self.retention_seconds = retention_seconds if retention_seconds is not None else settings.event_retention_seconds
+        self._channels: Dict[str, _Channel] = {}
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        for name in [n for n, c in self._channels.items() if c.closed_at is not None and c.closed_at < cutoff]:
+            del self._channels[name]
+
+    def _channel(self, name: str) -> _Channel:
+        channel = self._channels.get(name)
+        if channel is None:
+            self._prune()
+            channel = self._channels[name] = _Channel(history=deque(maxlen=self.history_size))
+        return channel
+
+    def publish(self, name: str, stage: str, data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Append An Event To A Channel And Deliver It To Live Subscribers.
+
+        Returns:
+            The Event ({'Id', 'Stage', 'Timestamp', 'Data'}), Or None If The Channel Is Closed
+        """
+        channel = self._channel(name)
+        if channel.closed_at is not None:
+            return None
+        channel.seq += 1
+        event = {"Id": channel.seq, "Stage": stage, "Timestamp": time.time(), "Data": data or {}}
+        channel.history.append(event)
+        for queue in list(channel.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # The Subscriber Drains What It Has, Then Ends (See subscribe)
+                channel.subscribers.discard(queue)
+        return event
+
+    def close(self, name: str) -> None:
+        """Mark A Channel Finished; Subscribers Stop After Draining What Was Published."""
+        channel = self._channels.get(name)
+        if channel is None or channel.closed_at is not None:
+            return
+        channel.closed_at = time.time()
+        for queue in list(channel.subscribers):
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+        channel.subscribers.clear()
+
+    def exists(self, name: str) -> bool:
+        return name in self._channels
+
+    async def subscribe(self, name: str, after: int = 0, keepalive_seconds: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield A Channel's Events: First The Retained Ones With Id > after, Then Live Ones.
+
+        Ends When The Channel Closes, And Immediately For An Unknown Channel.
+        With keepalive_seconds, None Is Yielded Whenever That Long Passes
+        Without An Event (For SSE Comment Heartbeats).
+        """
+        channel = self._channels.get(name)
+        if channel is None:
+            return
+        # Register Before Replaying So Nothing Published During The Replay Is Missed
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.history_size)
+        backlog = [event for event in channel.history if event["Id"] > after]
+        if channel.closed_at is None:
+            channel.subscribers.add(queue)
+        try:
+            for event in backlog:
+                yield event
+                after = event["Id"]
+            while True:
+                if queue.empty() and queue not in channel.subscribers:
+                    return  # Closed Or Dropped For Falling Behind
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds) if keepalive_seconds else await queue.get()
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                if event["Id"] > after:
+                    yield event
+                    after = event["Id"]
+        finally:
+            channel.subscribers.discard(queue)
+
+
+def format_sse(event: Optional[Dict[str, Any]]) -> str:
+    """
+    Server-Sent Events Frame For An Event (None Gives A Keep-Alive Comment).
+
+    Frames Carry No event: Field, So Browsers Deliver Every Stage To onmessage
+    And Clients Dispatch On The Payload's Stage.
+    """
+    if event is None:
+        return ": keepalive\n\n"
+    payload = json.dumps(event, default=str, separators=(",", ":"))
+    return f"id: {event['Id']}\ndata: {payload}\n\n"
+
+
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+__all__ = ["EventBus", "get_event_bus", "format_sse"]
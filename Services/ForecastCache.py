@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime
+import json
+import time
+import zlib
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+from Services.Era5Jobs import latest_available_day
+from Services.RiskRules import get_risk_rules
+from Services.WeatherCache import next_model_run_expiry
+from Utils.Cache import TtlLruCache
+from Utils.Observability import inc_cache
+
+
+# Result Keys That Belong To The Request Rather Than The Shared Risk Picture
+PERSONAL_KEYS = ("Location", "UserQuery", "ForecastHorizonDays", "MonitoringFrequency")
+
+
+def horizon_bucket(days_ahead: int) -> Tuple[int, int]:
+    """
+    The Horizons The Tools Actually See For A Request.
+
+    Weather Is Capped At 14 Days And Satellite / Copernicus At 30, So Every
+    Horizon Beyond 30 Days Produces The Same Inputs And Shares One Entry.
+    """
+    days = max(int(days_ahead), 1)
+    return min(days, 14), min(days, 30)
+
+
+def _midnight_utc(day: datetime.date) -> float:
+    return datetime.datetime(day.year, day.month, day.day, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class ForecastCache:
+    """
+    Whole-Forecast Result Cache Keyed On (Grid Cell, Horizon, Data Epoch).
+
+    Farms In The Same Snapped Cell Get The Same Tool Inputs, So Their Risk
+    Picture Is Shared Until One Of The Upstream Sources Can Have Changed:
+    A New Weather Model Run, A NASA POWER Refresh, A New ERA5-Land Day, A
+    New Sentinel-2 Revisit Window Or An Edited Rule Table. Each Of Those Is
+    Part Of The Key, And Entries Expire At The Earliest Such Boundary.
+    Values Are Stored As zlib-Compressed JSON To Keep Thousands Of Cells
+    Cheap; Per-Request Fields Are Stripped Before Storing.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        provisional_seconds: Optional[float] = None,
+        cell_degrees: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.forecast_cache_ttl_seconds
+        self.provisional_seconds = (
+            provisional_seconds if provisional_seconds is not None else settings.forecast_cache_provisional_seconds
+        )
+        self.cell_degrees = cell_degrees or settings.forecast_cache_cell_degrees
+        self.run_hours = tuple(int(h) for h in settings.weather_model_run_hours.split(",") if h.strip())
+        self.publish_delay_seconds = settings.weather_model_publish_delay_minutes * 60
+        self.nasa_refresh_seconds = max(1, settings.nasa_power_refresh_seconds)
+        self.revisit_days = max(1, settings.sentinel_revisit_days)
+        self._cache: TtlLruCache[bytes] = TtlLruCache(max_size or settings.forecast_cache_size)
+
+    def cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Grid Cell Index Of A Point."""
+        return int(round(lat / self.cell_degrees)), int(round(lon / self.cell_degrees))
+
+    def epoch(self, now: Optional[float] = None) -> Tuple[Tuple[Any, ...], float]:
+        """
+        Current Freshness Epoch Of Every Upstream Source.
+
+        Returns:
+            (Epoch Tuple For The Key, Unix Time Of The Next Epoch Boundary)
+        """
+        now = time.time() if now is None else now
+        today = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc).date()
+        weather = next_model_run_expiry(now, self.run_hours, self.publish_delay_seconds)
+        nasa = int(now // self.nasa_refresh_seconds)
+        era5 = latest_available_day(today)
+        sentinel = today.toordinal() // self.revisit_days
+        boundaries = (
+            weather,
+            (nasa + 1) * self.nasa_refresh_seconds,
+            _midnight_utc(today + datetime.timedelta(days=1)),
+            _midnight_utc(datetime.date.fromordinal((sentinel + 1) * self.revisit_days)),
+        )
+        return (int(weather), nasa, era5.isoformat(), sentinel, get_risk_rules().fingerprint), min(boundaries)
+
+    def key(
+        self,
+        lat: float,
+        lon: float,
+        days_ahead: int,
+        field: Hashable = None,
+        now: Optional[float] = None,
+    ) -> Tuple[Hashable, float]:
+        """
+        Cache Key For A Forecast And The Time Its Epoch Ends.
+
+        Args:
+            lat, lon: Geocoded Farm Location
+            days_ahead: Requested Horizon
+            field: Per-Field Input That Varies Within A Cell (The Latest NDVI Reading)
+            now: Current Unix Time (Defaults To time.time())
+        """
+        epoch, boundary = self.epoch(now)
+        return (self.cell(lat, lon), horizon_bucket(days_ahead), field, epoch), boundary
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Shared Part Of A Cached Forecast, Or None."""
+        blob = self._cache.get(key)
+        if blob is None:
+            inc_cache("forecast", "miss")
+            return None
+        inc_cache("forecast", "hit")
+        return json.loads(zlib.decompress(blob))
+
+    def put(self, key: Hashable, result: Dict[str, Any], boundary: float, provisional: bool = False) -> None:
+        """
+        Store A Forecast Without Its Per-Request Fields.
+
+        Provisional Results (Missing Sources Or Data Still Downloading) Live
+        Only provisional_seconds So The Complete Picture Replaces Them Soon.
+        """
+        now = time.time()
+        ttl = self.provisional_seconds if provisional else self.ttl_seconds
+        shared = {k: v for k, v in result.items() if k not in PERSONAL_KEYS}
+        blob = zlib.compress(json.dumps(shared, separators=(",", ":")).encode("utf-8"))
+        self._cache.set(key, blob, expires_at=min(boundary, now + ttl))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+_forecast_cache: Optional[ForecastCache] = None
+
+
+def get_forecast_cache() -> ForecastCache:
+    global _forecast_cache
+    if _forecast_cache is None:
+        _forecast_cache = ForecastCache()
+    return _forecast_cache
+
+
+__all__ = ["ForecastCache", "get_forecast_cache", "horizon_bucket", "PERSONAL_KEYS"]
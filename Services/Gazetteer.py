@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import mmap
+import os
+import re
+import struct
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+
+
+# ===== On-Disk Layout =====
+# Header | Records (Sorted By Key, Then Level) | State Table | String Blob
+#
+# Every Section Is Fixed-Width Or Offset-Addressed, So The File Is Used In
+# Place Through mmap: Nothing Is Parsed Into Python Objects At Load Time and
+# All Processes On The Host Share The Same Page-Cache Copy.
+_MAGIC = b"AGGZ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIII")        # magic, version, pad, records, states, states_off, strings_off
+_RECORD = struct.Struct("<IHHffB3x")        # key_off, key_len, state_id, lat, lon, level
+_STATE = struct.Struct("<IH2x")             # name_off, name_len
+
+LEVELS = {"state": 0, "district": 1, "tehsil": 2, "village": 3}
+_LEVEL_NAMES = {v: k for k, v in LEVELS.items()}
+
+# GeoNames Feature Codes Mapped To Administrative Levels
+_GEONAMES_LEVELS = {"ADM1": 0, "ADM2": 1, "ADM3": 2, "ADM4": 3}
+
+_NO_STATE = 0xFFFF
+
+
+def fold_name(text: str) -> str:
+    """
+    Fold A Place Name Into Its Index Key.
+
+    Strips Accents, Lower-Cases, Drops Punctuation And Collapses Whitespace So
+    "Prayagraj", "PRAYAGRAJ" And "Prayāgrāj" Share One Key.
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    text = re.sub(r"[^a-z0-9 ]+", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein Distance With Early Exit Once Every Cell Exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        best = i
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            value = min(previous[j] + 1, current[j - 1] + 1, cost)
+            current.append(value)
+            best = min(best, value)
+        if best > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    name: str
+    state: str
+    level: str
+    lat: float
+    lon: float
+    match: str  # exact | prefix | fuzzy
+
+
+class Gazetteer:
+    """
+    Read-Only Offline Gazetteer Of Indian Places Backed By A Memory-Mapped Index.
+
+    The Index Is A Sorted Array Of Fixed-Width Records, So Exact And Prefix
+    Lookups Are Binary Searches Directly Over The Mapped File (The Same
+    Access Pattern As A Prefix Trie, Without Building One In Memory). When
+    Neither Matches, A Bounded Edit-Distance Scan Over Names Sharing The Same
+    Two-Letter Prefix Catches Common Misspellings.
+
+    Build An Index With:
+        python -m Services.Gazetteer build --csv places.csv --out India.gaz
+        python -m Services.Gazetteer build --geonames IN.txt --admin1 admin1CodesASCII.txt --out India.gaz
+    """
+
+    def __init__(self, path: str):
+        """
+        Map An Index File Into Memory.
+
+        Args:
+            path: Path To A File Produced By build_index()
+
+        Raises:
+            ValueError: If The File Is Not A Gazetteer Index
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, states, states_off, strings_off = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"Not A Gazetteer Index: {path}")
+        self._count = count
+        self._records_off = _HEADER.size
+        self._strings_off = strings_off
+        self._states: List[str] = []
+        for i in range(states):
+            off, length = _STATE.unpack_from(self._mm, states_off + i * _STATE.size)
+            self._states.append(self._string(off, length))
+        self._state_ids = {name: i for i, name in enumerate(self._states)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mm.close()
+
+    # ===== Low-Level Access =====
+
+    def _string(self, off: int, length: int) -> str:
+        start = self._strings_off + off
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _record(self, i: int) -> Tuple[str, int, float, float, int]:
+        key_off, key_len, state_id, lat, lon, level = _RECORD.unpack_from(self._mm, self._records_off + i * _RECORD.size)
+        return self._string(key_off, key_len), state_id, lat, lon, level
+
+    def _key(self, i: int) -> str:
+        key_off, key_len = struct.unpack_from("<IH", self._mm, self._records_off + i * _RECORD.size)
+        return self._string(key_off, key_len)
+
+    def _lower_bound(self, key: str) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _match(self, i: int, kind: str) -> GazetteerMatch:
+        key, state_id, lat, lon, level = self._record(i)
+        state = self._states[state_id] if state_id != _NO_STATE else ""
+        return GazetteerMatch(key, state, _LEVEL_NAMES.get(level, "village"), round(lat, 5), round(lon, 5), kind)
+
+    def _best(self, indices: Iterable[int], state_id: Optional[int]) -> Optional[int]:
+        best, best_rank = None, None
+        for i in indices:
+            key, sid, _, _, level = self._record(i)
+            if state_id is not None and sid != state_id:
+                continue
+            rank = (level, len(key))
+            if best_rank is None or rank < best_rank:
+                best, best_rank = i, rank
+        return best
+
+    # ===== Lookup =====
+
+    def lookup(
+        self,
+        name: str,
+        state: Optional[str] = None,
+        prefix: bool = True,
+        fuzzy: bool = True,
+        max_scan: int = 5000,
+    ) -> Optional[GazetteerMatch]:
+        """
+        Resolve A Place Name, Optionally Restricted To A State.
+
+        Exact Matches Win, Preferring Higher Administrative Levels (State, Then
+        District, Tehsil, Village). Otherwise A Unique-Prefix Match Is Tried For
+        Queries Of Four Or More Characters, Then An Edit-Distance Fallback.
+        Prefix And Fuzzy Matches Are Guesses (A Village Missing From The Index
+        Resolves To A Similarly Named Town), So Callers That Can Ask A Remote
+        Service Should Use Them Only When That Fails.
+
+        Args:
+            name: Place Name As Typed By The Farmer
+            state: Optional State Name To Disambiguate Duplicates
+            prefix: Allow The Unique-Prefix Pass
+            fuzzy: Allow The Edit-Distance Fallback
+            max_scan: Upper Bound On Records Examined By Prefix/Fuzzy Passes
+
+        Returns:
+            GazetteerMatch Or None When Nothing Matches
+        """
+        key = fold_name(name)
+        if not key or self._count == 0:
+            return None
+        state_id = None
+        if state:
+            state_id = self._state_ids.get(fold_name(state))
+            if state_id is None:
+                return None
+
+        # Exact
+        start = self._lower_bound(key)
+        end = start
+        while end < self._count and self._key(end) == key:
+            end += 1
+        best = self._best(range(start, end), state_id)
+        if best is not None:
+            return self._match(best, "exact")
+
+        # Prefix ("prayag" → "prayagraj"), Only When A Single Name Carries It
+        if prefix and len(key) >= 4:
+            stop = min(self._lower_bound(key + "\x7f"), start + max_scan)
+            candidates = [i for i in range(start, stop) if state_id is None or self._record(i)[1] == state_id]
+            if candidates and len({self._key(i) for i in candidates}) == 1:
+                return self._match(self._best(candidates, state_id), "prefix")
+
+        # Fuzzy Over Names Sharing The First Two Letters
+        if not fuzzy or len(key) < 3:
+            return None
+        limit = 1 if len(key) <= 5 else 2
+        lo = self._lower_bound(key[:2])
+        hi = min(self._lower_bound(key[:2] + "\x7f"), lo + max_scan)
+        best, best_rank = None, None
+        for i in range(lo, hi):
+            candidate, sid, _, _, level = self._record(i)
+            if state_id is not None and sid != state_id:
+                continue
+            distance = _edit_distance(key, candidate, limit)
+            if distance > limit:
+                continue
+            rank = (distance, level, len(candidate))
+            if best_rank is None or rank < best_rank:
+                best, best_rank = i, rank
+        return self._match(best, "fuzzy") if best is not None else None
+
+
+# ===== Index Construction =====
+
+def build_index(rows: Iterable[Tuple[str, str, int, float, float]], out_path: str) -> int:
+    """
+    Write A Gazetteer Index File.
+
+    Args:
+        rows: Iterable Of (Name, State, Level, Latitude, Longitude)
+        out_path: Destination File (Written Atomically)
+
+    Returns:
+        Number Of Records Written
+    """
+    states: Dict[str, int] = {}
+    entries = {}
+    for name, state, level, lat, lon in rows:
+        key = fold_name(name)
+        if not key:
+            continue
+        state_key = fold_name(state) if state else ""
+        state_id = states.setdefault(state_key, len(states)) if state_key else _NO_STATE
+        # Keep One Entry Per (Name, State, Level)
+        entries.setdefault((key, level, state_id), (float(lat), float(lon)))
+
+    blob = bytearray()
+    offsets: Dict[str, int] = {}
+
+    def intern(text: str) -> Tuple[int, int]:
+        if text not in offsets:
+            offsets[text] = len(blob)
+            blob.extend(text.encode("utf-8"))
+        return offsets[text], len(text.encode("utf-8"))
+
+    ordered = sorted(entries.items(), key=lambda item: (item[0][0], item[0][1]))
+    records = bytearray()
+    for (key, level, state_id), (lat, lon) in ordered:
+        off, length = intern(key)
+        records.extend(_RECORD.pack(off, length, state_id, lat, lon, level))
+
+    state_table = bytearray()
+    for name, _ in sorted(states.items(), key=lambda item: item[1]):
+        off, length = intern(name)
+        state_table.extend(_STATE.pack(off, length))
+
+    states_off = _HEADER.size + len(records)
+    strings_off = states_off + len(state_table)
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, len(ordered), len(states), states_off, strings_off)
+
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = f"{out_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(records)
+        f.write(state_table)
+        f.write(blob)
+    os.replace(tmp_path, out_path)
+    return len(ordered)
+
+
+def read_csv_rows(path: str) -> Iterable[Tuple[str, str, int, float, float]]:
+    """
+    Read Places From A CSV With Columns name, state, level, lat, lon.
+
+    The level Column Accepts state / district / tehsil / village Or 0-3.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                raw_level = (row.get("level") or "village").strip().lower()
+                level = int(raw_level) if raw_level.isdigit() else LEVELS[raw_level]
+                yield row["name"], row.get("state", ""), level, float(row["lat"]), float(row["lon"])
+            except (KeyError, ValueError):
+                continue
+
+
+def read_geonames_rows(path: str, admin1_path: Optional[str] = None) -> Iterable[Tuple[str, str, int, float, float]]:
+    """
+    Read Places From A GeoNames Country Dump (E.g. IN.txt).
+
+    Administrative Divisions (ADM1-ADM4) Keep Their Level; Populated Places
+    (Feature Class P) Are Indexed As Villages. State Names Are Taken From
+    admin1CodesASCII.txt When Provided.
+    """
+    admin1: Dict[str, str] = {}
+    if admin1_path:
+        with open(admin1_path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) >= 2 and parts[0].startswith("IN."):
+                    admin1[parts[0][3:]] = parts[1]
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 11:
+                continue
+            feature_class, feature_code = parts[6], parts[7]
+            if feature_class == "A" and feature_code in _GEONAMES_LEVELS:
+                level = _GEONAMES_LEVELS[feature_code]
+            elif feature_class == "P":
+                level = LEVELS["village"]
+            else:
+                continue
+            state = admin1.get(parts[10], "")
+            try:
+                lat, lon = float(parts[4]), float(parts[5])
+            except ValueError:
+                continue
+            yield parts[1], state, level, lat, lon
+            if parts[2] and parts[2] != parts[1]:
+                yield parts[2], state, level, lat, lon
+
+
+# Singleton Accessor
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """
+    Return The Process-Wide Gazetteer, Or None When No Index Is Configured.
+    """
+    global _gazetteer, _gazetteer_loaded
+    if not _gazetteer_loaded:
+        _gazetteer_loaded = True
+        path = get_settings().gazetteer_path
+        if path and os.path.exists(path):
+            try:
+                _gazetteer = Gazetteer(path)
+                print(f"[Gazetteer] Loaded {len(_gazetteer)} Places From {path}")
+            except (OSError, ValueError) as e:
+                print(f"[Gazetteer] Failed To Load {path}: {e}")
+    return _gazetteer
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build The Offline Indian Gazetteer Index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build An Index From A CSV Or GeoNames Dump")
+    build.add_argument("--csv", help="CSV With name,state,level,lat,lon Columns")
+    build.add_argument("--geonames", help="GeoNames Country Dump (IN.txt)")
+    build.add_argument("--admin1", help="GeoNames admin1CodesASCII.txt For State Names")
+    build.add_argument("--out", default=get_settings().gazetteer_path, help="Output Index Path")
+    lookup = sub.add_parser("lookup", help="Query An Existing Index")
+    lookup.add_argument("name")
+    lookup.add_argument("--state")
+    lookup.add_argument("--index", default=get_settings().gazetteer_path)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if args.csv:
+            rows = read_csv_rows(args.csv)
+        elif args.geonames:
+            rows = read_geonames_rows(args.geonames, args.admin1)
+        else:
+            parser.error("Provide --csv Or --geonames")
+        count = build_index(rows, args.out)
+        print(f"Wrote {count} Places To {args.out}")
+    else:
+        print(Gazetteer(args.index).lookup(args.name, args.state))
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["Gazetteer", "GazetteerMatch", "get_gazetteer", "build_index", "fold_name"]
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+from Services.Gazetteer import get_gazetteer
+from Services.HttpClient import USER_AGENT, get_http_client
+from Utils.Cache import TtlLruCache
+from Utils.Observability import inc_cache
+from Utils.SingleFlight import get_singleflight
+
+
+GeocodeResult = Tuple[float, float] | Dict[str, Any]
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+OPENWEATHER_GEO_URL = "http://api.openweathermap.org/geo/1.0/direct"
+
+# Indian States And Union Territories, Used To Recognise Trailing Qualifiers
+INDIAN_STATES = frozenset([
+    "andhra pradesh", "arunachal pradesh", "assam", "bihar", "chhattisgarh", "goa",
+    "gujarat", "haryana", "himachal pradesh", "jharkhand", "karnataka", "kerala",
+    "madhya pradesh", "maharashtra", "manipur", "meghalaya", "mizoram", "nagaland",
+    "odisha", "orissa", "punjab", "rajasthan", "sikkim", "tamil nadu", "telangana",
+    "tripura", "uttar pradesh", "uttarakhand", "west bengal",
+    "andaman and nicobar islands", "chandigarh", "dadra and nagar haveli and daman and diu",
+    "delhi", "new delhi", "jammu and kashmir", "ladakh", "lakshadweep", "puducherry",
+])
+
+_COUNTRY_TOKENS = frozenset(["india", "bharat", "in"])
+_MISS = object()
+
+
+def parse_coordinates(location: str) -> Optional[Tuple[float, float]]:
+    """
+    Parse A "lat,lon" String Into A Coordinate Pair.
+
+    Args:
+        location: Raw Location String
+
+    Returns:
+        (Latitude, Longitude) If The String Is A Valid Coordinate Pair, Else None
+    """
+    parts = location.split(',')
+    if len(parts) != 2:
+        return None
+    try:
+        lat = float(parts[0].strip())
+        lon = float(parts[1].strip())
+    except ValueError:
+        return None
+    if -90 <= lat <= 90 and -180 <= lon <= 180:
+        return lat, lon
+    return None
+
+
+def normalise_location(location: str) -> str:
+    """
+    Build A Canonical Cache Key For A Free-Text Location.
+
+    Lower-Cases, Collapses Whitespace, Strips Punctuation And Drops Country
+    Tokens, So "Pune", "pune " And "Pune, India" Share One Key. State Names
+    Are Kept As A Trailing Qualifier ("pune|maharashtra") Because The Same
+    Place Name Exists In Several States.
+
+    Args:
+        location: Raw Location String
+
+    Returns:
+        Canonical Key, Or An Empty String If Nothing Usable Remains
+    """
+    text = re.sub(r"\s+", " ", location.strip().lower())
+    parts = [re.sub(r"[^\w\s&-]", "", p).strip() for p in text.split(',')]
+    parts = [p for p in parts if p and p not in _COUNTRY_TOKENS]
+    if not parts:
+        return ""
+    return "|".join(parts)
+
+
+def _state_alias(key: str) -> Optional[str]:
+    """Return The Bare Place Key For "place|state" Keys, Else None."""
+    parts = key.split("|")
+    if len(parts) == 2 and parts[1] in INDIAN_STATES:
+        return parts[0]
+    return None
+
+
+class Geocoder:
+    """
+    Shared Geocoding Service With A Two-Level Cache.
+
+    Resolves Place Names To Coordinates Once And Reuses The Answer Across Every
+    Tool And Request. Lookups Go Through An In-Memory LRU First, Then A SQLite
+    Store That Survives Restarts And Is Shared By All Processes On The Host,
+    Then Exact Names In The Offline Gazetteer (When An Index Is Installed), And
+    Only Then Hit OpenStreetMap Nominatim (With OpenWeatherMap As Fallback).
+    Prefix And Fuzzy Gazetteer Matches Are Used Only When Those Services
+    Cannot Resolve The Place.
+
+    Successful Lookups Are Kept For geocode_ttl_seconds (Approximate Gazetteer
+    Matches Only For geocode_approximate_ttl_seconds); Places That Nominatim
+    Could Not Resolve Are Remembered For geocode_negative_ttl_seconds So That
+    Repeated Typos Do Not Keep Hitting The Public Service. Transient Network
+    Failures Are Never Cached.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        negative_ttl_seconds: Optional[int] = None,
+        approximate_ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Initialize The Geocoder.
+
+        Args:
+            db_path: SQLite File Path (Defaults To <cache_dir>/geocode.sqlite3)
+            max_size: In-Memory LRU Capacity
+            ttl_seconds: Lifetime Of Successful Lookups
+            negative_ttl_seconds: Lifetime Of "Not Found" Lookups
+            approximate_ttl_seconds: Lifetime Of Prefix/Fuzzy Gazetteer Fallbacks
+        """
+        settings = get_settings()
+        self.db_path = db_path or os.path.join(settings.cache_dir, "geocode.sqlite3")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.geocode_ttl_seconds
+        self.negative_ttl_seconds = (
+            negative_ttl_seconds if negative_ttl_seconds is not None else settings.geocode_negative_ttl_seconds
+        )
+        self.approximate_ttl_seconds = (
+            approximate_ttl_seconds if approximate_ttl_seconds is not None else settings.geocode_approximate_ttl_seconds
+        )
+        self._memory: TtlLruCache[Optional[Tuple[float, float]]] = TtlLruCache(
+            max_size or settings.geocode_cache_size
+        )
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._db_failed = False
+
+    # ===== Persistent Store =====
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._db is not None or self._db_failed:
+            return self._db
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                " key TEXT PRIMARY KEY, lat REAL, lon REAL, expires_at REAL NOT NULL, source TEXT)"
+            )
+            conn.commit()
+            self._db = conn
+        except sqlite3.Error as e:
+            print(f"[Geocoder] Persistent Cache Disabled: {e}")
+            self._db_failed = True
+        return self._db
+
+    def _disk_get(self, key: str) -> Any:
+        """Blocking Read Of A Live Row: (Value, ExpiresAt) Or _MISS. Call Through asyncio.to_thread."""
+        with self._db_lock:
+            conn = self._connection()
+            if conn is None:
+                return _MISS
+            try:
+                row = conn.execute(
+                    "SELECT lat, lon, expires_at FROM geocode WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return _MISS
+        if row is None or row[2] <= time.time():
+            return _MISS
+        return (None if row[0] is None else (float(row[0]), float(row[1]))), row[2]
+
+    def _disk_put(self, key: str, value: Optional[Tuple[float, float]], expires_at: float, source: str, replace: bool = True) -> None:
+        """Blocking Write (Waits Up To 5 s On A Locked Database). Call Through asyncio.to_thread."""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        lat, lon = value if value is not None else (None, None)
+        with self._db_lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    f"{verb} INTO geocode (key, lat, lon, expires_at, source) VALUES (?, ?, ?, ?, ?)",
+                    (key, lat, lon, expires_at, source),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"[Geocoder] Persistent Cache Write Failed: {e}")
+
+    def _disk_put_many(self, writes: List[Tuple[str, Optional[Tuple[float, float]], float, str, bool]]) -> None:
+        for key, value, expires_at, source, replace in writes:
+            self._disk_put(key, value, expires_at, source, replace=replace)
+
+    # ===== Cache Access =====
+
+    async def _lookup(self, key: str) -> Any:
+        """
+        Return The Cached Value For A Canonical Key Without Any Network Call.
+
+        Memory Hits Return Directly; The SQLite Read Runs In A Worker Thread.
+
+        Returns:
+            (Lat, Lon) For A Positive Hit, None For A Negative Hit, Or _MISS
+        """
+        entry = self._memory.get_entry(key)
+        if entry is not None:
+            inc_cache("geocode", "hit" if entry.value is not None else "negative_hit")
+            return entry.value
+        found = await asyncio.to_thread(self._disk_get, key)
+        if found is not _MISS:
+            value, expires_at = found
+            self._memory.set(key, value, expires_at=expires_at)
+            inc_cache("geocode", "disk_hit" if value is not None else "negative_hit")
+            return value
+        inc_cache("geocode", "miss")
+        return _MISS
+
+    async def store(self, key: str, value: Optional[Tuple[float, float]], source: str, ttl: Optional[float] = None) -> None:
+        """
+        Cache A Lookup Result Under Its Key.
+
+        State-Qualified Keys ("pune|maharashtra") Also Seed The Bare Place Key
+        ("pune") When It Is Not Yet Known, So Later Unqualified Lookups Reuse
+        The Answer Instead Of Going Back To The Network. Results Stored With
+        An Explicit (Short) ttl Are Guesses And Do Not Seed The Bare Key.
+        The Memory Cache Updates Immediately; SQLite Writes Run In A Worker Thread.
+        """
+        if ttl is None:
+            ttl = self.ttl_seconds if value is not None else self.negative_ttl_seconds
+            seed = value is not None
+        else:
+            seed = False
+        expires_at = time.time() + ttl
+        self._memory.set(key, value, expires_at=expires_at)
+        writes = [(key, value, expires_at, source, True)]
+
+        bare = _state_alias(key)
+        if seed and bare and self._memory.get_entry(bare) is None:
+            self._memory.set(bare, value, expires_at=expires_at)
+            writes.append((bare, value, expires_at, source, False))
+        await asyncio.to_thread(self._disk_put_many, writes)
+
+    # ===== Resolution =====
+
+    async def geocode(self, location: str) -> GeocodeResult:
+        """
+        Resolve A Location String To (Latitude, Longitude).
+
+        Args:
+            location: Place Name, Address, Or "lat,lon" Pair
+
+        Returns:
+            Tuple Of (Latitude, Longitude) On Success, Or An Error Dictionary
+            With Status And Message If The Location Could Not Be Resolved
+        """
+        coords = parse_coordinates(location)
+        if coords is not None:
+            return coords
+
+        key = normalise_location(location)
+        if not key:
+            return {'Status': 'Error', 'Message': 'Empty Location', 'Location': location}
+
+        cached = await self._lookup(key)
+        if cached is not _MISS:
+            if cached is None:
+                return self._not_found(location)
+            return cached
+
+        offline = self._resolve_offline(key)
+        if offline is not None:
+            self._memory.set(key, offline, ttl=self.ttl_seconds)
+            return offline
+
+        # Concurrent Requests For The Same Place Share One Remote Lookup
+        value = await get_singleflight().do("geocode", key, lambda: self._resolve_and_store(key, location))
+        if value is None:
+            return self._not_found(location)
+        return value
+
+    async def _resolve_and_store(self, key: str, location: str) -> Optional[Tuple[float, float]]:
+        value, source, definitive = await self._resolve_remote(location)
+        if value is None:
+            # Remote Lookup Failed: Fall Back To A Close Gazetteer Name, Briefly Cached
+            approximate = await self._resolve_approximate(key)
+            if approximate is not None:
+                await self.store(key, approximate, 'Gazetteer', ttl=self.approximate_ttl_seconds)
+                return approximate
+        if value is not None or definitive:
+            await self.store(key, value, source)
+        if value is not None:
+            print(f"[Geocoder] Geocoded '{location}' → ({value[0]:.4f}, {value[1]:.4f}) Via {source}")
+        return value
+
+    @staticmethod
+    def _not_found(location: str) -> Dict[str, Any]:
+        return {
+            'Status': 'Error',
+            'Message': 'Geocoding Failed. Provide Coordinates Like "lat,lon" Or A Resolvable Place Name.',
+            'Location': location
+        }
+
+    @staticmethod
+    def _resolve_offline(key: str, approximate: bool = False) -> Optional[Tuple[float, float]]:
+        """
+        Resolve A Canonical Key Against The Offline Gazetteer.
+
+        The First Component Is The Place Name; A Trailing Indian State Is Used
+        To Disambiguate Places That Share A Name Across States. Only Exact
+        Names Match Unless approximate Is Set, Which Allows Prefix And Fuzzy
+        Matches But Nothing Exact (That Was Tried First).
+        """
+        gazetteer = get_gazetteer()
+        if gazetteer is None:
+            return None
+        parts = key.split("|")
+        state = parts[-1] if len(parts) > 1 and parts[-1] in INDIAN_STATES else None
+        match = gazetteer.lookup(parts[0], state=state, prefix=approximate, fuzzy=approximate)
+        if match is None or (approximate and match.match == "exact"):
+            inc_cache("gazetteer", "miss")
+            return None
+        inc_cache("gazetteer", match.match)
+        print(f"[Geocoder] Resolved '{key}' Offline → {match.name}, {match.state or 'India'} ({match.level}, {match.match})")
+        return match.lat, match.lon
+
+    async def _resolve_approximate(self, key: str) -> Optional[Tuple[float, float]]:
+        """Prefix/Fuzzy Gazetteer Match, Scanned Off The Event Loop."""
+        return await asyncio.to_thread(self._resolve_offline, key, True)
+
+    async def _resolve_remote(self, location: str) -> Tuple[Optional[Tuple[float, float]], str, bool]:
+        """
+        Query The Public Geocoders.
+
+        Returns:
+            (Coordinates Or None, Source Name, Definitive) Where Definitive Is True
+            Only When A Service Answered Successfully With No Match
+        """
+        search = location if 'india' in location.lower() else f"{location}, India"
+        definitive = False
+
+        async with get_http_client().borrow() as session:
+            try:
+                params = {'q': search, 'format': 'json', 'limit': 1, 'countrycodes': 'in'}
+                headers = {'User-Agent': USER_AGENT}
+                async with session.get(NOMINATIM_URL, params=params, headers=headers, timeout=8) as resp:
+                    if resp.status == 200:
+                        data = await resp.json()
+                        if data:
+                            return (float(data[0]['lat']), float(data[0]['lon'])), 'Nominatim', True
+                        definitive = True
+            except Exception as e:
+                print(f"[Geocoder] Nominatim Geocoding Failed: {e}")
+
+            key = os.getenv('OPENWEATHER_API_KEY', '')
+            if key:
+                try:
+                    params = {'q': search, 'limit': 1, 'appid': key}
+                    async with session.get(OPENWEATHER_GEO_URL, params=params, timeout=8) as resp:
+                        if resp.status == 200:
+                            data = await resp.json()
+                            if data:
+                                return (float(data[0]['lat']), float(data[0]['lon'])), 'OpenWeatherMap', True
+                except Exception as e:
+                    print(f"[Geocoder] OpenWeatherMap Geocoding Failed: {e}")
+
+        return None, 'None', definitive
+
+
+# Singleton Accessor
+_geocoder: Optional[Geocoder] = None
+
+
+def get_geocoder() -> Geocoder:
+    global _geocoder
+    if _geocoder is None:
+        _geocoder = Geocoder()
+    return _geocoder
+
+
+__all__ = ["Geocoder", "get_geocoder", "parse_coordinates", "normalise_location", "INDIAN_STATES"]
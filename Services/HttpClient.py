@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from Config.Settings import get_settings  # type: ignore
+
+
+USER_AGENT = "AgriSenseGuardian/1.0"
+
+
+class HttpClient:
+    """
+    Process-Wide Pooled HTTP Client.
+
+    Owns A Single aiohttp.ClientSession Per Event Loop So Every Tool Reuses
+    Keep-Alive Connections Instead Of Paying A Fresh DNS Lookup And TCP/TLS
+    Handshake On Each Call. The Connector Caps Total And Per-Host Concurrency
+    (So A Burst Cannot Open Hundreds Of Sockets To One Upstream) And Caches
+    DNS Answers; A Default ClientTimeout Applies Wherever A Call Does Not Set
+    Its Own.
+
+    The Web App Starts And Closes The Client In Main.Lifespan. A2A Agent
+    Processes Create It Lazily On First Use.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        dns_ttl_seconds: Optional[int] = None,
+        keepalive_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        connect_timeout_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.limit = limit if limit is not None else settings.http_pool_size
+        self.limit_per_host = limit_per_host if limit_per_host is not None else settings.http_pool_per_host
+        self.dns_ttl_seconds = dns_ttl_seconds if dns_ttl_seconds is not None else settings.http_dns_ttl_seconds
+        self.keepalive_seconds = keepalive_seconds if keepalive_seconds is not None else settings.http_keepalive_seconds
+        self.timeout = aiohttp.ClientTimeout(
+            total=timeout_seconds if timeout_seconds is not None else settings.http_timeout_seconds,
+            connect=connect_timeout_seconds if connect_timeout_seconds is not None else settings.http_connect_timeout_seconds,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_ttl_seconds,
+            keepalive_timeout=self.keepalive_seconds,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={'User-Agent': USER_AGENT},
+        )
+
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Return The Pooled Session For The Running Event Loop.
+
+        A Session Is Bound To The Loop That Created It, So A New One Is Made
+        If The Previous Session Was Closed Or Belongs To Another Loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self._create()
+            self._loop = loop
+        return self._session
+
+    @asynccontextmanager
+    async def borrow(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Use The Pooled Session In An "async with" Block Without Closing It.
+
+        Drop-In Replacement For "async with aiohttp.ClientSession() as s".
+        """
+        yield self.session()
+
+    async def start(self) -> None:
+        """Create The Session Eagerly (Called From Main.Lifespan)."""
+        self.session()
+        print(f"[HttpClient] Pool Ready (Limit {self.limit}, Per Host {self.limit_per_host}, DNS TTL {self.dns_ttl_seconds}s)")
+
+    async def close(self) -> None:
+        """Close The Session And Release Pooled Connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+# Singleton Accessor
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
+
+
+__all__ = ["HttpClient", "get_http_client", "USER_AGENT"]
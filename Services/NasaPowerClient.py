@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from Config.Settings import get_settings  # type: ignore
+from Services.HttpClient import get_http_client
+from Services.PowerGridStore import Cell, PowerGridStore, get_power_grid_store, snap_to_grid
+from Utils.Observability import inc_cache
+from Utils.SingleFlight import get_singleflight
+
+
+POWER_URL = "https://power.larc.nasa.gov/api/temporal/{resolution}/point"
+
+# Canonical Parameter Sets: The Union Of Everything Any Tool Asks For, So One
+# Request Per Resolution Serves SatelliteTool, The Copernicus Fallback And
+# SoilTestTool Alike
+DAILY_PARAMETERS = (
+    "ALLSKY_SFC_SW_DWN", "PRECTOTCORR", "T2M", "T2M_MAX", "T2M_MIN", "RH2M", "WS2M",
+    "GWETTOP", "GWETROOT",
+)
+MONTHLY_PARAMETERS = (
+    "GWETROOT", "GWETTOP", "T2M_MAX", "T2M_MIN", "PRECTOTCORR", "RH2M", "T2M", "WS2M",
+)
+
+ParameterSeries = Dict[str, Dict[str, float]]
+
+
+class NasaPowerError(RuntimeError):
+    """Raised When NASA POWER Returns No Usable Data."""
+
+
+def _parse_parameters(data: Dict[str, Any]) -> ParameterSeries:
+    """
+    Extract {Parameter: {DateKey: Value}} From A POWER Point Response.
+
+    The Series Live Under properties.parameter (The Top-Level "parameters"
+    Key Is Only Metadata). Fill Values (-999) Are Dropped.
+    """
+    series = (data.get('properties') or {}).get('parameter')
+    if not isinstance(series, dict) or not series:
+        raise NasaPowerError(data.get('messages') or data.get('message') or 'NASA POWER Response Has No Data')
+    fill = (data.get('header') or {}).get('fill_value', -999)
+    return {
+        name: {k: float(v) for k, v in values.items() if v is not None and v != fill and v > -990}
+        for name, values in series.items()
+        if isinstance(values, dict)
+    }
+
+
+def _shift(key: int, days: int) -> int:
+    date = datetime.datetime.strptime(str(key), '%Y%m%d') + datetime.timedelta(days=days)
+    return int(date.strftime('%Y%m%d'))
+
+
+class NasaPowerClient:
+    """
+    Consolidated NASA POWER Client.
+
+    Every Tool That Needs POWER Data For A Point Goes Through This Client,
+    Which Snaps The Point To Its POWER Grid Cell, Always Requests The
+    Canonical Parameter Union For The Resolution, And Keeps The Result In The
+    Local Columnar Grid Store. Each Caller Gets A Slice, So A Forecast That
+    Needs Daily Weather, The Copernicus Fallback And Soil Data Costs At Most
+    One Daily And One Monthly Request, And Every Other Farm In The Same Cell
+    Is Served From Disk With No Network Traffic.
+
+    Only Missing Days Are Fetched: Earlier Days Before The Stored Range, And
+    Days After The Last Published Value Once nasa_power_refresh_seconds Have
+    Passed Since The Previous Fetch. Concurrent Callers Share The In-Flight
+    Request For A Cell.
+    """
+
+    def __init__(self, store: Optional[PowerGridStore] = None, refresh_seconds: Optional[int] = None, daily_window_days: Optional[int] = None):
+        settings = get_settings()
+        self.store = store or get_power_grid_store()
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else settings.nasa_power_refresh_seconds
+        self.daily_window_days = daily_window_days if daily_window_days is not None else settings.nasa_power_daily_window_days
+
+    async def _request(self, resolution: str, lat: float, lon: float, parameters: Iterable[str], start: str, end: str) -> ParameterSeries:
+        params = {
+            'parameters': ','.join(parameters),
+            'community': 'AG',
+            'longitude': lon,
+            'latitude': lat,
+            'start': start,
+            'end': end,
+            'format': 'JSON',
+        }
+        print(f"[NasaPowerClient] Fetching {resolution} {start}-{end} For Cell {lat:.3f}, {lon:.3f}")
+        async with get_http_client().borrow() as session:
+            async with session.get(POWER_URL.format(resolution=resolution), params=params, timeout=60) as response:
+                if response.status != 200:
+                    raise NasaPowerError(f'NASA POWER HTTP {response.status}')
+                data = await response.json(content_type=None)
+        return _parse_parameters(data)
+
+    def _stale(self, meta: Dict[str, Any]) -> bool:
+        return time.time() - float(meta.get('FetchedAt') or 0) >= self.refresh_seconds
+
+    # ===== Gap Detection =====
+
+    def _daily_gaps(self, cell: Cell, start: int, end: int) -> List[Tuple[int, int]]:
+        data = self.store.load(cell, 'daily', DAILY_PARAMETERS)
+        if data is None or data.shape[1] == 0:
+            floor = min(start, _shift(end, -self.daily_window_days))
+            return [(floor, end)]
+        meta = self.store.meta(cell, 'daily', DAILY_PARAMETERS)
+        first = int(data[0, 0])
+        last = int(meta.get('LastComplete') or data[0, -1])
+        gaps = []
+        if start < first:
+            gaps.append((start, _shift(first, -1)))
+        if end > last and self._stale(meta):
+            gaps.append((_shift(last, 1), end))
+        return gaps
+
+    def _monthly_gaps(self, cell: Cell, start_year: int, end_year: int) -> List[Tuple[int, int]]:
+        data = self.store.load(cell, 'monthly', MONTHLY_PARAMETERS)
+        stored = set() if data is None else {int(k) // 100 for k in data[0]}
+        missing = [y for y in range(start_year, end_year + 1) if y not in stored]
+        current = datetime.date.today().year
+        if not missing and end_year >= current and self._stale(self.store.meta(cell, 'monthly', MONTHLY_PARAMETERS)):
+            missing = [max(start_year, current)]
+        return [(min(missing), max(missing))] if missing else []
+
+    # ===== Filling =====
+
+    async def _fill(self, resolution: str, cell: Cell, gaps: List[Tuple[int, int]]) -> None:
+        canonical = DAILY_PARAMETERS if resolution == 'daily' else MONTHLY_PARAMETERS
+        results = await asyncio.gather(*[
+            self._request(resolution, cell[0], cell[1], canonical, str(lo), str(hi)) for lo, hi in gaps
+        ])
+        merged: ParameterSeries = {}
+        for series in results:
+            for name, values in series.items():
+                merged.setdefault(name, {}).update(values)
+        await asyncio.to_thread(self.store.merge, cell, resolution, canonical, merged)
+
+    async def _ensure(self, resolution: str, cell: Cell, find_gaps) -> None:
+        gaps = find_gaps()
+        if not gaps:
+            inc_cache("nasa_power", "hit")
+            return
+        inc_cache("nasa_power", "miss")
+        canonical = DAILY_PARAMETERS if resolution == 'daily' else MONTHLY_PARAMETERS
+        try:
+            # Every Fill For A Cell Goes Through The Flight, So Two Merges Never Race On Its Array.
+            # A Caller That Joined Another Window's Fill Checks Again; One That Led Stops, Since
+            # Anything Still Missing Is What POWER Did Not Return.
+            while gaps:
+                led = False
+
+                async def fill(gaps=gaps) -> None:
+                    nonlocal led
+                    led = True
+                    await self._fill(resolution, cell, gaps)
+
+                await get_singleflight().do("nasa_power", (resolution, cell), fill)
+                if led:
+                    break
+                gaps = find_gaps()
+        except Exception as e:
+            # Serve What The Store Already Has Rather Than Failing The Forecast
+            if self.store.load(cell, resolution, canonical) is None:
+                raise
+            print(f"[NasaPowerClient] Refresh Failed For Cell {cell}, Serving Stored Data: {e}")
+
+    # ===== Public API =====
+
+    async def daily(self, lat: float, lon: float, start: datetime.date, end: datetime.date, parameters: Iterable[str] = DAILY_PARAMETERS) -> ParameterSeries:
+        """
+        Daily Series For A Point, Sliced To [start, end] And The Requested Parameters.
+
+        Raises:
+            NasaPowerError: If POWER Returns No Usable Data
+        """
+        cell = snap_to_grid(lat, lon)
+        start_key, end_key = int(start.strftime('%Y%m%d')), int(end.strftime('%Y%m%d'))
+        await self._ensure('daily', cell, lambda: self._daily_gaps(cell, start_key, end_key))
+        data = self.store.load(cell, 'daily', DAILY_PARAMETERS)
+        if data is None:
+            raise NasaPowerError('NASA POWER Cache Unavailable')
+        return self.store.slice(data, DAILY_PARAMETERS, list(parameters), start_key, end_key)
+
+    async def monthly(self, lat: float, lon: float, start_year: int, end_year: int, parameters: Iterable[str] = MONTHLY_PARAMETERS) -> ParameterSeries:
+        """
+        Monthly Series (Including POWER's Annual "YYYY13" Entry) For A Point.
+
+        Raises:
+            NasaPowerError: If POWER Returns No Usable Data
+        """
+        cell = snap_to_grid(lat, lon)
+        await self._ensure('monthly', cell, lambda: self._monthly_gaps(cell, start_year, end_year))
+        data = self.store.load(cell, 'monthly', MONTHLY_PARAMETERS)
+        if data is None:
+            raise NasaPowerError('NASA POWER Cache Unavailable')
+        return self.store.slice(data, MONTHLY_PARAMETERS, list(parameters), start_year * 100 + 1, end_year * 100 + 13)
+
+
+# Singleton Accessor
+_nasa_power_client: Optional[NasaPowerClient] = None
+
+
+def get_nasa_power_client() -> NasaPowerClient:
+    global _nasa_power_client
+    if _nasa_power_client is None:
+        _nasa_power_client = NasaPowerClient()
+    return _nasa_power_client
+
+
+__all__ = ["NasaPowerClient", "NasaPowerError", "get_nasa_power_client", "DAILY_PARAMETERS", "MONTHLY_PARAMETERS"]
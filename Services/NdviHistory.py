@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import glob
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+import numpy as np
+
+from Config.Settings import get_settings  # type: ignore
+from Services.SentinelHub import SentinelHubClient, SentinelHubError, SentinelNoDataError, get_sentinel_hub
+
+
+Field = Tuple[float, float]
+
+# Rows Of A Field's History Array
+ROW_DATE, ROW_MEAN, ROW_STD, ROW_CLOUD = range(4)
+
+# Observations Used For The Trend (Six Revisits ≈ 30 Days)
+TREND_OBSERVATIONS = 6
+
+# Observations With More Cloud Than This Are Kept But Not Used
+MAX_CLOUD_PERCENT = 80.0
+
+# A Requested Field's Registration Is Refreshed On Disk At Most This Often
+REGISTRATION_REFRESH_SECONDS = 86400
+
+
+def field_for(lat: float, lon: float) -> Field:
+    """Fields Are Identified By Their Coordinates Rounded To ~100 m."""
+    return round(lat, 3), round(lon, 3)
+
+
+@dataclass
+class NdviReading:
+    date: str
+    mean: float
+    std: float
+    cloud_coverage: float
+    trend_per_30_days: Optional[float]
+    trend: str  # Increasing | Decreasing | Stable | Unknown
+    observations: int
+
+
+class NdviHistoryStore:
+    """
+    Per-Field NDVI Time Series, One Compact Array Per Field.
+
+    Each Field Is A .npy Array Of Shape (4, N): Date Ordinal, Mean, Std And
+    Cloud % Per Sentinel-2 Revisit Window, In Ascending Date Order. Forecasts
+    Read The Latest Value And Trend From The Tail Of The Memory-Mapped Array,
+    So The Request Path Never Downloads Imagery. A Scheduled Ingest Appends
+    Only Revisit Windows That Closed Since The Last Stored One. Each Field Is
+    Measured Over A Square Of ndvi_field_hectares Around Its Key, Not The
+    ~11 km Default Box, So Neighbouring Fields Get Their Own Values.
+
+    When Ingest Is Enabled, Forecasts Register The Fields They Ask For: A
+    Small .seen Marker Whose mtime Is The Last Request (Refreshed At Most
+    Daily). The Ingest Follows Registered Fields Only, Up To ndvi_max_fields,
+    And Drops Fields Nobody Has Asked For In ndvi_field_expiry_days Along
+    With Their History. Writes Go Through os.replace, So Readers In Other
+    Processes Never See A Partial File.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        client: Optional[SentinelHubClient] = None,
+        backfill_days: Optional[int] = None,
+        max_age_days: Optional[int] = None,
+        field_hectares: Optional[float] = None,
+        max_fields: Optional[int] = None,
+        expiry_days: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.root = root or os.path.join(settings.cache_dir, "NdviHistory")
+        self.client = client or get_sentinel_hub()
+        self.backfill_days = backfill_days if backfill_days is not None else settings.ndvi_backfill_days
+        self.max_age_days = max_age_days if max_age_days is not None else settings.ndvi_max_age_days
+        self.field_hectares = field_hectares if field_hectares is not None else settings.ndvi_field_hectares
+        self.max_fields = max_fields if max_fields is not None else settings.ndvi_max_fields
+        self.expiry_days = expiry_days if expiry_days is not None else settings.ndvi_field_expiry_days
+        self.registration_enabled = settings.ndvi_ingest_enabled
+        self._registered: Optional[Dict[Field, float]] = None  # Field → Last Marker Refresh (This Process)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, field: Field) -> str:
+        return os.path.join(self.root, f"{field[0]:+08.3f}_{field[1]:+09.3f}.npy")
+
+    def _marker(self, field: Field) -> str:
+        return self._path(field)[:-4] + ".seen"
+
+    def load(self, field: Field) -> Optional[np.ndarray]:
+        try:
+            data = np.load(self._path(field), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if data.ndim != 2 or data.shape[0] != 4:
+            return None
+        return data
+
+    def _save(self, field: Field, data: np.ndarray) -> None:
+        path = self._path(field)
+        partial = f"{path[:-4]}.tmp{os.getpid()}.npy"
+        with open(partial, "wb") as f:
+            np.save(f, data)
+        os.replace(partial, path)
+
+    async def register(self, points: Iterable[Tuple[float, float]]) -> int:
+        """
+        Ask The Ingest To Track The Fields At These Points.
+
+        A No-Op Unless ndvi_ingest_enabled. Disk Writes (New Markers And The
+        Daily Refresh Of Known Ones) Run In One Worker Thread, And New Fields
+        Beyond max_fields Are Not Registered.
+
+        Returns:
+            Number Of Markers Written Or Refreshed
+        """
+        if not self.registration_enabled:
+            return 0
+        if self._registered is None:
+            self._registered = await asyncio.to_thread(lambda: {field: 0.0 for field in self.fields()})
+        now = time.time()
+        due = []
+        for lat, lon in points:
+            field = field_for(lat, lon)
+            last = self._registered.get(field)
+            if last is None and len(self._registered) >= self.max_fields:
+                continue
+            if last is None or now - last >= REGISTRATION_REFRESH_SECONDS:
+                self._registered[field] = now
+                due.append(field)
+        if due:
+            await asyncio.to_thread(self._touch, due)
+        return len(due)
+
+    def _touch(self, fields: List[Field]) -> None:
+        for field in fields:
+            try:
+                with open(self._marker(field), "a"):
+                    pass
+                os.utime(self._marker(field))
+            except OSError as e:
+                print(f"[NdviHistory] Could Not Register Field {field}: {e}")
+
+    def fields(self) -> List[Field]:
+        """Registered Fields, Whether Or Not They Have History Yet."""
+        found = []
+        for path in glob.glob(os.path.join(self.root, "*.seen")):
+            name = os.path.basename(path)[:-5]
+            try:
+                lat, lon = name.split("_")
+                found.append((float(lat), float(lon)))
+            except ValueError:
+                continue
+        return found
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Forget Fields Not Requested For expiry_days, Deleting Their History.
+
+        Returns:
+            Number Of Fields Dropped
+        """
+        cutoff = (now or time.time()) - self.expiry_days * 86400
+        dropped = 0
+        for field in self.fields():
+            try:
+                if os.path.getmtime(self._marker(field)) >= cutoff:
+                    continue
+                os.remove(self._marker(field))
+            except OSError:
+                continue
+            try:
+                os.remove(self._path(field))
+            except OSError:
+                pass
+            if self._registered is not None:
+                self._registered.pop(field, None)
+            dropped += 1
+        return dropped
+
+    # ===== Reads (Request Path) =====
+
+    def latest(self, lat: float, lon: float, today: Optional[datetime.date] = None) -> Optional[NdviReading]:
+        """
+        Latest Usable NDVI And Its Trend For A Field, Or None Without History.
+
+        Only The Last Few Columns Are Touched, So The Cost Does Not Grow With
+        The Length Of The History. A Reading Older Than max_age_days (A Long
+        Cloudy Spell, Or An Ingest That Has Stopped) Is Treated As No Reading.
+        """
+        data = self.load(field_for(lat, lon))
+        if data is None or data.shape[1] == 0:
+            return None
+        tail = np.asarray(data[:, -4 * TREND_OBSERVATIONS:])
+        usable = tail[:, np.isfinite(tail[ROW_MEAN]) & (tail[ROW_CLOUD] <= MAX_CLOUD_PERCENT)]
+        if usable.shape[1] == 0:
+            return None
+        recent = usable[:, -TREND_OBSERVATIONS:]
+        slope = None
+        trend = "Unknown"
+        if recent.shape[1] >= 3:
+            slope = float(np.polyfit(recent[ROW_DATE] - recent[ROW_DATE, 0], recent[ROW_MEAN], 1)[0] * 30)
+            trend = "Increasing" if slope > 0.03 else "Decreasing" if slope < -0.03 else "Stable"
+        last = recent[:, -1]
+        if (today or datetime.date.today()).toordinal() - int(last[ROW_DATE]) > self.max_age_days:
+            return None
+        return NdviReading(
+            date=datetime.date.fromordinal(int(last[ROW_DATE])).isoformat(),
+            mean=float(last[ROW_MEAN]),
+            std=float(last[ROW_STD]),
+            cloud_coverage=float(last[ROW_CLOUD]),
+            trend_per_30_days=slope,
+            trend=trend,
+            observations=int(recent.shape[1]),
+        )
+
+    # ===== Ingest (Scheduled) =====
+
+    def _pending_windows(self, data: Optional[np.ndarray], today: datetime.date) -> List[Tuple[datetime.date, datetime.date]]:
+        revisit = self.client.revisit_days
+        ordinal = today.toordinal()
+        # Last Revisit Window That Has Fully Closed
+        last_closed = ordinal - ordinal % revisit - 1
+        if data is not None and data.shape[1]:
+            first = int(data[ROW_DATE, -1]) + 1
+        else:
+            first = last_closed - self.backfill_days + 1
+            first -= first % revisit
+        windows = []
+        for start in range(first, last_closed + 1, revisit):
+            windows.append((datetime.date.fromordinal(start), datetime.date.fromordinal(start + revisit - 1)))
+        return windows
+
+    async def ingest(self, client_id: str, client_secret: str, lat: float, lon: float, today: Optional[datetime.date] = None) -> int:
+        """
+        Append NDVI For Every Revisit Window Closed Since The Last Stored One.
+
+        Returns:
+            Number Of Windows Added
+        """
+        field = field_for(lat, lon)
+        data = self.load(field)
+        windows = self._pending_windows(data, today or datetime.date.today())
+        if not windows:
+            return 0
+        columns = []
+        for start, end in windows:
+            try:
+                summary = await self.client.ndvi_window(
+                    client_id, client_secret, field[0], field[1], start, end, field_hectares=self.field_hectares
+                )
+            except SentinelNoDataError as e:
+                # Nothing Usable In This Window: Store It As Fully Clouded So The Next Run Moves Past It
+                print(f"[NdviHistory] No Data For Field {field} At {start}: {e}")
+                columns.append((end.toordinal(), np.nan, np.nan, 100.0))
+                continue
+            except (SentinelHubError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Auth Or Transport Failure: Keep What Was Fetched And Retry The Rest Next Run
+                print(f"[NdviHistory] Ingest Stopped For Field {field} At {start}: {e}")
+                break
+            columns.append((end.toordinal(), summary.mean, summary.std, summary.cloud_coverage))
+        if not columns:
+            return 0
+        fresh = np.array(columns, dtype=float).T
+        merged = fresh if data is None or data.shape[1] == 0 else np.concatenate([np.asarray(data), fresh], axis=1)
+        await asyncio.to_thread(self._save, field, merged)
+        return len(columns)
+
+    async def ingest_all(self, client_id: str, client_secret: str) -> int:
+        dropped = await asyncio.to_thread(self.expire)
+        if dropped:
+            print(f"[NdviHistory] Dropped {dropped} Fields Not Requested In {self.expiry_days} Days")
+        added = 0
+        for lat, lon in await asyncio.to_thread(self.fields):
+            added += await self.ingest(client_id, client_secret, lat, lon)
+        return added
+
+    async def run_scheduler(self, client_id: str, client_secret: str, interval_seconds: float) -> None:
+        """Ingest New Acquisitions For All Registered Fields Now And Every interval_seconds Until Cancelled."""
+        while True:
+            try:
+                added = await self.ingest_all(client_id, client_secret)
+                print(f"[NdviHistory] Ingest Added {added} Observations")
+            except Exception as e:
+                print(f"[NdviHistory] Ingest Failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+
+# Singleton Accessor
+_ndvi_history: Optional[NdviHistoryStore] = None
+
+
+def get_ndvi_history() -> NdviHistoryStore:
+    global _ndvi_history
+    if _ndvi_history is None:
+        _ndvi_history = NdviHistoryStore()
+    return _ndvi_history
+
+
+__all__ = ["NdviHistoryStore", "NdviReading", "get_ndvi_history", "field_for"]
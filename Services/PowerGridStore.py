@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Config.Settings import get_settings  # type: ignore
+
+
+# NASA POWER Meteorology Comes From MERRA-2, Gridded At 0.5° Latitude × 0.625°
+# Longitude: Every Point Inside A Cell Receives Identical Values
+GRID_LAT_STEP = 0.5
+GRID_LON_STEP = 0.625
+
+Cell = Tuple[float, float]
+
+
+def snap_to_grid(lat: float, lon: float) -> Cell:
+    """Return The Centre Of The POWER Grid Cell Containing (lat, lon)."""
+    return (
+        round(round(lat / GRID_LAT_STEP) * GRID_LAT_STEP, 4),
+        round(round(lon / GRID_LON_STEP) * GRID_LON_STEP, 4),
+    )
+
+
+def _parameter_hash(parameters: Sequence[str]) -> str:
+    return hashlib.sha1(",".join(parameters).encode()).hexdigest()[:8]
+
+
+class PowerGridStore:
+    """
+    Local Columnar Store For NASA POWER Series, One File Per Grid Cell.
+
+    Each (Cell, Resolution, Parameter Set) Is A Single .npy Array Of Shape
+    (1 + P, N): Row 0 Holds The Date Keys (YYYYMMDD Or YYYYMM As Numbers) In
+    Ascending Order And Row i Holds Parameter i. Missing Or Fill Values Are
+    NaN. Arrays Are Opened With mmap, So A Warm Read Touches Only The Pages
+    It Slices And Is Shared Between Processes Through The Page Cache.
+
+    The Parameter List Is Hashed Into The File Name, So Changing The Canonical
+    Set Starts A Fresh File Rather Than Misreading An Old One. Writes Go To A
+    Temporary File And Are Swapped In With os.replace, So Readers Never See A
+    Partial Array. A Small JSON Sidecar Records FetchedAt And The Last Date
+    That Had Any Real Value (POWER Publishes Recent Days With A Lag).
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(get_settings().cache_dir, "NasaPower")
+
+    def _base(self, cell: Cell, resolution: str, parameters: Sequence[str]) -> str:
+        return os.path.join(
+            self.root,
+            resolution,
+            f"{cell[0]:+08.3f}_{cell[1]:+09.3f}_{_parameter_hash(parameters)}",
+        )
+
+    def load(self, cell: Cell, resolution: str, parameters: Sequence[str]) -> Optional[np.ndarray]:
+        """Memory-Map The Stored Array For A Cell, Or None If Absent/Unreadable."""
+        path = self._base(cell, resolution, parameters) + ".npy"
+        try:
+            data = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if data.ndim != 2 or data.shape[0] != len(parameters) + 1:
+            return None
+        return data
+
+    def meta(self, cell: Cell, resolution: str, parameters: Sequence[str]) -> Dict[str, Any]:
+        try:
+            with open(self._base(cell, resolution, parameters) + ".json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def merge(self, cell: Cell, resolution: str, parameters: Sequence[str], series: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """
+        Merge Freshly Fetched Series Into The Cell's Array And Persist It.
+
+        New Values Overwrite Stored Ones For The Same Date (So A Lagged Day
+        That Was NaN Gets Filled In Once POWER Publishes It).
+
+        Args:
+            series: {Parameter: {DateKey: Value}} As Returned By POWER
+
+        Returns:
+            The Merged Array (In Memory)
+        """
+        keys = sorted({int(k) for values in series.values() for k in values})
+        fresh = np.full((len(parameters) + 1, len(keys)), np.nan)
+        fresh[0] = keys
+        column = {k: i for i, k in enumerate(keys)}
+        for row, name in enumerate(parameters, start=1):
+            for k, v in series.get(name, {}).items():
+                fresh[row, column[int(k)]] = v
+
+        existing = self.load(cell, resolution, parameters)
+        if existing is not None and existing.shape[1]:
+            old = np.array(existing)
+            keep = ~np.isin(old[0], fresh[0])
+            merged = np.concatenate([old[:, keep], fresh], axis=1)
+            merged = merged[:, np.argsort(merged[0], kind="stable")]
+        else:
+            merged = fresh
+
+        has_value = ~np.all(np.isnan(merged[1:]), axis=0) if merged.shape[1] else np.array([], dtype=bool)
+        last_complete = int(merged[0, has_value][-1]) if has_value.any() else None
+
+        base = self._base(cell, resolution, parameters)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        suffix = f".tmp{os.getpid()}"
+        with open(base + suffix + ".npy", "wb") as f:
+            np.save(f, merged)
+        os.replace(base + suffix + ".npy", base + ".npy")
+        with open(base + suffix + ".json", "w", encoding="utf-8") as f:
+            json.dump({
+                "FetchedAt": time.time(),
+                "Parameters": list(parameters),
+                "LastComplete": last_complete,
+                "Cell": list(cell),
+            }, f)
+        os.replace(base + suffix + ".json", base + ".json")
+        return merged
+
+    @staticmethod
+    def slice(data: np.ndarray, parameters: Sequence[str], wanted: Sequence[str], start: int, end: int) -> Dict[str, Dict[str, float]]:
+        """
+        Extract {Parameter: {DateKey: Value}} For start <= Date <= end From An Array.
+
+        NaN (Missing) Values Are Omitted, Matching The Shape Of A POWER Response.
+        """
+        lo = int(np.searchsorted(data[0], start, side="left"))
+        hi = int(np.searchsorted(data[0], end, side="right"))
+        window = np.asarray(data[:, lo:hi])
+        dates = [str(int(d)) for d in window[0]]
+        index = {name: i for i, name in enumerate(parameters, start=1)}
+        result: Dict[str, Dict[str, float]] = {}
+        for name in wanted:
+            row = index.get(name)
+            if row is None:
+                result[name] = {}
+                continue
+            values = window[row]
+            result[name] = {d: float(v) for d, v in zip(dates, values) if not np.isnan(v)}
+        return result
+
+
+# Singleton Accessor
+_power_grid_store: Optional[PowerGridStore] = None
+
+
+def get_power_grid_store() -> PowerGridStore:
+    global _power_grid_store
+    if _power_grid_store is None:
+        _power_grid_store = PowerGridStore()
+    return _power_grid_store
+
+
+__all__ = ["PowerGridStore", "get_power_grid_store", "snap_to_grid", "GRID_LAT_STEP", "GRID_LON_STEP"]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Services.RiskRules import LEVELS, RiskRules, get_risk_rules
+
+
+# Soil Texture Codes
+TEXTURE_OTHER, TEXTURE_SANDY, TEXTURE_CLAY = 0, 1, 2
+
+
+def region_code(location: str = "", coordinates: Optional[Tuple[float, float]] = None) -> int:
+    """
+    Agricultural Zone Code (0 When No Zone Matches).
+
+    Coordinates Resolve Through The Rule Table's Precomputed Grid, So Every
+    Tool Using The Same Geocode Agrees; Location Text Is The Fallback When
+    There Are No Coordinates Or They Fall Outside Every Zone.
+    """
+    return get_risk_rules().region_for(location, coordinates)
+
+
+def coordinates_of(*results: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """(Lat, Lon) From The First Tool Result Carrying 'Coordinates': {'Lat', 'Lon'}."""
+    for result in results:
+        point = (result or {}).get("Coordinates") or {}
+        if point.get("Lat") is not None and point.get("Lon") is not None:
+            return float(point["Lat"]), float(point["Lon"])
+    return None
+
+
+def regional_adjustments(code: int) -> Dict[str, int]:
+    """Full Set Of Risk Modifiers For A Region Code."""
+    return get_risk_rules().adjustments(code)
+
+
+def texture_code(texture: Optional[str]) -> int:
+    if texture and "Sandy" in texture:
+        return TEXTURE_SANDY
+    if texture and "Clay" in texture:
+        return TEXTURE_CLAY
+    return TEXTURE_OTHER
+
+
+def _number(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+@dataclass
+class RiskColumns:
+    """
+    Columnar Risk Inputs, One Element Per Farm.
+
+    Missing Optional Signals (Soil Moisture, ET, NDVI, pH) Are NaN, Which
+    Fails Every Threshold Comparison Exactly Like The Scalar None Checks.
+    """
+
+    precip_total: np.ndarray
+    precip_prob: np.ndarray
+    tmax: np.ndarray
+    humidity: np.ndarray
+    nasa_precip: np.ndarray
+    nasa_temp: np.ndarray
+    soil_level: np.ndarray
+    et: np.ndarray
+    ndvi: np.ndarray
+    ph: np.ndarray
+    texture: np.ndarray
+    region: np.ndarray
+    sources: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.precip_total)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Inputs By Name For The Rule Table, Plus sandy / clay Flags From The Texture Code."""
+        named = {f.name: getattr(self, f.name) for f in fields(self)}
+        named["sandy"] = (self.texture == TEXTURE_SANDY).astype(float)
+        named["clay"] = (self.texture == TEXTURE_CLAY).astype(float)
+        return named
+
+    @staticmethod
+    def features(
+        weather: Dict[str, Any],
+        satellite: Dict[str, Any],
+        copernicus: Dict[str, Any],
+        soil: Dict[str, Any],
+        location: str,
+        ndvi: Optional[float] = None,
+        coordinates: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[float, ...]:
+        """
+        One Farm's Row, Read From Tool Results The Same Way ForecastAgent Does.
+
+        The Region Comes From coordinates, Else From The Coordinates The Tools
+        Geocoded, Else From The Location Text.
+        """
+        precipitation = weather.get("Precipitation", {})
+        humidity = weather.get("Humidity", {})
+        copernicus = copernicus or {}
+        ndvi_value = copernicus.get("VegetationHealth", {}).get("NDVI", None)
+        if ndvi_value is None:
+            ndvi_value = ndvi
+        profile = soil.get("SoilProfile", {}) if soil else {}
+        return (
+            _number(precipitation.get("Total", 0)),
+            _number(precipitation.get("Probability", 0)),
+            _number(weather.get("Temperature", {}).get("Max", 0)),
+            _number(humidity.get("Average", humidity.get("Mean", 0))),
+            _number(satellite.get("Precipitation", {}).get("Total", 0)),
+            _number(satellite.get("Temperature", {}).get("Average", 0)),
+            _number(copernicus.get("SoilMoisture", {}).get("Level", None)),
+            _number(copernicus.get("Evapotranspiration", {}).get("Rate", None)),
+            _number(ndvi_value),
+            _number(profile.get("pH", None)),
+            texture_code(profile.get("SoilTexture", "")),
+            region_code(location, coordinates or coordinates_of(weather, satellite, soil)),
+            sum(1 for source in (weather, satellite, copernicus, soil) if source),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[float]]) -> "RiskColumns":
+        table = np.array(list(rows), dtype=float).reshape(-1, 13)
+        floats = [table[:, i] for i in range(10)]
+        return cls(
+            *floats,
+            texture=table[:, 10].astype(np.int8),
+            region=table[:, 11].astype(np.int16),
+            sources=table[:, 12].astype(np.int8),
+        )
+
+    @classmethod
+    def from_sources(cls, farms: Iterable[Tuple[Any, ...]]) -> "RiskColumns":
+        """Build Columns From (weather, satellite, copernicus, soil, location[, ndvi[, coordinates]]) Tuples."""
+        return cls.from_rows(cls.features(*farm) for farm in farms)
+
+
+@dataclass
+class RiskBatch:
+    """Risk Levels (0 = Low, 1 = Medium, 2 = High) Per Category And Farm."""
+
+    levels: Dict[str, np.ndarray]
+    overall: np.ndarray
+    confidence: np.ndarray
+    penalties: Tuple[Tuple[str, int], ...]  # (Category, Confidence Deduction) In Output Order
+
+    def __len__(self) -> int:
+        return len(self.overall)
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Farm i As {'OverallRiskLevel', 'RiskCategories': {Name: {'Level', 'Confidence'}}}."""
+        base = int(self.confidence[i])
+        return {
+            "OverallRiskLevel": LEVELS[int(self.overall[i])],
+            "RiskCategories": {
+                name: {"Level": LEVELS[int(self.levels[name][i])], "Confidence": base - penalty}
+                for name, penalty in self.penalties
+            },
+        }
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(i) for i in range(len(self))]
+
+
+def evaluate_risks(c: RiskColumns, rules: Optional[RiskRules] = None, ruleset: str = "forecast") -> RiskBatch:
+    """
+    Evaluate Every Risk Category For Every Farm From The Compiled Rule Table.
+
+    The Same Path Serves A Single Forecast (One Row) And Nightly Sweeps Over
+    Tens Of Thousands Of Farms: All Rules Run As NumPy Masks Over The Columns.
+    """
+    compiled = (rules or get_risk_rules()).ruleset(ruleset)
+    levels, confidence = compiled.evaluate(c.columns(), c.region, c.sources)
+    names = [category.name for category in compiled.categories]
+    overall = np.max(np.stack([levels[name] for name in names]), axis=0) if names else np.zeros(len(c), dtype=np.int8)
+    return RiskBatch(
+        levels=levels,
+        overall=overall,
+        confidence=confidence,
+        penalties=tuple((category.name, category.confidence_penalty) for category in compiled.categories),
+    )
+
+
+__all__ = [
+    "RiskColumns",
+    "RiskBatch",
+    "evaluate_risks",
+    "region_code",
+    "coordinates_of",
+    "regional_adjustments",
+    "texture_code",
+    "TEXTURE_OTHER",
+    "TEXTURE_SANDY",
+    "TEXTURE_CLAY",
+]
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import operator
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Config.Settings import get_settings  # type: ignore
+
+
+LEVELS = ("Low", "Medium", "High", "Critical")
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+}
+
+MODIFIERS = (
+    "drought_modifier",
+    "flood_modifier",
+    "heat_modifier",
+    "disease_modifier",
+    "pest_modifier",
+    "erosion_modifier",
+    "leaching_modifier",
+    "cold_modifier",
+    "stress_modifier",
+)
+
+Columns = Mapping[str, np.ndarray]
+Condition = Callable[[Columns, Mapping[str, np.ndarray]], np.ndarray]
+
+
+class RiskRuleError(ValueError):
+    """The Rule Table Is Malformed Or References An Unknown Input Or Threshold."""
+
+
+@dataclass
+class RiskCategory:
+    name: str
+    confidence_penalty: int
+    modifier: Optional[str]
+    levels: Tuple[Tuple[int, int], ...]  # (Level Index, Minimum Score), Highest Level First
+    score: Callable[[Columns, Mapping[str, np.ndarray], int], np.ndarray]
+
+
+@dataclass
+class RiskRuleSet:
+    """
+    One Compiled Rule Set: Every Category Is A Sum Of Scored Clauses Mapped To Levels.
+
+    Evaluation Works On Columns (One Element Per Farm), So A Single Forecast
+    Is Simply A Batch Of One. Missing Inputs Are NaN And Fail Every
+    Comparison.
+    """
+
+    name: str
+    categories: Tuple[RiskCategory, ...]
+    confidence_by_sources: np.ndarray
+    threshold_names: Tuple[str, ...]
+    inputs: frozenset
+    rules: "RiskRules"
+
+    def evaluate(self, columns: Columns, region: np.ndarray, sources: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Risk Levels Per Category And Base Confidence For Every Row.
+
+        Returns:
+            ({Category: Level Index Array}, Confidence Array)
+        """
+        missing = self.inputs - set(columns)
+        if missing:
+            raise RiskRuleError(f"Rule Set {self.name!r} Needs Inputs {sorted(missing)}")
+        region = np.asarray(region, dtype=np.intp)
+        # Codes Computed Against A Table With More Regions Than This One Fall Back To "No Region"
+        region = np.where(region <= len(self.rules.regions), region, 0)
+        thresholds = {name: self.rules.threshold_table[name][region] for name in self.threshold_names}
+        levels: Dict[str, np.ndarray] = {}
+        with np.errstate(invalid="ignore"):
+            for category in self.categories:
+                score = category.score(columns, thresholds, len(region))
+                if category.modifier:
+                    score = score + self.rules.modifier_table[category.modifier][region]
+                level = np.zeros(len(region), dtype=np.int8)
+                for index, minimum in reversed(category.levels):
+                    level[score >= minimum] = index
+                levels[category.name] = level
+        cap = len(self.confidence_by_sources) - 1
+        confidence = self.confidence_by_sources[np.clip(np.asarray(sources, dtype=np.intp), 0, cap)]
+        return levels, confidence
+
+
+class RiskRules:
+    """
+    Compiled Risk Rule Table (See Config/RiskRules.json).
+
+    Thresholds Are Named Once And Shared By Every Rule Set; Regions Can
+    Override Any Threshold And Carry Score Modifiers. Compilation Resolves
+    Every Name Up Front Into Per-Region Lookup Arrays, So Evaluation Is Just
+    NumPy Comparisons With No Dictionary Lookups Per Farm.
+    """
+
+    def __init__(self, table: Dict[str, Any], source: str = "<memory>"):
+        self.source = source
+        self.version = table.get("version")
+        # Changes Whenever Any Threshold Or Rule Does, So Cached Results Can Key On It
+        self.fingerprint = hashlib.sha1(json.dumps(table, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        thresholds = table.get("thresholds") or {}
+        regions = table.get("regions") or []
+        self.regions: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (region.get("name", f"Region {i + 1}"), tuple(k.lower() for k in region.get("keywords", [])))
+            for i, region in enumerate(regions)
+        )
+        # Index 0 Is "No Region"; Region i Is Row i + 1
+        self.threshold_table: Dict[str, np.ndarray] = {}
+        for name, value in thresholds.items():
+            column = [float(value)]
+            for region in regions:
+                column.append(float((region.get("thresholds") or {}).get(name, value)))
+            self.threshold_table[name] = np.array(column)
+        for region in regions:
+            unknown = set(region.get("thresholds") or {}) - set(thresholds)
+            if unknown:
+                raise RiskRuleError(f"Region {region.get('name')!r} Overrides Unknown Thresholds: {sorted(unknown)}")
+        self.modifier_table: Dict[str, np.ndarray] = {
+            name: np.array([0] + [int((region.get("modifiers") or {}).get(name, 0)) for region in regions], dtype=np.int16)
+            for name in MODIFIERS
+        }
+        self.rulesets: Dict[str, RiskRuleSet] = {
+            name: self._compile_ruleset(name, spec) for name, spec in (table.get("rulesets") or {}).items()
+        }
+        self._region_codes: Dict[str, int] = {}
+        self._build_grid(table.get("grid") or {}, regions)
+
+    # ===== Regions =====
+
+    def _build_grid(self, grid: Dict[str, Any], regions: Sequence[Dict[str, Any]]) -> None:
+        """
+        Rasterise The Region Areas Onto A Fixed Grid Once, At Compile Time.
+
+        Each Cell Holds The Code Of The Smallest Area Box Containing Its
+        Centre (0 Outside Every Box), So Resolving Coordinates Afterwards Is
+        Two Multiplications And An Array Read.
+        """
+        north, west, south, east = (float(v) for v in grid.get("bounds", (38.0, 68.0, 6.0, 98.0)))
+        self.grid_resolution = float(grid.get("resolution_deg", 0.25))
+        self.grid_origin = (north, west)
+        rows = max(1, int(round((north - south) / self.grid_resolution)))
+        cols = max(1, int(round((east - west) / self.grid_resolution)))
+        lat = north - (np.arange(rows) + 0.5) * self.grid_resolution
+        lon = west + (np.arange(cols) + 0.5) * self.grid_resolution
+        lat, lon = lat[:, None], lon[None, :]
+        codes = np.zeros((rows, cols), dtype=np.uint8)
+        smallest = np.full((rows, cols), np.inf)
+        for code, region in enumerate(regions, start=1):
+            for name, boxes in (region.get("areas") or {}).items():
+                if boxes and not isinstance(boxes[0], list):
+                    boxes = [boxes]
+                for box in boxes:
+                    try:
+                        n, w, s, e = (float(v) for v in box)
+                    except (TypeError, ValueError):
+                        raise RiskRuleError(f"Area {name!r} Must Be [North, West, South, East] Or A List Of Them") from None
+                    area = (n - s) * (e - w)
+                    inside = (lat <= n) & (lat >= s) & (lon >= w) & (lon <= e) & (area < smallest)
+                    codes[inside] = code
+                    smallest[inside] = area
+        self.grid = codes
+
+    def zone_at(self, lat: float, lon: float) -> int:
+        """Region Code At A Coordinate From The Precomputed Grid (0 Outside Every Area)."""
+        row = int((self.grid_origin[0] - lat) // self.grid_resolution)
+        col = int((lon - self.grid_origin[1]) // self.grid_resolution)
+        if 0 <= row < self.grid.shape[0] and 0 <= col < self.grid.shape[1]:
+            return int(self.grid[row, col])
+        return 0
+
+    def zones_at(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Vectorised zone_at; NaN Coordinates Map To 0."""
+        with np.errstate(invalid="ignore"):
+            rows = np.floor((self.grid_origin[0] - np.asarray(lat, dtype=float)) / self.grid_resolution)
+            cols = np.floor((np.asarray(lon, dtype=float) - self.grid_origin[1]) / self.grid_resolution)
+            valid = (rows >= 0) & (rows < self.grid.shape[0]) & (cols >= 0) & (cols < self.grid.shape[1])
+        zones = np.zeros(rows.shape, dtype=np.int16)
+        zones[valid] = self.grid[rows[valid].astype(np.intp), cols[valid].astype(np.intp)]
+        return zones
+
+    def region_for(self, location: str = "", coordinates: Optional[Tuple[float, float]] = None) -> int:
+        """Region Code From Coordinates When Known, Else (Or When They Fall In No Zone) From The Location Text."""
+        if coordinates is not None:
+            code = self.zone_at(coordinates[0], coordinates[1])
+            if code:
+                return code
+        return self.region_code(location)
+
+    def region_code(self, location: str) -> int:
+        """
+        Region Code For A Location String: 1 + Index Of The First Matching Region, 0 If None Match.
+
+        Fallback For When No Coordinates Are Available; Prefer region_for.
+        """
+        code = self._region_codes.get(location)
+        if code is None:
+            lowered = location.lower()
+            code = next(
+                (i for i, (_, keywords) in enumerate(self.regions, start=1) if any(k in lowered for k in keywords)), 0
+            )
+            if len(self._region_codes) < 8192:
+                self._region_codes[location] = code
+        return code
+
+    def adjustments(self, code: int) -> Dict[str, int]:
+        return {name: int(table[code]) for name, table in self.modifier_table.items()}
+
+    def ruleset(self, name: str) -> RiskRuleSet:
+        try:
+            return self.rulesets[name]
+        except KeyError:
+            raise RiskRuleError(f"Rule Table {self.source} Has No Rule Set {name!r}") from None
+
+    # ===== Compilation =====
+
+    def _compile_condition(self, spec: Any, used: set, inputs: set) -> Condition:
+        if isinstance(spec, dict) and "any" in spec:
+            parts = [self._compile_condition(part, used, inputs) for part in spec["any"]]
+            return lambda cols, th: np.logical_or.reduce([part(cols, th) for part in parts])
+        if not (isinstance(spec, list) and len(spec) == 3 and spec[1] in _OPERATORS):
+            raise RiskRuleError(f"Invalid Condition {spec!r}; Expected [input, op, threshold] Or {{'any': [...]}}")
+        field, op, value = spec
+        compare = _OPERATORS[op]
+        inputs.add(field)
+        if isinstance(value, str):
+            if value not in self.threshold_table:
+                raise RiskRuleError(f"Condition {spec!r} References Unknown Threshold {value!r}")
+            used.add(value)
+            return lambda cols, th: compare(cols[field], th[value])
+        constant = float(value)
+        return lambda cols, th: compare(cols[field], constant)
+
+    def _compile_when(self, conditions: Sequence[Any], used: set, inputs: set) -> Condition:
+        parts = [self._compile_condition(c, used, inputs) for c in conditions]
+        return lambda cols, th: np.logical_and.reduce([part(cols, th) for part in parts])
+
+    def _compile_score(self, clauses: Sequence[Dict[str, Any]], used: set, inputs: set):
+        # Each Group Is A List Of (Condition, Points); Only The First Match Scores (if / elif)
+        groups: List[List[Tuple[Condition, int]]] = []
+        for clause in clauses:
+            members = clause["first"] if "first" in clause else [clause]
+            groups.append([(self._compile_when(c["when"], used, inputs), int(c["add"])) for c in members])
+
+        def score(cols: Columns, th: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+            total = np.zeros(n, dtype=np.int16)
+            for group in groups:
+                if len(group) == 1:
+                    when, points = group[0]
+                    total += np.where(when(cols, th), points, 0).astype(np.int16)
+                else:
+                    total += np.select([when(cols, th) for when, _ in group], [points for _, points in group], 0).astype(np.int16)
+            return total
+
+        return score
+
+    def _compile_ruleset(self, name: str, spec: Dict[str, Any]) -> RiskRuleSet:
+        used: set = set()
+        inputs: set = set()
+        categories = []
+        for category in spec.get("categories", []):
+            try:
+                levels = sorted(
+                    ((LEVELS.index(level), int(minimum)) for level, minimum in category["levels"].items()), reverse=True
+                )
+            except ValueError:
+                raise RiskRuleError(f"{name}.{category.get('name')}: Levels Must Be One Of {LEVELS}") from None
+            modifier = category.get("modifier")
+            if modifier and modifier not in MODIFIERS:
+                raise RiskRuleError(f"{name}.{category.get('name')}: Unknown Modifier {modifier!r}")
+            categories.append(RiskCategory(
+                name=category["name"],
+                confidence_penalty=int(category.get("confidence_penalty", 0)),
+                modifier=modifier,
+                levels=tuple(levels),
+                score=self._compile_score(category.get("score", []), used, inputs),
+            ))
+        return RiskRuleSet(
+            name=name,
+            categories=tuple(categories),
+            confidence_by_sources=np.array(spec.get("confidence_by_sources", [60]), dtype=np.int16),
+            threshold_names=tuple(sorted(used)),
+            inputs=frozenset(inputs),
+            rules=self,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RiskRules":
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                table = json.load(f)
+            except json.JSONDecodeError as e:
+                raise RiskRuleError(f"{path}: {e}") from e
+        return cls(table, source=path)
+
+
+class RiskRuleStore:
+    """
+    Hot-Reloading Holder For The Rule Table.
+
+    Every Process (Web API And Each A2A Agent) Checks The File's Modification
+    Time At Most Once Per check_seconds And Recompiles When It Changes, So
+    Threshold Edits Apply Everywhere Without A Restart. A Table That Fails To
+    Compile Is Reported And The Previous One Stays In Use.
+    """
+
+    def __init__(self, path: Optional[str] = None, check_seconds: Optional[float] = None):
+        settings = get_settings()
+        self.path = path or settings.risk_rules_path
+        self.check_seconds = check_seconds if check_seconds is not None else settings.risk_rules_check_seconds
+        self._lock = threading.Lock()
+        self._rules: Optional[RiskRules] = None
+        self._mtime: Optional[float] = None
+        self._checked = 0.0
+
+    def get(self) -> RiskRules:
+        now = time.monotonic()
+        if self._rules is not None and now - self._checked < self.check_seconds:
+            return self._rules
+        with self._lock:
+            if self._rules is None or now - self._checked >= self.check_seconds:
+                self._checked = now
+                self._reload_if_changed()
+        return self._rules  # type: ignore[return-value]
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            if self._rules is None:
+                raise RiskRuleError(f"Risk Rule Table Not Found: {self.path}") from e
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            rules = RiskRules.load(self.path)
+        except (OSError, RiskRuleError, KeyError, TypeError, ValueError) as e:
+            if self._rules is None:
+                raise
+            print(f"[RiskRules] Keeping Previous Rules, {self.path} Failed To Compile: {e}")
+            self._mtime = mtime
+            return
+        if self._rules is not None:
+            print(f"[RiskRules] Reloaded {self.path} (Version {rules.version})")
+        self._rules = rules
+        self._mtime = mtime
+
+
+# Singleton Accessor
+_risk_rule_store: Optional[RiskRuleStore] = None
+
+
+def get_risk_rules() -> RiskRules:
+    """Current Compiled Rule Table, Reloaded When The File Changes."""
+    global _risk_rule_store
+    if _risk_rule_store is None:
+        _risk_rule_store = RiskRuleStore()
+    return _risk_rule_store.get()
+
+
+__all__ = [
+    "RiskRules",
+    "RiskRuleSet",
+    "RiskRuleStore",
+    "RiskRuleError",
+    "get_risk_rules",
+    "LEVELS",
+]
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import datetime
+import math
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Config.Settings import get_settings  # type: ignore
+from Services.HttpClient import get_http_client
+from Utils.Cache import TtlLruCache
+from Utils.Observability import inc_cache
+from Utils.SingleFlight import get_singleflight
+
+
+TOKEN_URL = "https://services.sentinel-hub.com/oauth/token"
+PROCESS_URL = "https://services.sentinel-hub.com/api/v1/process"
+STATISTICS_URL = "https://services.sentinel-hub.com/api/v1/statistics"
+
+# Sentinel-2 Native Resolution And The Largest Image We Ask For
+NATIVE_RESOLUTION_M = 10.0
+MAX_PIXELS_PER_SIDE = 512
+
+# Metres Per Degree Of Latitude (Longitude Scales With cos(lat))
+METRES_PER_DEGREE = 111_320.0
+
+# Refresh Tokens This Long Before They Expire
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Days Of Imagery Each NDVI Summary Looks Back Over (Long Enough To Find A Clear Pass)
+NDVI_LOOKBACK_DAYS = 30
+
+NDVI_EVALSCRIPT = """
+//VERSION=3
+function setup() {
+    return {
+        input: ["B04", "B08", "SCL"],
+        output: { bands: 1, sampleType: "FLOAT32" }
+    };
+}
+function evaluatePixel(sample) {
+    // Calculate NDVI: (NIR - Red) / (NIR + Red)
+    let ndvi = (sample.B08 - sample.B04) / (sample.B08 + sample.B04);
+    // Filter clouds (SCL = 3,8,9,10,11 are clouds/shadows)
+    if ([3,8,9,10,11].includes(sample.SCL)) {
+        return [NaN];
+    }
+    return [ndvi];
+}
+"""
+
+# Statistical API Variant: Same NDVI And Cloud Mask, With Masked Pixels Reported As No Data
+NDVI_STATISTICS_EVALSCRIPT = """
+//VERSION=3
+function setup() {
+    return {
+        input: [{ bands: ["B04", "B08", "SCL", "dataMask"] }],
+        output: [
+            { id: "ndvi", bands: 1, sampleType: "FLOAT32" },
+            { id: "dataMask", bands: 1 }
+        ]
+    };
+}
+function evaluatePixel(sample) {
+    let ndvi = (sample.B08 - sample.B04) / (sample.B08 + sample.B04);
+    // Filter clouds (SCL = 3,8,9,10,11 are clouds/shadows)
+    let clear = [3,8,9,10,11].includes(sample.SCL) ? 0 : 1;
+    return { ndvi: [ndvi], dataMask: [sample.dataMask * clear] };
+}
+"""
+
+
+class SentinelHubError(RuntimeError):
+    """Raised When Sentinel Hub Rejects A Request."""
+
+
+class SentinelNoDataError(SentinelHubError):
+    """Raised When The Request Succeeded But The Window Itself Could Not Be Processed."""
+
+
+@dataclass
+class NdviSummary:
+    mean: float
+    std: float
+    cloud_coverage: float  # % Of Pixels Masked As Cloud/Shadow/No Data
+    vegetation_cover: float  # % Of Pixels With NDVI > 0.4
+    start: str
+    end: str
+    resolution_m: float = NATIVE_RESOLUTION_M
+    mode: str = "process"  # process | statistics
+
+
+class SentinelTokenManager:
+    """
+    Client-Credentials OAuth Tokens, Cached Until Shortly Before Expiry.
+
+    Concurrent Callers Needing A Fresh Token For The Same Client Share One
+    Exchange, So A Burst Of Forecasts Costs One OAuth Round-Trip.
+    """
+
+    def __init__(self, refresh_margin_seconds: float = TOKEN_REFRESH_MARGIN_SECONDS):
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+
+    async def token(self, client_id: str, client_secret: str) -> str:
+        cached = self._tokens.get(client_id)
+        if cached is not None and time.time() < cached[1]:
+            inc_cache("sentinel_token", "hit")
+            return cached[0]
+        inc_cache("sentinel_token", "miss")
+        return await get_singleflight().do("sentinel_oauth", client_id, lambda: self._exchange(client_id, client_secret))
+
+    def invalidate(self, client_id: str) -> None:
+        self._tokens.pop(client_id, None)
+
+    async def _exchange(self, client_id: str, client_secret: str) -> str:
+        auth = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        headers = {
+            "Authorization": f"Basic {auth}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        async with get_http_client().borrow() as session:
+            async with session.post(TOKEN_URL, headers=headers, data={"grant_type": "client_credentials"}) as response:
+                if response.status != 200:
+                    raise SentinelHubError(f"Sentinel Auth Failed: HTTP {response.status}")
+                data = await response.json()
+        token = data["access_token"]
+        lifetime = float(data.get("expires_in") or 3600)
+        self._tokens[client_id] = (token, time.time() + max(0.0, lifetime - self.refresh_margin_seconds))
+        return token
+
+
+def acquisition_window(today: datetime.date, revisit_days: int, lookback_days: int = NDVI_LOOKBACK_DAYS) -> Tuple[datetime.date, datetime.date]:
+    """
+    Imagery Window Aligned To The Sentinel-2 Revisit Cycle.
+
+    The Window Ends On The Last Day Of The Current revisit_days Bucket, So
+    Every Request Within One Revisit Period Asks For (And Caches) The Same
+    Acquisitions.
+    """
+    ordinal = today.toordinal()
+    end = datetime.date.fromordinal(ordinal - ordinal % revisit_days + revisit_days - 1)
+    return end - datetime.timedelta(days=lookback_days), end
+
+
+def field_bbox(lat: float, lon: float, field_hectares: Optional[float] = None) -> List[float]:
+    """
+    Bounding Box [West, South, East, North] For A Field.
+
+    Without A Field Size The Default ±0.05° (~11 km) Box Around The Point Is
+    Used; With One, A Square Of That Area (At Least 100 m Across).
+    """
+    if not field_hectares or field_hectares <= 0:
+        return [round(lon - 0.05, 4), round(lat - 0.05, 4), round(lon + 0.05, 4), round(lat + 0.05, 4)]
+    half_m = max((field_hectares * 10_000) ** 0.5, 100.0) / 2
+    half_lat = half_m / METRES_PER_DEGREE
+    half_lon = half_m / (METRES_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return [round(lon - half_lon, 5), round(lat - half_lat, 5), round(lon + half_lon, 5), round(lat + half_lat, 5)]
+
+
+def _grid(bbox: List[float]) -> Tuple[int, int, float]:
+    """
+    Output (Width, Height, Resolution In Metres) For A Bounding Box.
+
+    Native 10 m Pixels Unless That Would Exceed MAX_PIXELS_PER_SIDE, So A
+    1-Hectare Plot Is ~10×10 Pixels Rather Than A Fixed 512×512.
+    """
+    mid_lat = (bbox[1] + bbox[3]) / 2
+    width_m = (bbox[2] - bbox[0]) * METRES_PER_DEGREE * math.cos(math.radians(mid_lat))
+    height_m = (bbox[3] - bbox[1]) * METRES_PER_DEGREE
+    resolution = max(NATIVE_RESOLUTION_M, max(width_m, height_m) / MAX_PIXELS_PER_SIDE)
+    return max(1, int(round(width_m / resolution))), max(1, int(round(height_m / resolution))), float(resolution)
+
+
+_TIFF_TYPE_SIZES = {3: 2, 4: 4, 16: 8}  # SHORT, LONG, LONG8
+_TIFF_TYPE_CODES = {3: "H", 4: "I", 16: "Q"}
+
+
+def _decode_float32_tiff(image: bytes) -> Optional[np.ndarray]:
+    """
+    View An Uncompressed Single-Band Float32 Striped TIFF As A NumPy Array.
+
+    When The Strips Are Contiguous (The Usual Case) The Result Is A View
+    Onto The Response Buffer, With No Copy. Returns None For Any Layout This
+    Reader Does Not Handle (Compression, Tiles, Other Sample Types), So The
+    Caller Can Fall Back To PIL.
+    """
+    import struct
+
+    view = memoryview(image)
+    if len(view) < 8 or bytes(view[:2]) not in (b"II", b"MM"):
+        return None
+    order = "<" if bytes(view[:2]) == b"II" else ">"
+    if struct.unpack_from(order + "H", view, 2)[0] != 42:
+        return None
+    ifd = struct.unpack_from(order + "I", view, 4)[0]
+    (count,) = struct.unpack_from(order + "H", view, ifd)
+    tags: Dict[int, Tuple[int, ...]] = {}
+    for i in range(count):
+        tag, kind, n, _ = struct.unpack_from(order + "HHII", view, ifd + 2 + 12 * i)
+        if kind not in _TIFF_TYPE_SIZES:
+            continue
+        size = _TIFF_TYPE_SIZES[kind] * n
+        at = ifd + 2 + 12 * i + 8
+        if size > 4:
+            at = struct.unpack_from(order + "I", view, at)[0]
+        tags[tag] = struct.unpack_from(order + _TIFF_TYPE_CODES[kind] * n, view, at)
+
+    width, height = tags.get(256, (0,))[0], tags.get(257, (0,))[0]
+    if (
+        not width or not height
+        or tags.get(259, (1,))[0] != 1  # Compression: None
+        or tags.get(277, (1,))[0] != 1  # SamplesPerPixel
+        or tags.get(258, (0,))[0] != 32  # BitsPerSample
+        or tags.get(339, (1,))[0] != 3  # SampleFormat: IEEE Float
+        or 273 not in tags or 279 not in tags
+    ):
+        return None
+    offsets, counts = tags[273], tags[279]
+    if sum(counts) != width * height * 4:
+        return None
+    dtype = np.dtype(order + "f4")
+    contiguous = all(offsets[i] + counts[i] == offsets[i + 1] for i in range(len(offsets) - 1))
+    if contiguous:
+        flat = np.frombuffer(view, dtype=dtype, count=width * height, offset=offsets[0])
+    else:
+        flat = np.concatenate([np.frombuffer(view, dtype=dtype, count=c // 4, offset=o) for o, c in zip(offsets, counts)])
+    return flat.reshape(height, width)
+
+
+def _ndvi_stats(image: bytes) -> Tuple[float, float, float, float]:
+    ndvi_arr = _decode_float32_tiff(image)
+    if ndvi_arr is None:
+        from PIL import Image
+
+        ndvi_arr = np.asarray(Image.open(BytesIO(image)), dtype=np.float32)
+    # Compute Statistics Using NaN-Safe Operations
+    with np.errstate(invalid="ignore"):
+        mean = float(np.nanmean(ndvi_arr))
+        std = float(np.nanstd(ndvi_arr))
+        total = ndvi_arr.size
+        nan_count = int(np.count_nonzero(~np.isfinite(ndvi_arr)))
+        cloud_cov = (nan_count / total) * 100.0 if total else 0.0
+        veg_cover = float(np.count_nonzero(ndvi_arr > 0.4)) / total * 100.0 if total else 0.0
+    return mean, std, cloud_cov, veg_cover
+
+
+def _parse_statistics(response: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """
+    Extract (Mean, Std, Cloud %, Vegetation Cover %) From A Statistical API Response.
+
+    Cloud % Is The Share Of No-Data (Masked) Samples; Vegetation Cover Comes
+    From The Histogram Bin Above 0.4, Both Relative To All Samples As In The
+    Pixel Path. A Window Without Any Clear Acquisition (Routine In Monsoon)
+    Is Not An Error: It Gives A NaN Mean And Std With 100% Cloud.
+
+    Raises:
+        SentinelHubError: If The Response Reports A Failure
+        SentinelNoDataError: If Every Interval In It Failed To Process
+    """
+    data = response.get("data")
+    if data is None or response.get("status", "OK") != "OK":
+        raise SentinelHubError(f"Sentinel Statistics Failed: {response.get('status') or 'Malformed Response'}")
+    intervals = [i for i in data if "outputs" in i]
+    if not intervals:
+        errors = [i["error"] for i in data if i.get("error")]
+        if errors:
+            detail = errors[-1].get("type") or errors[-1].get("message") if isinstance(errors[-1], dict) else errors[-1]
+            raise SentinelNoDataError(f"Sentinel Statistics Failed: {detail}")
+        return math.nan, math.nan, 100.0, 0.0
+    band = intervals[-1]["outputs"]["ndvi"]["bands"]["B0"]
+    stats = band["stats"]
+    total = float(stats.get("sampleCount") or 0)
+    no_data = float(stats.get("noDataCount") or 0)
+    above = sum(b.get("count", 0) for b in (band.get("histogram") or {}).get("bins", []) if b.get("lowEdge", -1) >= 0.4)
+    return (
+        float(stats.get("mean", "nan")),
+        float(stats.get("stDev", "nan")),
+        no_data / total * 100.0 if total else 0.0,
+        above / total * 100.0 if total else 0.0,
+    )
+
+
+class SentinelHubClient:
+    """
+    Sentinel Hub Process API Client With Token And NDVI Caching.
+
+    NDVI Summaries Are Cached Per (Bounding Box, Acquisition Window). Windows
+    Follow The Five-Day Sentinel-2 Revisit, So Repeated Forecasts For The Same
+    Field Within One Revisit Skip Both The OAuth Exchange And The Imagery
+    Download; Entries Expire When The Next Revisit Window Starts.
+
+    In "statistics" Mode (Default) Aggregates Are Computed Server-Side By The
+    Statistical API And Only A Small JSON Document Is Transferred. In
+    "process" Mode A Float32 TIFF Is Rendered At A Resolution Chosen From The
+    Field Size And Decoded Without Copying.
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[SentinelTokenManager] = None,
+        cache_size: Optional[int] = None,
+        revisit_days: Optional[int] = None,
+        mode: Optional[str] = None,
+    ):
+        settings = get_settings()
+        self.tokens = tokens or SentinelTokenManager()
+        self.mode = (mode or settings.sentinel_ndvi_mode).lower()
+        self.revisit_days = max(1, revisit_days or settings.sentinel_revisit_days)
+        self._ndvi: TtlLruCache[NdviSummary] = TtlLruCache(cache_size or settings.sentinel_ndvi_cache_size)
+
+    async def _post(self, url: str, client_id: str, client_secret: str, payload: Dict[str, Any], as_json: bool = False) -> Any:
+        """POST To A Sentinel Hub API, Retrying Once With A Fresh Token On 401."""
+        label = "Statistics" if url == STATISTICS_URL else "Processing"
+        for attempt in range(2):
+            token = await self.tokens.token(client_id, client_secret)
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            async with get_http_client().borrow() as session:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status == 401 and attempt == 0:
+                        self.tokens.invalidate(client_id)
+                        continue
+                    if response.status != 200:
+                        raise SentinelHubError(f"Sentinel {label} Failed: HTTP {response.status}")
+                    return await response.json() if as_json else await response.read()
+        raise SentinelHubError(f"Sentinel {label} Failed: HTTP 401")
+
+    async def process(self, client_id: str, client_secret: str, payload: Dict[str, Any]) -> bytes:
+        """POST A Process API Request And Return The Rendered Image Bytes."""
+        return await self._post(PROCESS_URL, client_id, client_secret, payload)
+
+    async def statistics(self, client_id: str, client_secret: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST A Statistical API Request And Return The Parsed Response."""
+        return await self._post(STATISTICS_URL, client_id, client_secret, payload, as_json=True)
+
+    async def ndvi_summary(
+        self, client_id: str, client_secret: str, lat: float, lon: float, field_hectares: Optional[float] = None
+    ) -> NdviSummary:
+        """
+        Cloud-Masked NDVI Statistics For A Field Over The Current Window.
+
+        Raises:
+            SentinelHubError: If Authentication Or Processing Fails
+        """
+        start, end = acquisition_window(datetime.date.today(), self.revisit_days)
+        return await self.ndvi_window(client_id, client_secret, lat, lon, start, end, field_hectares)
+
+    async def ndvi_window(
+        self,
+        client_id: str,
+        client_secret: str,
+        lat: float,
+        lon: float,
+        start: datetime.date,
+        end: datetime.date,
+        field_hectares: Optional[float] = None,
+    ) -> NdviSummary:
+        """
+        Cloud-Masked NDVI Statistics For A Field Over [start, end].
+
+        Args:
+            field_hectares: Field Area; Without It The ±0.05° Box Around The Point Is Used
+
+        Raises:
+            SentinelHubError: If Authentication Or Processing Fails
+        """
+        bbox = field_bbox(lat, lon, field_hectares)
+        key = (tuple(bbox), start, end)
+        cached = self._ndvi.get(key)
+        if cached is not None:
+            inc_cache("sentinel_ndvi", "hit")
+            return cached
+        inc_cache("sentinel_ndvi", "miss")
+        fetch = self._fetch_ndvi_statistics if self.mode == "statistics" else self._fetch_ndvi
+        summary = await get_singleflight().do(
+            "sentinel_ndvi", key, lambda: fetch(client_id, client_secret, bbox, start, end)
+        )
+        # Open Windows Can Still Gain Acquisitions: Keep Them Until They Close;
+        # Closed Windows Are Final And Kept For One Revisit Period
+        expires_at = datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time()).timestamp()
+        if expires_at <= time.time():
+            expires_at = time.time() + self.revisit_days * 86400
+        self._ndvi.set(key, summary, expires_at=expires_at)
+        return summary
+
+    @staticmethod
+    def _input(bbox: List[float], start: datetime.date, end: datetime.date) -> Dict[str, Any]:
+        return {
+            "bounds": {
+                "bbox": bbox,
+                "properties": {"crs": "http://www.opengis.net/def/crs/EPSG/0/4326"},
+            },
+            "data": [{
+                "type": "sentinel-2-l2a",
+                "dataFilter": {
+                    "timeRange": {
+                        "from": start.strftime("%Y-%m-%dT00:00:00Z"),
+                        "to": end.strftime("%Y-%m-%dT23:59:59Z"),
+                    },
+                    "maxCloudCoverage": 30,
+                },
+            }],
+        }
+
+    async def _fetch_ndvi(self, client_id: str, client_secret: str, bbox: List[float], start: datetime.date, end: datetime.date) -> NdviSummary:
+        width, height, resolution = _grid(bbox)
+        payload = {
+            "input": self._input(bbox, start, end),
+            "output": {
+                "width": width,
+                "height": height,
+                "responses": [{
+                    "identifier": "default",
+                    "format": {"type": "image/tiff"},
+                }],
+            },
+            "evalscript": NDVI_EVALSCRIPT,
+        }
+        image = await self.process(client_id, client_secret, payload)
+        mean, std, cloud_cov, veg_cover = await asyncio.to_thread(_ndvi_stats, image)
+        return NdviSummary(mean, std, cloud_cov, veg_cover, start.isoformat(), end.isoformat(), resolution, "process")
+
+    async def _fetch_ndvi_statistics(self, client_id: str, client_secret: str, bbox: List[float], start: datetime.date, end: datetime.date) -> NdviSummary:
+        _, _, resolution = _grid(bbox)
+        mid_lat = (bbox[1] + bbox[3]) / 2
+        days = (end - start).days + 1
+        payload = {
+            "input": self._input(bbox, start, end),
+            "aggregation": {
+                "timeRange": {
+                    "from": start.strftime("%Y-%m-%dT00:00:00Z"),
+                    "to": (end + datetime.timedelta(days=1)).strftime("%Y-%m-%dT00:00:00Z"),
+                },
+                # One Interval Spanning The Whole Window
+                "aggregationInterval": {"of": f"P{days}D"},
+                "evalscript": NDVI_STATISTICS_EVALSCRIPT,
+                "resx": resolution / (METRES_PER_DEGREE * max(math.cos(math.radians(mid_lat)), 0.01)),
+                "resy": resolution / METRES_PER_DEGREE,
+            },
+            "calculations": {
+                "ndvi": {"histograms": {"default": {"binEdges": [-1.0, 0.4, 1.0]}}},
+            },
+        }
+        response = await self.statistics(client_id, client_secret, payload)
+        mean, std, cloud_cov, veg_cover = _parse_statistics(response)
+        return NdviSummary(mean, std, cloud_cov, veg_cover, start.isoformat(), end.isoformat(), resolution, "statistics")
+
+
+# Singleton Accessor
+_sentinel_hub: Optional[SentinelHubClient] = None
+
+
+def get_sentinel_hub() -> SentinelHubClient:
+    global _sentinel_hub
+    if _sentinel_hub is None:
+        _sentinel_hub = SentinelHubClient()
+    return _sentinel_hub
+
+
+__all__ = [
+    "SentinelHubClient",
+    "SentinelTokenManager",
+    "SentinelHubError",
+    "SentinelNoDataError",
+    "NdviSummary",
+    "acquisition_window",
+    "field_bbox",
+    "get_sentinel_hub",
+]
@@ -5,6 +5,8 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Callable, Awaitable
 
+from Services.EventBus import get_event_bus
+
 
 @dataclass
 class TaskRecord:
@@ -24,6 +26,8 @@ class TaskManager:
     Manages The Lifecycle Of Long-Running Agricultural Analysis Tasks Including
     Multi-Agent Orchestration, Risk Assessment Workflows, And Complex Data Processing.
     Provides Thread-Safe Operations With Comprehensive Status Tracking And Control.
+    Every State Change Is Also Published On The Task's EventBus Channel (Named
+    After The Task Id), Which Is Closed Once The Task Finishes.
     """
     def __init__(self):
         """
@@ -35,6 +39,10 @@ class TaskManager:
         self._tasks: Dict[str, TaskRecord] = {}
         self._lock = asyncio.Lock()
 
+    def _publish(self, record: TaskRecord, **data: Any) -> None:
+        """Publish The Task's Current State (Plus Any Extra Fields) On Its Event Channel."""
+        get_event_bus().publish(record.id, "TaskState", {"State": record.status, **data})
+
     def _new_id(self) -> str:
         """
         Generate Unique Task Identifier.
@@ -62,18 +70,25 @@ class TaskManager:
             record = TaskRecord(id=task_id)
             record.pause_event.set()  
             self._tasks[task_id] = record
+            self._publish(record)
 
             async def _wrap():
                 record.status = "Running"
+                self._publish(record)
                 try:
                     result = await runner(task_id)
                     record.result = result
                     record.status = "Completed"
+                    self._publish(record, Result=result)
                 except asyncio.CancelledError:
                     record.status = "Cancelled"
+                    self._publish(record)
                 except Exception as e:
                     record.error = str(e)
                     record.status = "Error"
+                    self._publish(record, Error=record.error)
+                finally:
+                    get_event_bus().close(task_id)
 
             record.coro = asyncio.create_task(_wrap(), name=f"AgriTask:{task_id}")
             return task_id
@@ -98,6 +113,7 @@ class TaskManager:
         rec.paused = True
         rec.pause_event.clear()
         rec.status = "Paused"
+        self._publish(rec)
         return {"Status": "Success", "TaskId": task_id, "State": rec.status}
 
     async def resume(self, task_id: str) -> Dict[str, Any]:
@@ -120,6 +136,7 @@ class TaskManager:
         rec.pause_event.set()
         if rec.coro and not rec.coro.done():
             rec.status = "Running"
+            self._publish(rec)
         return {"Status": "Success", "TaskId": task_id, "State": rec.status}
 
     async def cancel(self, task_id: str) -> Dict[str, Any]:
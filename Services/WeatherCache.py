@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, Set
+
+from Config.Settings import get_settings  # type: ignore
+from Utils.Cache import TtlLruCache
+from Utils.Observability import inc_cache
+
+
+def next_model_run_expiry(now: float, run_hours: Iterable[int], publish_delay_seconds: float) -> float:
+    """
+    Return The Unix Time At Which The Next Model Run Becomes Available.
+
+    Forecast Models Are Initialised At Fixed UTC Hours (00/06/12/18 For GFS,
+    ICON And IFS) And Their Output Appears Some Time Later; Until Then A
+    Refetch Returns The Same Numbers.
+
+    Args:
+        now: Current Unix Time
+        run_hours: UTC Initialisation Hours
+        publish_delay_seconds: Delay Between Initialisation And Availability
+    """
+    current = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc)
+    midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+    delay = datetime.timedelta(seconds=publish_delay_seconds)
+    candidates = [
+        midnight + datetime.timedelta(days=day, hours=hour) + delay
+        for day in (-1, 0, 1, 2)
+        for hour in run_hours
+    ]
+    return min(c for c in candidates if c > current).timestamp()
+
+
+class ModelRunCache:
+    """
+    Forecast Cache Whose Entries Expire When A New Model Run Is Published.
+
+    A Fixed TTL Either Refetches Identical Forecasts Or Serves A Superseded
+    Run; Aligning Expiry With Model-Run Boundaries Avoids Both. Expired
+    Entries Younger Than max_stale_seconds Are Still Returned Immediately
+    (Stale-While-Revalidate) While A Single Background Task Refreshes Them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: Optional[int] = None,
+        max_stale_seconds: Optional[int] = None,
+        run_hours: Optional[Iterable[int]] = None,
+        publish_delay_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.name = name
+        self.max_stale_seconds = max_stale_seconds if max_stale_seconds is not None else settings.weather_cache_max_stale_seconds
+        self.run_hours = tuple(run_hours) if run_hours is not None else tuple(
+            int(h) for h in settings.weather_model_run_hours.split(",") if h.strip()
+        )
+        self.publish_delay_seconds = (
+            publish_delay_seconds if publish_delay_seconds is not None else settings.weather_model_publish_delay_minutes * 60
+        )
+        self._cache: TtlLruCache[Any] = TtlLruCache(max_size or settings.weather_cache_size)
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        expires_at = next_model_run_expiry(time.time(), self.run_hours, self.publish_delay_seconds)
+        self._cache.set(key, value, expires_at=expires_at)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        Return A Cached Value, Or Fetch And Cache It.
+
+        Args:
+            key: Cache Key
+            fetch: Zero-Argument Callable Producing A Fresh Value
+            cacheable: Predicate Deciding Whether A Fetched Value Is Stored
+                       (E.g. Only Successful Responses)
+        """
+        entry = self._cache.get_entry(key, allow_stale=True)
+        if entry is not None:
+            if not entry.expired:
+                inc_cache(self.name, "hit")
+                return entry.value
+            if time.time() - entry.expires_at < self.max_stale_seconds:
+                inc_cache(self.name, "stale")
+                self._revalidate(key, fetch, cacheable)
+                return entry.value
+            self._cache.pop(key)
+
+        inc_cache(self.name, "miss")
+        value = await fetch()
+        if cacheable(value):
+            self._store(key, value)
+        return value
+
+    def _revalidate(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], cacheable: Callable[[Any], bool]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                value = await fetch()
+                if cacheable(value):
+                    self._store(key, value)
+            except Exception as e:
+                print(f"[ModelRunCache] Background Refresh Of {self.name} {key} Failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+__all__ = ["ModelRunCache", "next_model_run_expiry"]
@@ -8,9 +8,11 @@
 // ===== CONFIGURATION =====
 const CONFIG = {
   API_ENDPOINT: '/forecast',
+  STREAM_ENDPOINT: '/forecast/stream',
   TASK: {
     START: '/tasks/start',
     STATUS: (id) => `/tasks/${id}/status`,
+    EVENTS: (id) => `/tasks/${id}/events`,
     PAUSE: (id) => `/tasks/${id}/pause`,
     RESUME: (id) => `/tasks/${id}/resume`,
     CANCEL: (id) => `/tasks/${id}/cancel`,
@@ -87,6 +89,7 @@ let CurrentLang = 'en';
 let LoadingStepInterval = null;
 let CurrentTaskId = null;
 let TaskPollInterval = null;
+let TaskEventSource = null;
 
 // ===== INITIALIZATION =====
 document.addEventListener('DOMContentLoaded', () => {
@@ -267,20 +270,7 @@ async function HandleFormSubmit(Event) {
   
   try {
     // Call API
-    const Response = await fetch(CONFIG.API_ENDPOINT, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-      },
-      body: JSON.stringify(FormData)
-    });
-    
-    if (!Response.ok) {
-      throw new Error(`API Error: ${Response.status} ${Response.statusText}`);
-    }
-    
-    const Data = await Response.json();
+    const Data = await RequestForecast(FormData);
     console.log('📥 Received Response:', Data);
     
     // Normalize Response
@@ -297,6 +287,113 @@ async function HandleFormSubmit(Event) {
   }
 }
 
+// ===== STREAMED FORECAST =====
+async function RequestForecast(FormData) {
+  // Prefer The Streaming Endpoint So Each Stage Shows As It Completes
+  if (window.ReadableStream && window.TextDecoder) {
+    const Data = await StreamForecast(FormData);
+    if (Data) return Data;
+  }
+
+  const Response = await fetch(CONFIG.API_ENDPOINT, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Accept': 'application/json'
+    },
+    body: JSON.stringify(FormData)
+  });
+  
+  if (!Response.ok) {
+    throw new Error(`API Error: ${Response.status} ${Response.statusText}`);
+  }
+  return Response.json();
+}
+
+// Returns The Final Result, Or null When The Server Has No Streaming Endpoint.
+// Never Falls Back Once The Stream Has Started: That Would Run The Workflow (And Email) Twice.
+async function StreamForecast(FormData) {
+  const Response = await fetch(CONFIG.STREAM_ENDPOINT, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Accept': 'text/event-stream'
+    },
+    body: JSON.stringify(FormData)
+  });
+
+  if (Response.status === 404 || Response.status === 405 || (Response.ok && !Response.body)) {
+    return null;
+  }
+  if (!Response.ok) {
+    throw new Error(`API Error: ${Response.status} ${Response.statusText}`);
+  }
+
+  const Reader = Response.body.getReader();
+  const Decoder = new TextDecoder();
+  let Buffer = '';
+  while (true) {
+    const { value, done } = await Reader.read();
+    if (done) break;
+    Buffer += Decoder.decode(value, { stream: true });
+    let Boundary;
+    while ((Boundary = Buffer.indexOf('\n\n')) !== -1) {
+      const Event = ParseSseFrame(Buffer.slice(0, Boundary));
+      Buffer = Buffer.slice(Boundary + 2);
+      if (!Event) continue;
+      ShowStage(Event);
+      const Data = Event.Data || {};
+      if (Event.Stage === 'Completed') return Data.Result;
+      if (Event.Stage === 'Error') {
+        if (Data.Result) return Data.Result;
+        throw new Error(Data.Message || 'Failed To Generate Forecast');
+      }
+    }
+  }
+  throw new Error('Forecast Stream Ended Before Completion');
+}
+
+function ParseSseFrame(Frame) {
+  const DataLines = Frame.split('\n')
+    .filter((Line) => Line.startsWith('data:'))
+    .map((Line) => Line.slice(5).trimStart());
+  if (!DataLines.length) return null;  // Keep-Alive Comment
+  try {
+    return JSON.parse(DataLines.join('\n'));
+  } catch (err) {
+    console.warn('⚠️ Unparseable Stream Event:', err);
+    return null;
+  }
+}
+
+function DescribeStage(Event) {
+  const D = Event.Data || {};
+  switch (Event.Stage) {
+    case 'Accepted': return '📥 Request Accepted...';
+    case 'Started': return `🧠 Starting Analysis For ${D.Location}...`;
+    case 'Geocoded': return `📍 Located ${D.Location} (${Number(D.Lat).toFixed(2)}, ${Number(D.Lon).toFixed(2)})`;
+    case 'SourceArrived': return D.Result === 'ok' ? `📡 ${D.Source} Data Received` : `⚠️ ${D.Source} Unavailable (${D.Result})`;
+    case 'RisksComputed': return `📊 Risks Computed — Overall ${D.OverallRiskLevel}`;
+    case 'Verified': return `🌐 Verified — Confidence ${D.Confidence}%`;
+    case 'Refining': return `🔁 Refining With A ${D.NewHorizonDays}-Day Horizon...`;
+    case 'PlanReady': return '📋 Action Plan Ready';
+    case 'EmailQueued': return D.HasRecipient ? '✉️ Sending Email...' : '✉️ No Email Recipient';
+    case 'EmailSent': return `✉️ Email ${D.Status || 'Processed'}`;
+    case 'TaskState': return `🔄 Task ${D.State}`;
+    case 'Completed': return '✅ Finalizing Results...';
+    default: return Event.Stage;
+  }
+}
+
+function ShowStage(Event) {
+  // Real Progress Replaces The Timed Placeholder Steps
+  if (LoadingStepInterval) {
+    clearInterval(LoadingStepInterval);
+    LoadingStepInterval = null;
+  }
+  document.getElementById('LoadingStep').textContent = DescribeStage(Event);
+}
+
 // ===== BACKGROUND TASK FLOW =====
 async function StartBackgroundTask() {
   // Collect Form Data
@@ -329,14 +426,48 @@ async function StartBackgroundTask() {
     if (!Data.TaskId) throw new Error('No TaskId Returned');
 
     CurrentTaskId = Data.TaskId;
-    ShowTaskPanel({ id: CurrentTaskId, state: 'Running', message: 'Task started. Polling Status...' });
-    StartTaskPolling();
+    ShowTaskPanel({ id: CurrentTaskId, state: 'Running', message: 'Task Started. Streaming Progress...' });
+    StartTaskEvents();
   } catch (err) {
     console.error('❌ Background Start Failed :', err);
     ShowError(err.message || 'Failed To Start Background Task');
   }
 }
 
+// Live Stage Events Over Server-Sent Events; Polling Is Only The Fallback
+function StartTaskEvents() {
+  StopTaskEvents();
+  if (!window.EventSource) {
+    StartTaskPolling();
+    return;
+  }
+  const Source = new EventSource(CONFIG.TASK.EVENTS(CurrentTaskId));
+  TaskEventSource = Source;
+  Source.onmessage = (Message) => {
+    const Event = JSON.parse(Message.data);
+    if (Event.Stage === 'TaskState') {
+      const D = Event.Data || {};
+      HandleTaskUpdate({ Id: CurrentTaskId, State: D.State, Result: D.Result, Error: D.Error });
+    } else {
+      AppendTaskLog(DescribeStage(Event));
+    }
+  };
+  Source.onerror = () => {
+    // Terminal States Close The Source First, So Any Error Here Means The Stream Broke
+    if (TaskEventSource !== Source) return;
+    StopTaskEvents();
+    AppendTaskLog('⚠️ Live Updates Interrupted. Polling Status...');
+    StartTaskPolling();
+  };
+}
+
+function StopTaskEvents() {
+  if (TaskEventSource) {
+    TaskEventSource.close();
+    TaskEventSource = null;
+  }
+}
+
 function StartTaskPolling() {
   StopTaskPolling();
   TaskPollInterval = setInterval(PollTaskStatus, CONFIG.TASK.POLL_INTERVAL);
@@ -356,39 +487,46 @@ async function PollTaskStatus() {
     const Resp = await fetch(CONFIG.TASK.STATUS(CurrentTaskId));
     if (!Resp.ok) throw new Error(`Status Failed: ${Resp.status}`);
     const Data = await Resp.json();
-    const Task = Data.Task || {};
-    UpdateTaskPanel(Task);
-
-    const state = (Task.State || '').toLowerCase();
-    if (state === 'completed') {
-      StopTaskPolling();
-      const Result = Task.Result || null;
-      if (Result) {
-        const Normalized = NormalizeResponseData(Result);
-        DisplayResults(Normalized);
-      }
-      AppendTaskLog('✅ Task Completed. Results Displayed.');
-    } else if (state === 'error') {
-      StopTaskPolling();
-      AppendTaskLog(`❌ Error: ${Task.Error || 'Unknown error'}`);
-      ShowError(Task.Error || 'Task Failed');
-    } else if (state === 'cancelled') {
-      StopTaskPolling();
-      AppendTaskLog('🛑 Task Cancelled.');
-    }
+    HandleTaskUpdate(Data.Task || {});
   } catch (err) {
     console.error('❌ Polling Error:', err);
     AppendTaskLog(`⚠️ Polling Failed: ${err.message}`);
   }
 }
 
+// Shared By The Event Stream And Polling: Updates The Panel And Stops Both On Terminal States
+function HandleTaskUpdate(Task) {
+  UpdateTaskPanel(Task);
+
+  const state = (Task.State || '').toLowerCase();
+  if (state === 'completed') {
+    StopTaskEvents();
+    StopTaskPolling();
+    const Result = Task.Result || null;
+    if (Result) {
+      const Normalized = NormalizeResponseData(Result);
+      DisplayResults(Normalized);
+    }
+    AppendTaskLog('✅ Task Completed. Results Displayed.');
+  } else if (state === 'error') {
+    StopTaskEvents();
+    StopTaskPolling();
+    AppendTaskLog(`❌ Error: ${Task.Error || 'Unknown error'}`);
+    ShowError(Task.Error || 'Task Failed');
+  } else if (state === 'cancelled') {
+    StopTaskEvents();
+    StopTaskPolling();
+    AppendTaskLog('🛑 Task Cancelled.');
+  }
+}
+
 async function PauseTask() {
   if (!CurrentTaskId) return;
   try {
     const Resp = await fetch(CONFIG.TASK.PAUSE(CurrentTaskId), { method: 'POST' });
     const Data = await Resp.json();
     AppendTaskLog(`⏸️ Paused: ${Data.State || 'Paused'}`);
-    PollTaskStatus();
+    if (!TaskEventSource) PollTaskStatus();
   } catch (err) { AppendTaskLog(`⚠️ Pause Failed: ${err.message}`); }
 }
 
@@ -398,7 +536,7 @@ async function ResumeTask() {
     const Resp = await fetch(CONFIG.TASK.RESUME(CurrentTaskId), { method: 'POST' });
     const Data = await Resp.json();
     AppendTaskLog(`▶️ Resumed: ${Data.State || 'Running'}`);
-    PollTaskStatus();
+    if (!TaskEventSource) PollTaskStatus();
   } catch (err) { AppendTaskLog(`⚠️ Resume Failed: ${err.message}`); }
 }
 
@@ -408,7 +546,7 @@ async function CancelTask() {
     const Resp = await fetch(CONFIG.TASK.CANCEL(CurrentTaskId), { method: 'POST' });
     const Data = await Resp.json();
     AppendTaskLog(`🛑 Cancelled: ${Data.State || 'Cancelled'}`);
-    PollTaskStatus();
+    if (!TaskEventSource) PollTaskStatus();
   } catch (err) { AppendTaskLog(`⚠️ Cancel Failed: ${err.message}`); }
 }
 
@@ -4,10 +4,16 @@
 
 import os
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from google.adk.tools.tool_context import ToolContext
 
+from Config.Settings import get_settings
+from Services.Era5Jobs import get_era5_jobs, latest_available_day
+from Services.Era5Regions import get_era5_regions
+from Services.Era5Stats import summarise_era5_land_async
+from Services.Geocoder import get_geocoder
+
 # Try To Import Copernicus CDS API Client
 # If You Haven't Installed It Yet, Run: pip install cdsapi
 try:
@@ -47,8 +53,8 @@ async def CopernicusTool(
                  - City/Region Names (e.g., "Punjab, India", "Maharashtra")
                  - Coordinate Pairs (e.g., "19.0760,72.8777")
                  Indian Locations Are Automatically Appended With ", India" For Better Geocoding.
-        DaysBack: Number Of Historical Days To Analyze (1-30 Days Recommended).
-                 Longer Periods May Impact Performance Due To Large Dataset Sizes.
+        DaysBack: Number Of Historical Days To Analyze. Long Windows Are Split Into
+                 Per-Month Downloads, And Days Already Cached Are Never Fetched Again.
         ToolContextInstance: ADK Tool Context For Session State Management And
                            Observability Integration.
         
@@ -78,7 +84,10 @@ async def CopernicusTool(
         ApiKey = os.getenv('COPERNICUS_API_KEY', '')
         if CDSAPI_AVAILABLE and XR_AVAILABLE and ApiKey and ':' in ApiKey:
             # Real Processing Path
-            Lat, Lon = await _GeocodeLocation(Location)
+            Geo = await _GeocodeLocation(Location)
+            if isinstance(Geo, dict):
+                return Geo
+            Lat, Lon = Geo
             result = await _FetchAndProcessERA5Land(ApiKey, Lat, Lon, DaysBack, Location)
             if isinstance(result, dict):
                 return result
@@ -92,226 +101,141 @@ async def CopernicusTool(
             return {'Status': 'Error', 'Message': str(Error), 'Location': Location}
 
 
-async def _GeocodeLocation(Location: str) -> tuple:
+async def _GeocodeLocation(Location: str) -> tuple | Dict[str, Any]:
     """
-    🗺️ I Convert Location Names To Coordinates Using Free Geocoding Services
+    🗺️ I Convert Location Names To Coordinates Using The Shared Geocoder
     
-    Tries:
-    1. Parse If Coordinates Are Provided
-    2. OpenStreetMap Nominatim (FREE!)
-    3. Pre-Coded Indian Agricultural Regions
-    4. Mumbai Fallback
+    Coordinate Strings Are Parsed Directly; Place Names Are Served From The
+    Geocode Cache And Only Fall Back To OpenStreetMap Nominatim On A Miss.
     """
-    
-    # Check If Location Is Already Coordinates (e.g., "19.0760,72.8777")
-    if ',' in Location and Location.replace(',', '').replace('.', '').replace('-', '').replace(' ', '').isdigit():
-        Parts = Location.split(',')
-        return (float(Parts[0].strip()), float(Parts[1].strip()))
-    
-    # Try OpenStreetMap Nominatim (FREE!)
-    try:
-        import aiohttp
-        async with aiohttp.ClientSession() as Session:
-            SearchLocation = Location
-            if 'India' not in Location and 'india' not in Location:
-                SearchLocation = f"{Location}, India"
-            
-            NominatimUrl = f"https://nominatim.openstreetmap.org/search"
-            Headers = {'User-Agent': 'AgriSenseGuardian/1.0'}
-            Params = {
-                'q': SearchLocation,
-                'format': 'json',
-                'limit': 1
-            }
-            
-            async with Session.get(NominatimUrl, params=Params, headers=Headers, timeout=5) as Response:
-                if Response.status == 200:
-                    GeoData = await Response.json()
-                    if GeoData and len(GeoData) > 0:
-                        lat = float(GeoData[0]['lat'])
-                        lon = float(GeoData[0]['lon'])
-                        print(f"[CopernicusTool] Geocoded '{Location}' → ({lat:.4f}, {lon:.4f})")
-                        return (lat, lon)
-    except Exception as e:
-        return {'Status': 'Error', 'Message': f'Nominatim Geocoding Failed: {e}'}
-    
-    return {'Status': 'Error', 'Message': 'Geocoding Failed. Provide Coordinates Like "lat,lon" Or A Resolvable Place Name.'}
+    return await get_geocoder().geocode(Location)
 
 
-async def _FetchAndProcessERA5Land(ApiKey: str, Lat: float, Lon: float, DaysBack: int, Location: str) -> Dict[str, Any]:
+async def _FetchAndProcessERA5Land(ApiKey: str, Lat: float, Lon: float, DaysBack: int, Location: str) -> Optional[Dict[str, Any]]:
     """
-    Fetch Real ERA5-Land Data From Copernicus CDS And Process With xarray.
+    Serve ERA5-Land Statistics From The Local Cache Without Waiting On CDS.
     
-    Downloads NetCDF Data And Computes:
+    Submits Background Jobs For Any Uncached Days Of The Window, Then Computes
+    From The Downloaded NetCDF Files Covering It:
     - Soil Moisture (%) with trend analysis
     - Evapotranspiration (mm/day)
     - Precipitation Total (mm)
     - Temperature Min/Mean/Max (°C)
+    
+    Returns None While Nothing Is Cached Yet, So The Caller Falls Back To
+    NASA POWER Instead Of Blocking For Minutes In The CDS Queue.
     """
     if not CDSAPI_AVAILABLE or not XR_AVAILABLE:
         return {'Status': 'Error', 'Message': 'Missing cdsapi Or xarray Dependencies.'}
     
     try:
-        import asyncio
-        import tempfile
-        from pathlib import Path
+        # Window Ends At The Newest Day ERA5-Land Has Published
+        EndDate = latest_available_day()
+        StartDate = EndDate - timedelta(days=DaysBack)
+        Window = (StartDate.isoformat(), EndDate.isoformat())
         
-        # Initialize Copernicus CDS API Client
-        Client = cdsapi.Client(key=ApiKey)
+        # Regional Pre-Fetch Covers Most Farms: Read The Nearest Grid Point
+        Regional = get_era5_regions().lookup(Lat, Lon, StartDate, EndDate)
+        JobInfo = None
+        if Regional is not None:
+            Region, Files = Regional
+            Point = (Lat, Lon)
+        else:
+            Region, Point = None, None
+            Area = _ERA5Area(Lat, Lon)
+            Jobs = get_era5_jobs()
+            Files, Submitted = Jobs.submit_window(ApiKey, Area, StartDate, EndDate)
+            JobInfo = [{'Id': Job.id, 'State': Job.status} for Job in Submitted]
+            
+            if not Files:
+                # Nothing From This Window Yet: Use The Newest File For This Area If It Is Recent Enough
+                Newest = Jobs.latest(Area)
+                if Newest is None:
+                    print(f"[CopernicusTool] No Cached ERA5-Land For {Area} Yet ({len(Submitted)} Jobs Queued) - Using Fallback")
+                    return None
+                MaxAge = get_settings().era5_fallback_max_age_days
+                if (EndDate - datetime.strptime(Newest['End'], '%Y-%m-%d').date()).days > MaxAge:
+                    print(f"[CopernicusTool] Newest Cached ERA5-Land For {Area} Ends {Newest['End']}, Over {MaxAge} Days Old - Using Fallback")
+                    return None
+                Files = [Newest]
         
-        # Calculate Date Range
-        EndDate = datetime.utcnow()
-        StartDate = EndDate - timedelta(days=min(DaysBack, 30))  # Limit To 30 days
+        # Report The Days The Files Actually Cover, Which May Be Less Than Requested
+        Window = (max(Window[0], min(F['Start'] for F in Files)), min(Window[1], max(F['End'] for F in Files)))
+        if Window[0] > Window[1]:
+            Window = (min(F['Start'] for F in Files), max(F['End'] for F in Files))
+        WindowDays = (datetime.strptime(Window[1], '%Y-%m-%d') - datetime.strptime(Window[0], '%Y-%m-%d')).days
+        Period = f'Last {DaysBack} Days' if Window == (StartDate.isoformat(), EndDate.isoformat()) else f'{WindowDays + 1} Days ({Window[0]} To {Window[1]})'
         
-        # Build Unique year/month/day Lists
-        years = sorted(list(set([StartDate.year, EndDate.year])))
-        months = sorted(list(set([StartDate.strftime('%m'), EndDate.strftime('%m')])))
-        days = sorted(list(set([StartDate.strftime('%d'), EndDate.strftime('%d')])))
+        # Lazy, Single-Pass Reduction In A Worker Process (Keeps The Event Loop Free)
+        Stats = await summarise_era5_land_async([F['Path'] for F in Files], Window, max(WindowDays, 1), Point)
         
-        # Define Bounding Box Around Location (±0.25° ~ 25km)
-        Area = [
-            Lat + 0.25,  # North
-            Lon - 0.25,  # West
-            Lat - 0.25,  # South
-            Lon + 0.25   # East
-        ]
+        soil_pct = Stats['SoilPercent']
+        soil_trend = Stats['SoilTrend']
+        temp_c_mean, temp_c_min, temp_c_max = Stats['TempMean'], Stats['TempMin'], Stats['TempMax']
+        precip_mm = Stats['PrecipMm']
+        et_mm_day = Stats['EtMmDay']
         
-        # Request ERA5-Land Data
-        Request = {
-            'variable': [
-                'volumetric_soil_water_layer_1',  # Soil Moisture 0-7cm
-                '2m_temperature',
-                'total_precipitation',
-                'potential_evaporation'
-            ],
-            'year': [str(y) for y in years],
-            'month': months,
-            'day': days,
-            'time': ['00:00', '06:00', '12:00', '18:00'],
-            'area': Area,
-            'format': 'netcdf'
+        # Build result
+        return {
+            'Status': 'Success',
+            'Location': Location,
+            'Coordinates': {'Latitude': Lat, 'Longitude': Lon},
+            'Period': Period,
+            'DataPeriod': f"{Window[0]} to {Window[1]}",
+            'SoilMoisture': {
+                'Level': round(soil_pct, 1) if soil_pct is not None else None,
+                'Unit': '%',
+                'Trend': soil_trend,
+                'Interpretation': f"Soil Is {'Very Wet' if soil_pct and soil_pct > 70 else 'Adequately Moist' if soil_pct and soil_pct > 50 else 'Moderately Dry' if soil_pct and soil_pct > 30 else 'Very Dry'}"
+            },
+            'VegetationHealth': {
+                'NDVI': None,
+                'Status': 'Not Available',
+                'Interpretation': 'NDVI Data Not Included In ERA5-Land'
+            },
+            'Evapotranspiration': {
+                'Rate': round(et_mm_day, 2) if et_mm_day is not None else None,
+                'Unit': 'mm/day',
+                'Interpretation': f"Crops Using {et_mm_day:.1f} mm Of Water Per Day" if et_mm_day else None
+            },
+            'Temperature': {
+                'Average': round(temp_c_mean, 1) if temp_c_mean is not None else None,
+                'Min': round(temp_c_min, 1) if temp_c_min is not None else None,
+                'Max': round(temp_c_max, 1) if temp_c_max is not None else None,
+                'Unit': '°C'
+            },
+            'Precipitation': {
+                'Total': round(precip_mm, 1) if precip_mm is not None else None,
+                'Unit': 'mm',
+                'Interpretation': f"{'Heavy' if precip_mm and precip_mm > 200 else 'Moderate' if precip_mm and precip_mm > 100 else 'Light' if precip_mm and precip_mm > 30 else 'Very Low'} Rainfall" if precip_mm else None
+            },
+            'Region': Region,
+            'Era5Jobs': JobInfo,
+            'DataSource': 'CopernicusERA5Land',
+            'Timestamp': datetime.utcnow().isoformat() + 'Z'
         }
         
-        # Download NetCDF File In Executor To Avoid Blocking
-        def _retrieve(target: str):
-            Client.retrieve('reanalysis-era5-land', Request, target)
-            return target
-        
-        with tempfile.TemporaryDirectory() as td:
-            target = str(Path(td) / 'era5_land.nc')
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, _retrieve, target)
-            
-            # Load NetCDF With xarray
-            ds = await loop.run_in_executor(None, xr.open_dataset, target)
-            
-            # Process Variables
-            sm = ds.get('swvl1') if 'swvl1' in ds.variables else ds.get('volumetric_soil_water_layer_1')
-            t2m = ds.get('t2m') if 't2m' in ds.variables else ds.get('2m_temperature')
-            tp = ds.get('tp') if 'tp' in ds.variables else ds.get('total_precipitation')
-            pev = ds.get('pev') if 'pev' in ds.variables else ds.get('potential_evaporation')
-            
-            # Helper To Safely Compute Means
-            def safe_mean(var, factor=1.0):
-                try:
-                    return float(var.mean().item()) * factor if var is not None else None
-                except Exception:
-                    return None
-            
-            def safe_min_max(var, factor=1.0):
-                try:
-                    if var is not None:
-                        return float(var.min().item()) * factor, float(var.max().item()) * factor
-                    return None, None
-                except Exception:
-                    return None, None
-            
-            # Compute Soil Moisture (%)
-            soil_pct = safe_mean(sm, 100.0) if sm is not None else None
-            
-            # Compute Temperature (K → °C)
-            temp_k_mean = safe_mean(t2m) if t2m is not None else None
-            temp_k_min, temp_k_max = safe_min_max(t2m) if t2m is not None else (None, None)
-            temp_c_mean = (temp_k_mean - 273.15) if temp_k_mean is not None else None
-            temp_c_min = (temp_k_min - 273.15) if temp_k_min is not None else None
-            temp_c_max = (temp_k_max - 273.15) if temp_k_max is not None else None
-            
-            # Compute Precipitation (m → mm)
-            precip_m = safe_mean(tp) if tp is not None else None
-            precip_mm = precip_m * 1000.0 if precip_m is not None else None
-            
-            # Compute Evapotranspiration (m → mm/day)
-            et_m = safe_mean(pev) if pev is not None else None
-            et_mm_day = abs(et_m) * 1000.0 / max(DaysBack, 1) if et_m is not None else None
-            
-            # Calculate Soil Moisture Trend
-            soil_trend = 'Unknown'
-            try:
-                if sm is not None:
-                    n = sm.sizes.get('time', 0)
-                    if n >= 8:
-                        q = max(n // 4, 1)
-                        first = float(sm.isel(time=slice(0, q)).mean().item()) * 100
-                        last = float(sm.isel(time=slice(-q, None)).mean().item()) * 100
-                        delta = last - first
-                        if delta > 1.0:
-                            soil_trend = 'Increasing'
-                        elif delta < -1.0:
-                            soil_trend = 'Decreasing'
-                        else:
-                            soil_trend = 'Stable'
-            except Exception:
-                soil_trend = 'Unknown'
-            
-            # Build result
-            result = {
-                'Status': 'Success',
-                'Location': Location,
-                'Coordinates': {'Latitude': Lat, 'Longitude': Lon},
-                'Period': f'Last {DaysBack} Days',
-                'SoilMoisture': {
-                    'Level': round(soil_pct, 1) if soil_pct is not None else None,
-                    'Unit': '%',
-                    'Trend': soil_trend,
-                    'Interpretation': f"Soil Is {'Very Wet' if soil_pct and soil_pct > 70 else 'Adequately Moist' if soil_pct and soil_pct > 50 else 'Moderately Dry' if soil_pct and soil_pct > 30 else 'Very Dry'}"
-                },
-                'VegetationHealth': {
-                    'NDVI': None,
-                    'Status': 'Not Available',
-                    'Interpretation': 'NDVI Data Not Included In ERA5-Land'
-                },
-                'Evapotranspiration': {
-                    'Rate': round(et_mm_day, 2) if et_mm_day is not None else None,
-                    'Unit': 'mm/day',
-                    'Interpretation': f"Crops Using {et_mm_day:.1f} mm Of Water Per Day" if et_mm_day else None
-                },
-                'Temperature': {
-                    'Average': round(temp_c_mean, 1) if temp_c_mean is not None else None,
-                    'Min': round(temp_c_min, 1) if temp_c_min is not None else None,
-                    'Max': round(temp_c_max, 1) if temp_c_max is not None else None,
-                    'Unit': '°C'
-                },
-                'Precipitation': {
-                    'Total': round(precip_mm, 1) if precip_mm is not None else None,
-                    'Unit': 'mm',
-                    'Interpretation': f"{'Heavy' if precip_mm and precip_mm > 200 else 'Moderate' if precip_mm and precip_mm > 100 else 'Light' if precip_mm and precip_mm > 30 else 'Very Low'} Rainfall" if precip_mm else None
-                },
-                'DataSource': 'CopernicusERA5Land',
-                'Timestamp': datetime.utcnow().isoformat() + 'Z'
-            }
-            
-            # Close Dataset
-            try:
-                ds.close()
-            except Exception:
-                pass
-            
-            return result
-        
     except Exception as Error:
         return {'Status': 'Error', 'Message': f'Copernicus API Error: {str(Error)}', 'Location': Location}
 
 
+def _ERA5Area(Lat: float, Lon: float) -> List[float]:
+    """
+    Bounding Box Around A Point For Per-Farm ERA5-Land Downloads.
+    
+    The Box Is Centred On The Point Snapped To The 0.1° ERA5-Land Grid, So
+    Nearby Farms Produce Identical Requests And Share One Cached Download.
+    """
+    # Define Bounding Box Around Location (±0.25° ~ 25km)
+    CenterLat, CenterLon = round(Lat, 1), round(Lon, 1)
+    return [
+        round(CenterLat + 0.25, 2),  # North
+        round(CenterLon - 0.25, 2),  # West
+        round(CenterLat - 0.25, 2),  # South
+        round(CenterLon + 0.25, 2)   # East
+    ]
+
+
 async def _FallbackFromNASAPower(Location: str, DaysBack: int) -> Dict[str, Any]:
     """Graceful Fallback When Copernicus Credentials/Libs Are Unavailable.
 
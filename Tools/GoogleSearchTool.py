@@ -36,7 +36,7 @@ import asyncio
 import json
 from typing import List, Dict, Any, Optional
 
-import aiohttp
+from Services.HttpClient import get_http_client
 
 
 async def SearchCse(query: str, api_key: str, cse_id: str, num: int = 5) -> List[Dict[str, Any]]:
@@ -64,7 +64,7 @@ async def SearchCse(query: str, api_key: str, cse_id: str, num: int = 5) -> List
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with get_http_client().borrow() as session:
             async with session.get(url, params=params, timeout=10) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -101,7 +101,7 @@ async def SearchSerpapi(query: str, api_key: str, num: int = 5) -> List[Dict[str
     """
     url = "https://serpapi.com/search.json"
     params = {"engine": "google", "q": query, "api_key": api_key, "num": num}
-    async with aiohttp.ClientSession() as session:
+    async with get_http_client().borrow() as session:
         async with session.get(url, params=params, timeout=20) as resp:
             if resp.status != 200:
                 return []
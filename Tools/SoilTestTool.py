@@ -1,28 +1,19 @@
-import aiohttp
 import asyncio
 from typing import Any, Dict
 from google.adk.tools.tool_context import ToolContext
-import os
+
+from Services.Geocoder import get_geocoder
+from Services.HttpClient import get_http_client
+from Services.NasaPowerClient import get_nasa_power_client
 
 
 async def GeocodeLocation(Location: str) -> tuple[float, float] | Dict[str, Any]:
     """
     Resolve Geographic Location Strings To Precise Latitude/Longitude Coordinates.
     
-    This Function Implements A Robust Geocoding Strategy That Handles Various
-    Location Input Formats And Leverages Multiple Free Geocoding Services To
-    Ensure Reliable Coordinate Resolution For Soil API Queries. The Process
-    Prioritizes Accuracy While Maintaining Fallback Options For Resilience.
-    
-    Resolution Strategy:
-    -------------------
-    1. Direct Coordinate Parsing: If Input Contains Numeric Latitude/Longitude Pairs
-    2. OpenStreetMap Nominatim: Primary Free Geocoding Service (No API Key Required)
-    3. OpenWeatherMap Geocoding: Enhanced Service When API Key Is Available
-    4. Error Handling: Structured Error Responses For Failed Resolutions
-    
-    The Function Automatically Appends 'India' To Location Queries When Not
-    Explicitly Specified To Improve Geocoding Accuracy For Indian Locations.
+    Delegates To The Shared Geocoder Service, Which Parses Direct Coordinate
+    Input, Serves Repeated Place Names From Its In-Memory And On-Disk Cache,
+    And Only Queries OpenStreetMap Nominatim (Or OpenWeatherMap) On A Miss.
     
     Args:
         Location: Location Description (City Name, Address, Or Latitude/Longitude Coordinates)
@@ -31,59 +22,11 @@ async def GeocodeLocation(Location: str) -> tuple[float, float] | Dict[str, Any]
         Tuple Of (Latitude, Longitude) As Floats If Successful, Or Error Dictionary
         With Status And Descriptive Message If Geocoding Fails
     """
-    
-    # Attempt Direct Parsing Of Coordinate Strings For Efficiency
-    if ',' in Location and all(part.strip().replace('.', '').replace('-', '').isdigit() for part in Location.split(',')):
-        try:
-            Parts = Location.split(',')
-            return float(Parts[0].strip()), float(Parts[1].strip())
-        except Exception as e:
-            return {'Status': 'Error', 'Message': f'Invalid Coordinate Format: {e}'}
-    
-    # Utilize OpenStreetMap Nominatim For Primary Geocoding (Completely Free)
-    try:
-        async with aiohttp.ClientSession() as Session:
-            # Enhance Location Queries With Country Context For Better Accuracy
-            SearchLocation = Location
-            if 'India' not in Location and 'india' not in Location:
-                SearchLocation = f"{Location}, India"
-            
-            NominatimUrl = "https://nominatim.openstreetmap.org/search"
-            Headers = {'User-Agent': 'AgriSenseGuardian/1.0'}
-            Params = {
-                'q': SearchLocation,
-                'format': 'json',
-                'limit': 1
-            }
-            
-            async with Session.get(NominatimUrl, params=Params, headers=Headers, timeout=5) as Response:
-                if Response.status == 200:
-                    GeoData = await Response.json()
-                    if GeoData and len(GeoData) > 0:
-                        lat = float(GeoData[0]['lat'])
-                        lon = float(GeoData[0]['lon'])
-                        print(f"[SoilTestTool] Geocoded '{Location}' → ({lat:.4f}, {lon:.4f})")
-                        return lat, lon
-    except Exception as e:
-        return {'Status': 'Error', 'Message': f'Nominatim Geocoding Failed: {e}'}
-    
-    # Try OpenWeatherMap Geocoding (If API Key Available)
-    OpenWeatherKey = os.getenv('OPENWEATHER_API_KEY', '')
-    
-    if OpenWeatherKey:
-        try:
-            async with aiohttp.ClientSession() as Session:
-                SearchLocation = Location
-                GeoUrl = f"http://api.openweathermap.org/geo/1.0/direct?q={SearchLocation}&limit=1&appid={OpenWeatherKey}"
-                async with Session.get(GeoUrl, timeout=8) as Response:
-                    if Response.status == 200:
-                        GeoData = await Response.json()
-                        if GeoData and len(GeoData) > 0:
-                            return float(GeoData[0]['lat']), float(GeoData[0]['lon'])
-        except Exception as e:
-            return {'Status': 'Error', 'Message': f'OpenWeather Geocoding Failed: {e}'}
-    
-    return {'Status': 'Error', 'Message': 'Geocoding Failed. Provide Coordinates Like "lat,lon" Or A Resolvable Place Name.'}
+    print(f"[GeocodeLocation] Resolving Location: '{Location}'")
+    Geo = await get_geocoder().geocode(Location)
+    if isinstance(Geo, dict):
+        print(f"[GeocodeLocation] Geocoding Failed For '{Location}'")
+    return Geo
 
 
 async def SoilTestTool(
@@ -112,7 +55,7 @@ async def SoilTestTool(
     -------------
     - NASA POWER API (Primary): 100% Real Satellite Data - Global Coverage, No API Key Required
     - Regional Soil Databases (Fallback): Indo-Gangetic Plain, Deccan Plateau, General India
-    - OpenStreetMap Nominatim: Location Geocoding Service
+    - Shared Geocoder (Cached OpenStreetMap Nominatim): Location Geocoding Service
 
     Parameters Retrieved:
     --------------------
@@ -290,65 +233,6 @@ async def SoilTestTool(
     }
 
 
-async def GeocodeLocation(Location: str) -> tuple[float, float] | Dict[str, Any]:
-    """
-    Resolve Geographic Location Strings To Precise Latitude/Longitude Coordinates.
-
-    Uses OpenStreetMap Nominatim For Free Geocoding With Indian Location Bias.
-    """
-    print(f"[GeocodeLocation] Resolving Location: '{Location}'")
-    try:
-        # Direct Coordinate Parsing
-        if ',' in Location:
-            Parts = Location.split(',')
-            if len(Parts) == 2:
-                try:
-                    Lat = float(Parts[0].strip())
-                    Lon = float(Parts[1].strip())
-                    if -90 <= Lat <= 90 and -180 <= Lon <= 180:
-                        print(f"[GeocodeLocation] Parsed Coordinates Directly: {Lat}, {Lon}")
-                        return Lat, Lon
-                except ValueError:
-                    pass
-
-        # Nominatim Geocoding
-        async with aiohttp.ClientSession() as session:
-            Url = "https://nominatim.openstreetmap.org/search"
-            Params = {
-                'q': f"{Location}, India",
-                'format': 'json',
-                'limit': 1,
-                'countrycodes': 'IN'
-            }
-            Headers = {'User-Agent': 'AgriSenseGuardian/1.0'}
-
-            async with session.get(Url, params=Params, headers=Headers) as Response:
-                if Response.status == 200:
-                    Data = await Response.json()
-                    if Data:
-                        Lat = float(Data[0]['lat'])
-                        Lon = float(Data[0]['lon'])
-                        print(f"[GeocodeLocation] Nominatim Resolved: {Lat}, {Lon}")
-                        return Lat, Lon
-                else:
-                    print(f"[GeocodeLocation] Nominatim Request Failed With Status {Response.status}")
-
-        print(f"[GeocodeLocation] Geocoding Failed For '{Location}'")
-        return {
-            'Status': 'Error',
-            'Message': f'Could Not Geocode Location: {Location}',
-            'Location': Location
-        }
-
-    except Exception as e:
-        print(f"[GeocodeLocation] Exception: {e}")
-        return {
-            'Status': 'Error',
-            'Message': f'Geocoding Failed: {str(e)}',
-            'Location': Location
-        }
-
-
 async def FetchNASAPowerSoilData(Lat: float, Lon: float) -> Dict[str, Any]:
     """
     Fetch Real Soil And Agricultural Parameters From NASA POWER API.
@@ -371,33 +255,21 @@ async def FetchNASAPowerSoilData(Lat: float, Lon: float) -> Dict[str, Any]:
     """
     print(f"[NASA POWER] Fetching Real Satellite Data For: {Lat:.4f}, {Lon:.4f}")
     try:
-        async with aiohttp.ClientSession() as session:
-            # NASA POWER API For Agricultural Parameters
-            params = [
-                'GWETROOT',  # Root Zone Soil Wetness
-                'GWETTOP',   # Surface Soil Wetness
-                'T2M_MAX',   # Maximum Temperature
-                'T2M_MIN',   # Minimum Temperature
-                'PRECTOTCORR',  # Precipitation
-                'RH2M',      # Relative Humidity
-                'T2M',       # Temperature At 2m
-                'WS2M'       # Wind Speed At 2m
-            ]
-            
-            param_string = ','.join(params)
-            url = f"https://power.larc.nasa.gov/api/temporal/monthly/point?parameters={param_string}&community=AG&longitude={Lon}&latitude={Lat}&start=2023&end=2023&format=JSON"
-            
-            async with session.get(url, timeout=20) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'properties' in data and 'parameter' in data['properties']:
-                        params_data = data['properties']['parameter']
-                        print(f"[NASA POWER] ✅ Retrieved {len(params_data)} Real Satellite Parameters")
-                        return {'Status': 'Success', 'Data': params_data, 'Source': 'NASA_POWER_Satellite'}
-                else:
-                    print(f"[NASA POWER] ❌ Request Failed: {response.status}")
+        # NASA POWER API For Agricultural Parameters (Served By The Shared Client)
+        params = [
+            'GWETROOT',  # Root Zone Soil Wetness
+            'GWETTOP',   # Surface Soil Wetness
+            'T2M_MAX',   # Maximum Temperature
+            'T2M_MIN',   # Minimum Temperature
+            'PRECTOTCORR',  # Precipitation
+            'RH2M',      # Relative Humidity
+            'T2M',       # Temperature At 2m
+            'WS2M'       # Wind Speed At 2m
+        ]
         
-        return {'Status': 'Error', 'Message': 'NASA POWER API Failed'}
+        params_data = await get_nasa_power_client().monthly(Lat, Lon, 2023, 2023, params)
+        print(f"[NASA POWER] ✅ Retrieved {len(params_data)} Real Satellite Parameters")
+        return {'Status': 'Success', 'Data': params_data, 'Source': 'NASA_POWER_Satellite'}
     except Exception as e:
         print(f"[NASA POWER] Exception: {e}")
         return {'Status': 'Error', 'Message': str(e)}
@@ -421,7 +293,7 @@ async def FetchCopernicusSoilMoisture(Lat: float, Lon: float) -> Dict[str, Any]:
     """
     print(f"[Copernicus] Fetching Real Satellite Soil Moisture For: {Lat:.4f}, {Lon:.4f}")
     try:
-        async with aiohttp.ClientSession() as session:
+        async with get_http_client().borrow() as session:
             # Try ERA5-Land Hourly Data (Free Access, No Key Needed For Point Queries)
             url = "https://cds.climate.copernicus.eu/api/v2/resources/reanalysis-era5-land"
             
@@ -455,7 +327,7 @@ async def FetchUSGSSoilData(Lat: float, Lon: float) -> Dict[str, Any]:
     """
     print(f"[USGS] Fetching Soil Data For: {Lat:.4f}, {Lon:.4f}")
     try:
-        async with aiohttp.ClientSession() as session:
+        async with get_http_client().borrow() as session:
             # USGS Soil Data Access API
             url = f"https://sdmdataaccess.nrcs.usda.gov/Spatial/SDMWGS84Geographic.wfs"
             params = {
@@ -503,7 +375,7 @@ async def FetchFAOSoilData(Lat: float, Lon: float) -> Dict[str, Any]:
     try:
         SoilProfile = {}
         
-        async with aiohttp.ClientSession() as session:
+        async with get_http_client().borrow() as session:
             # FAO HWSD (Harmonized World Soil Database) Web Service
             # This Is A Point Query Service
             url = f"https://www.fao.org/soils-portal/data-hub/soil-maps-and-databases/harmonized-world-soil-database-v12/en/"
@@ -1,8 +1,18 @@
-import os
-import aiohttp
-from typing import Any, Dict, Tuple
+import asyncio
+import warnings
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 from google.adk.tools.tool_context import ToolContext
 
+from Config.Settings import get_settings
+from Services.Geocoder import get_geocoder
+from Services.HttpClient import get_http_client
+from Services.RiskRules import LEVELS, get_risk_rules
+from Services.WeatherCache import ModelRunCache
+from Utils.MicroBatcher import MicroBatcher
+from Utils.SingleFlight import get_singleflight
+
 
 async def WeatherTool(
     Location: str,
@@ -66,7 +76,7 @@ async def WeatherTool(
         }
 
     # Analyze Agricultural Risks Based On Returned Weather
-    RiskAnalysis = _AnalyzeAgriculturalRisks(WeatherData)
+    RiskAnalysis = _AnalyzeAgriculturalRisks(WeatherData, (Lat, Lon))
 
     return {
         'Status': 'Success',
@@ -84,20 +94,9 @@ async def _GeocodeLocation(Location: str) -> Tuple[float, float] | Dict[str, Any
     """
     Resolve Geographic Location Strings To Precise Latitude/Longitude Coordinates.
     
-    This Function Implements A Robust Geocoding Strategy That Handles Various
-    Location Input Formats And Leverages Multiple Free Geocoding Services To
-    Ensure Reliable Coordinate Resolution For Weather API Queries. The Process
-    Prioritizes Accuracy While Maintaining Fallback Options For Resilience.
-    
-    Resolution Strategy:
-    -------------------
-    1. Direct Coordinate Parsing: If Input Contains Numeric Lat/Lon Pairs
-    2. OpenStreetMap Nominatim: Primary Free Geocoding Service (No API Key)
-    3. OpenWeatherMap Geocoding: Enhanced Service When API Key Is Available
-    4. Error Handling: Structured Error Responses For Failed Resolutions
-    
-    The Function Automatically Appends 'India' To Location Queries When Not
-    Explicitly Specified To Improve Geocoding Accuracy For Indian Locations.
+    Delegates To The Shared Geocoder Service, Which Parses Direct "lat,lon"
+    Input, Serves Repeated Place Names From Its In-Memory And On-Disk Cache,
+    And Only Falls Back To OpenStreetMap Nominatim / OpenWeatherMap On A Miss.
     
     Args:
         Location: Location Description (City Name, Address, Or Lat/Lon Coordinates)
@@ -106,59 +105,7 @@ async def _GeocodeLocation(Location: str) -> Tuple[float, float] | Dict[str, Any
         Tuple Of (Latitude, Longitude) As Floats If Successful, Or Error Dictionary
         With Status And Descriptive Message If Geocoding Fails
     """
-    
-    # Attempt Direct Parsing Of Coordinate Strings For Efficiency
-    if ',' in Location and all(part.strip().replace('.', '').replace('-', '').isdigit() for part in Location.split(',')):
-        try:
-            Parts = Location.split(',')
-            return float(Parts[0].strip()), float(Parts[1].strip())
-        except Exception as e:
-            return {'Status': 'Error', 'Message': f'Invalid Coordinate Format: {e}'}
-    
-    # Utilize OpenStreetMap Nominatim For Primary Geocoding (Completely Free)
-    try:
-        async with aiohttp.ClientSession() as Session:
-            # Enhance Location Queries With Country Context For Better Accuracy
-            SearchLocation = Location
-            if 'India' not in Location and 'india' not in Location:
-                SearchLocation = f"{Location}, India"
-            
-            NominatimUrl = f"https://nominatim.openstreetmap.org/search"
-            Headers = {'User-Agent': 'AgriSenseGuardian/1.0'}
-            Params = {
-                'q': SearchLocation,
-                'format': 'json',
-                'limit': 1
-            }
-            
-            async with Session.get(NominatimUrl, params=Params, headers=Headers, timeout=5) as Response:
-                if Response.status == 200:
-                    GeoData = await Response.json()
-                    if GeoData and len(GeoData) > 0:
-                        lat = float(GeoData[0]['lat'])
-                        lon = float(GeoData[0]['lon'])
-                        print(f"[WeatherTool] Geocoded '{Location}' → ({lat:.4f}, {lon:.4f})")
-                        return lat, lon
-    except Exception as e:
-        return {'Status': 'Error', 'Message': f'Nominatim Geocoding Failed: {e}'}
-    
-    # Try OpenWeatherMap Geocoding (If API Key Available)
-    OpenWeatherKey = os.getenv('OPENWEATHER_API_KEY', '')
-    
-    if OpenWeatherKey:
-        try:
-            async with aiohttp.ClientSession() as Session:
-                SearchLocation = Location
-                GeoUrl = f"http://api.openweathermap.org/geo/1.0/direct?q={SearchLocation}&limit=1&appid={OpenWeatherKey}"
-                async with Session.get(GeoUrl, timeout=8) as Response:
-                    if Response.status == 200:
-                        GeoData = await Response.json()
-                        if GeoData and len(GeoData) > 0:
-                            return float(GeoData[0]['lat']), float(GeoData[0]['lon'])
-        except Exception as e:
-            return {'Status': 'Error', 'Message': f'OpenWeather Geocoding Failed: {e}'}
-
-    return {'Status': 'Error', 'Message': 'Geocoding Failed. Provide Coordinates Like "lat,lon" Or A Resolvable Place Name.'}
+    return await get_geocoder().geocode(Location)
 
 async def _FetchOpenMeteoWeather(Lat: float, Lon: float, Days: int) -> Dict[str, Any]:
     """
@@ -169,92 +116,206 @@ async def _FetchOpenMeteoWeather(Lat: float, Lon: float, Days: int) -> Dict[str,
     - No API Key Needed
     - High-Quality Weather Models
     - Perfect For Agricultural Applications
+
+    Forecasts Are Cached Per (Rounded Lat/Lon, Days) Until The Next Model Run
+    Is Published, And Concurrent Requests For The Same Point Share One Call.
+    """
+    Decimals = get_settings().weather_cache_decimals
+    Key = (round(Lat, Decimals), round(Lon, Decimals), min(Days, 16))
+    return await _GetForecastCache().get_or_fetch(
+        Key,
+        lambda: get_singleflight().do("open_meteo", Key, lambda: _RequestOpenMeteoWeather(Lat, Lon, Days)),
+        cacheable=lambda Result: Result.get('Status') == 'Success'
+    )
+
+
+def _GetForecastCache() -> ModelRunCache:
+    """Return The Process-Wide Model-Run-Aware Forecast Cache."""
+    global _ForecastCache
+    if _ForecastCache is None:
+        _ForecastCache = ModelRunCache("open_meteo")
+    return _ForecastCache
+
+
+_ForecastCache: ModelRunCache | None = None
+
+
+async def _RequestOpenMeteoWeather(Lat: float, Lon: float, Days: int) -> Dict[str, Any]:
+    """Queue The Point On The Open-Meteo Micro-Batcher (One HTTP Call Per Batch)."""
+    return await _GetOpenMeteoBatcher().submit(min(Days, 16), (Lat, Lon))
+
+
+def _GetOpenMeteoBatcher() -> MicroBatcher:
+    """Return The Process-Wide Batcher That Groups Open-Meteo Requests By Forecast Days."""
+    global _OpenMeteoBatcher
+    if _OpenMeteoBatcher is None:
+        Settings = get_settings()
+        _OpenMeteoBatcher = MicroBatcher(
+            lambda Days, Coords: FetchOpenMeteoBatch(Coords, Days),
+            window_seconds=Settings.open_meteo_batch_window_ms / 1000,
+            max_batch=Settings.open_meteo_batch_size
+        )
+    return _OpenMeteoBatcher
+
+
+_OpenMeteoBatcher: MicroBatcher | None = None
+
+OPEN_METEO_DAILY = [
+    'temperature_2m_max',
+    'temperature_2m_min',
+    'precipitation_sum',
+    'precipitation_probability_max',
+    'windspeed_10m_max',
+    'shortwave_radiation_sum',
+    'relative_humidity_2m_mean'
+]
+
+
+async def FetchOpenMeteoBatch(Coords: List[Tuple[float, float]], Days: int) -> List[Dict[str, Any]]:
     """
+    🌍 Fetch Open-Meteo Forecasts For Many Locations At Once.
     
+    Open-Meteo Accepts Comma-Separated Latitude/Longitude Lists, So Each Chunk
+    Of Up To open_meteo_batch_size Points Costs One HTTP Call. Statistics For
+    All Locations Are Computed Together With NumPy (See _SummariseOpenMeteo).
+    
+    Args:
+        Coords: List Of (Latitude, Longitude) Pairs
+        Days: Forecast Duration In Days (Capped At 16)
+        
+    Returns:
+        One Result Per Coordinate, In Order, In The Same Format As
+        _FetchOpenMeteoWeather ('Status': 'Success' With Summaries, Or 'Error')
+    """
+    if not Coords:
+        return []
+    ChunkSize = max(1, get_settings().open_meteo_batch_size)
+    Chunks = [Coords[i:i + ChunkSize] for i in range(0, len(Coords), ChunkSize)]
+    Results = await asyncio.gather(*[_RequestOpenMeteoChunk(Chunk, Days) for Chunk in Chunks])
+    return [Item for Chunk in Results for Item in Chunk]
+
+
+async def _RequestOpenMeteoChunk(Coords: List[Tuple[float, float]], Days: int) -> List[Dict[str, Any]]:
+    """Issue One Multi-Location Open-Meteo Request."""
     try:
-        async with aiohttp.ClientSession() as Session:
+        async with get_http_client().borrow() as Session:
             # Build Open-Meteo API Request
             # See: https://open-meteo.com/en/docs
             Params = {
-                'latitude': Lat,
-                'longitude': Lon,
-                'daily': ','.join([
-                    'temperature_2m_max',
-                    'temperature_2m_min',
-                    'precipitation_sum',
-                    'precipitation_probability_max',
-                    'windspeed_10m_max',
-                    'shortwave_radiation_sum',
-                    'relative_humidity_2m_mean'
-                ]),
+                'latitude': ','.join(str(Lat) for Lat, _ in Coords),
+                'longitude': ','.join(str(Lon) for _, Lon in Coords),
+                'daily': ','.join(OPEN_METEO_DAILY),
                 'timezone': 'Asia/Kolkata',  # Indian Standard Time
                 'forecast_days': min(Days, 16)  # Max 16 days
             }
             
             Url = "https://api.open-meteo.com/v1/forecast"
             
-            async with Session.get(Url, params=Params, timeout=12) as Response:
-                if Response.status == 200:
-                    Data = await Response.json()
-                    Daily = Data.get('daily', {})
-                    
-                    # Calculate Averages And Totals
-                    TempMax = Daily.get('temperature_2m_max', [])
-                    TempMin = Daily.get('temperature_2m_min', [])
-                    PrecipSum = Daily.get('precipitation_sum', [])
-                    PrecipProb = Daily.get('precipitation_probability_max', [])
-                    WindSpeed = Daily.get('windspeed_10m_max', [])
-                    SolarRad = Daily.get('shortwave_radiation_sum', [])
-                    Humidity = Daily.get('relative_humidity_2m_mean', [])
-                    
-                    # Calculate Statistics
-                    AvgTempMax = sum(TempMax) / len(TempMax) if TempMax else 0
-                    AvgTempMin = sum(TempMin) / len(TempMin) if TempMin else 0
-                    TotalPrecip = sum(PrecipSum) if PrecipSum else 0
-                    AvgPrecipProb = sum(PrecipProb) / len(PrecipProb) if PrecipProb else 0
-                    MaxWind = max(WindSpeed) if WindSpeed else 0
-                    AvgSolar = sum(SolarRad) / len(SolarRad) if SolarRad else 0
-                    AvgHumidity = sum(Humidity) / len(Humidity) if Humidity else 0
-                    RainyDays = sum(1 for p in PrecipSum if p > 1.0)
-                    
-                    return {
-                        'Status': 'Success',
-                        'Temperature': {
-                            'Min': round(min(TempMin) if TempMin else 20, 1),
-                            'Max': round(max(TempMax) if TempMax else 35, 1),
-                            'Average': round((AvgTempMax + AvgTempMin) / 2, 1),
-                            'Unit': 'Celsius'
-                        },
-                        'Precipitation': {
-                            'Total': round(TotalPrecip, 1),
-                            'Probability': round(AvgPrecipProb, 0),
-                            'Days': RainyDays,
-                            'Unit': 'mm'
-                        },
-                        'WindSpeed': {
-                            'Average': round(sum(WindSpeed) / len(WindSpeed) if WindSpeed else 15, 1),
-                            'Max': round(MaxWind, 1),
-                            'Unit': 'km/h'
-                        },
-                        'Humidity': {
-                            'Average': round(AvgHumidity, 0),
-                            'Unit': 'Percent'
-                        },
-                        'SolarRadiation': {
-                            'Average': round(AvgSolar / 1000, 2),  # Convert Wh to kWh
-                            'Unit': 'kWh/m²/day'
-                        },
-                        'RawData': Daily,
-                        'Timestamp': Data.get('generationtime_ms', None)
-                    }
-                else:
-                    return {'Status': 'Error', 'Message': f'Open-Meteo HTTP {Response.status}'}
+            async with Session.get(Url, params=Params, timeout=12 + len(Coords) // 10) as Response:
+                if Response.status != 200:
+                    return [{'Status': 'Error', 'Message': f'Open-Meteo HTTP {Response.status}'} for _ in Coords]
+                Data = await Response.json()
     
     except Exception as Error:
-        return {'Status': 'Error', 'Message': str(Error)}
+        return [{'Status': 'Error', 'Message': str(Error)} for _ in Coords]
+
+    # A Single Location Comes Back As An Object, Several As A List
+    Locations = Data if isinstance(Data, list) else [Data]
+    if len(Locations) != len(Coords):
+        return [{'Status': 'Error', 'Message': 'Open-Meteo Returned An Unexpected Number Of Locations'} for _ in Coords]
+    return _SummariseOpenMeteo(Locations)
+
+
+def _DailyMatrix(Dailies: List[Dict[str, Any]], Name: str) -> np.ndarray:
+    """Stack One Daily Variable Into A (Locations, Days) Array With NaN For Gaps."""
+    Rows = [Daily.get(Name) or [] for Daily in Dailies]
+    Width = max((len(Row) for Row in Rows), default=0)
+    Matrix = np.full((len(Rows), Width), np.nan)
+    for Index, Row in enumerate(Rows):
+        if Row:
+            Matrix[Index, :len(Row)] = [np.nan if Value is None else Value for Value in Row]
+    return Matrix
+
+
+def _RowStat(Fn, Matrix: np.ndarray, Default: float) -> np.ndarray:
+    """Apply A NaN-Aware Reduction Per Location, Using Default Where A Row Has No Data."""
+    HasData = (~np.isnan(Matrix)).any(axis=1) if Matrix.shape[1] else np.zeros(Matrix.shape[0], dtype=bool)
+    if not HasData.any():
+        return np.full(Matrix.shape[0], Default, dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        Values = Fn(Matrix, axis=1)
+    return np.where(HasData, Values, Default)
+
+
+def _SummariseOpenMeteo(Locations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compute The Agricultural Weather Summary For Every Location In One Pass.
+    
+    Each Daily Variable Becomes A (Locations, Days) Array And Every Statistic
+    Is A Single NumPy Reduction Along The Day Axis. Missing (null) Days Are
+    Ignored; Locations With No Data For A Variable Fall Back To The Same
+    Defaults The Per-Location Path Always Used.
+    """
+    Dailies = [Location.get('daily', {}) for Location in Locations]
+    TempMax = _DailyMatrix(Dailies, 'temperature_2m_max')
+    TempMin = _DailyMatrix(Dailies, 'temperature_2m_min')
+    PrecipSum = _DailyMatrix(Dailies, 'precipitation_sum')
+    PrecipProb = _DailyMatrix(Dailies, 'precipitation_probability_max')
+    WindSpeed = _DailyMatrix(Dailies, 'windspeed_10m_max')
+    SolarRad = _DailyMatrix(Dailies, 'shortwave_radiation_sum')
+    Humidity = _DailyMatrix(Dailies, 'relative_humidity_2m_mean')
+    
+    # Calculate Statistics (One Value Per Location)
+    AvgTempMax = _RowStat(np.nanmean, TempMax, 0)
+    AvgTempMin = _RowStat(np.nanmean, TempMin, 0)
+    TotalPrecip = _RowStat(np.nansum, PrecipSum, 0)
+    AvgPrecipProb = _RowStat(np.nanmean, PrecipProb, 0)
+    MaxWind = _RowStat(np.nanmax, WindSpeed, 0)
+    AvgWind = _RowStat(np.nanmean, WindSpeed, 15)
+    AvgSolar = _RowStat(np.nanmean, SolarRad, 0)
+    AvgHumidity = _RowStat(np.nanmean, Humidity, 0)
+    MinTemp = _RowStat(np.nanmin, TempMin, 20)
+    MaxTemp = _RowStat(np.nanmax, TempMax, 35)
+    with np.errstate(invalid='ignore'):
+        RainyDays = (PrecipSum > 1.0).sum(axis=1)
+    
+    Results = []
+    for i, (Location, Daily) in enumerate(zip(Locations, Dailies)):
+        Results.append({
+            'Status': 'Success',
+            'Temperature': {
+                'Min': round(float(MinTemp[i]), 1),
+                'Max': round(float(MaxTemp[i]), 1),
+                'Average': round(float(AvgTempMax[i] + AvgTempMin[i]) / 2, 1),
+                'Unit': 'Celsius'
+            },
+            'Precipitation': {
+                'Total': round(float(TotalPrecip[i]), 1),
+                'Probability': round(float(AvgPrecipProb[i]), 0),
+                'Days': int(RainyDays[i]),
+                'Unit': 'mm'
+            },
+            'WindSpeed': {
+                'Average': round(float(AvgWind[i]), 1),
+                'Max': round(float(MaxWind[i]), 1),
+                'Unit': 'km/h'
+            },
+            'Humidity': {
+                'Average': round(float(AvgHumidity[i]), 0),
+                'Unit': 'Percent'
+            },
+            'SolarRadiation': {
+                'Average': round(float(AvgSolar[i]) / 1000, 2),  # Convert Wh to kWh
+                'Unit': 'kWh/m²/day'
+            },
+            'RawData': Daily,
+            'Timestamp': Location.get('generationtime_ms', None)
+        })
+    return Results
 
 
-def _AnalyzeAgriculturalRisks(WeatherData: Dict[str, Any]) -> Dict[str, Any]:
+def _AnalyzeAgriculturalRisks(WeatherData: Dict[str, Any], Coordinates: Tuple[float, float] | None = None) -> Dict[str, Any]:
     """
     🌾 Analyze Weather Data For Agricultural Risks Specific To Indian Farming.
     
@@ -262,48 +323,31 @@ def _AnalyzeAgriculturalRisks(WeatherData: Dict[str, Any]) -> Dict[str, Any]:
     - Monsoon Patterns
     - Kharif/Rabi Season Requirements
     - Common Indian Crops (Rice, Wheat, Cotton, Sugarcane)
+    
+    Thresholds Come From The "weather" Rule Set Of The Shared Risk Rule Table,
+    Including Any Overrides For The Region The Coordinates Fall In.
     """
     
     Temp = WeatherData.get('Temperature', {})
     Precip = WeatherData.get('Precipitation', {})
     Humidity = WeatherData.get('Humidity', {})
-    Wind = WeatherData.get('WindSpeed', {})
-    
-    TempMax = Temp.get('Max', 30)
-    TempMin = Temp.get('Min', 20)
-    PrecipTotal = Precip.get('Total', 0)
-    HumidityAvg = Humidity.get('Average', 70)
     
-    # Drought Risk (Insufficient Rainfall)
-    DroughtRisk = 'Low'
-    if PrecipTotal < 10:
-        DroughtRisk = 'High'
-    elif PrecipTotal < 30:
-        DroughtRisk = 'Medium'
-    
-    # Flood Risk (Excessive Rainfall)
-    FloodRisk = 'Low'
-    if PrecipTotal > 200:
-        FloodRisk = 'High'
-    elif PrecipTotal > 100:
-        FloodRisk = 'Medium'
-    
-    # Heat Stress Risk (High Temperatures)
-    HeatStressRisk = 'Low'
-    if TempMax > 40:
-        HeatStressRisk = 'High'
-    elif TempMax > 35:
-        HeatStressRisk = 'Medium'
-    
-    # Disease Risk (High Humidity + Moderate Temps)
-    DiseaseRisk = 'Low'
-    if HumidityAvg > 80 and 20 < TempMax < 35:
-        DiseaseRisk = 'High'
-    elif HumidityAvg > 70:
-        DiseaseRisk = 'Medium'
-    
-    # Confidence Based On Data Completeness
-    Confidence = 90 if all([Temp, Precip, Humidity]) else 70
+    Rules = get_risk_rules()
+    Levels, Confidence = Rules.ruleset('weather').evaluate(
+        {
+            'tmax': np.array([_Number(Temp.get('Max', 30))]),
+            'precip_total': np.array([_Number(Precip.get('Total', 0))]),
+            'humidity': np.array([_Number(Humidity.get('Average', 70))]),
+        },
+        region=np.array([Rules.zone_at(*Coordinates) if Coordinates else 0]),
+        # Confidence Based On Data Completeness
+        sources=np.array([sum(1 for Part in (Temp, Precip, Humidity) if Part)]),
+    )
+    DroughtRisk = LEVELS[Levels['DroughtRisk'][0]]
+    FloodRisk = LEVELS[Levels['FloodRisk'][0]]
+    HeatStressRisk = LEVELS[Levels['HeatStressRisk'][0]]
+    DiseaseRisk = LEVELS[Levels['DiseaseRisk'][0]]
+    Confidence = int(Confidence[0])
     
     # Generate Farming Advice
     Advice = []
@@ -334,4 +378,9 @@ def _AnalyzeAgriculturalRisks(WeatherData: Dict[str, Any]) -> Dict[str, Any]:
         'DiseaseRisk': DiseaseRisk,
         'Confidence': Confidence,
         'FarmingAdvice': Advice
-    }
\ No newline at end of file
+    }
+
+
+def _Number(Value: Any) -> float:
+    """Float For Rule Evaluation; Missing Values Become NaN And Match No Rule."""
+    return float('nan') if Value is None else float(Value)
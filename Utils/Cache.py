@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheEntry(Generic[V]):
+    value: V
+    expires_at: float
+    stored_at: float
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+class TtlLruCache(Generic[V]):
+    """
+    Bounded In-Memory LRU Cache With Per-Entry Expiry.
+
+    Every Entry Carries Its Own Absolute Expiry Time, So Callers Can Mix Short
+    Negative TTLs With Long Positive TTLs In The Same Cache. Least Recently Used
+    Entries Are Evicted Once The Size Limit Is Reached. All Operations Are
+    Guarded By A Lock So The Cache Can Be Shared Across Threads And Executors.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize An Empty Cache.
+
+        Args:
+            max_size: Maximum Number Of Entries Kept Before LRU Eviction
+        """
+        self._max_size = max(1, int(max_size))
+        self._data: "OrderedDict[Hashable, CacheEntry[V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: Hashable, allow_stale: bool = False) -> Optional[CacheEntry[V]]:
+        """
+        Look Up An Entry And Mark It As Recently Used.
+
+        Args:
+            key: Cache Key
+            allow_stale: Return Expired Entries Instead Of Dropping Them
+
+        Returns:
+            CacheEntry Or None When Absent (Or Expired And allow_stale Is False)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry.expired and not allow_stale:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return The Fresh Value For A Key Or The Default."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else default
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None, expires_at: Optional[float] = None) -> None:
+        """
+        Store A Value With Either A Relative TTL Or An Absolute Expiry.
+
+        Args:
+            key: Cache Key
+            value: Value To Store
+            ttl: Lifetime In Seconds From Now
+            expires_at: Absolute Expiry As A Unix Timestamp (Takes Precedence)
+        """
+        now = time.time()
+        if expires_at is None:
+            expires_at = now + (ttl if ttl is not None else float("inf"))
+        with self._lock:
+            self._data[key] = CacheEntry(value=value, expires_at=expires_at, stored_at=now)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove A Key If Present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop All Entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ["TtlLruCache", "CacheEntry"]
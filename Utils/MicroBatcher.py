@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Set, Tuple, TypeVar
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[I, R]):
+    """
+    Group Concurrent Single-Item Requests Into Batched Calls.
+
+    Items Submitted Within window_seconds Of The First Pending Item In The
+    Same Group Are Handed To The Handler Together (Or Sooner, Once max_batch
+    Items Are Waiting). The Handler Receives (group, items) And Must Return
+    One Result Per Item, In Order. If The Handler Raises, Every Caller In
+    That Batch Receives The Exception.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Hashable, List[I]], Awaitable[List[R]]],
+        window_seconds: float = 0.02,
+        max_batch: int = 50,
+    ):
+        self._handler = handler
+        self._window = max(0.0, window_seconds)
+        self._max_batch = max(1, max_batch)
+        self._pending: Dict[Hashable, List[Tuple[I, asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()  # In-Flight Batches, Referenced Until They Finish
+
+    async def submit(self, group: Hashable, item: I) -> R:
+        """
+        Queue One Item And Wait For Its Result.
+
+        Args:
+            group: Items Are Only Batched With Others In The Same Group
+            item: Request Payload Passed To The Handler
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(group, [])
+        pending.append((item, future))
+
+        if len(pending) >= self._max_batch:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(self._window, self._flush, group)
+        return await future
+
+    def _flush(self, group: Hashable) -> None:
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, [])
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(group, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, group: Hashable, batch: List[Tuple[I, asyncio.Future]]) -> None:
+        try:
+            results = await self._handler(group, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch Handler Returned {len(results)} Results For {len(batch)} Items")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+__all__ = ["MicroBatcher"]
@@ -53,8 +53,26 @@ if _PROM_AVAILABLE:
         ["agent"],
         registry=REGISTRY
     )
+    CACHE_LOOKUPS = Counter(
+        "cache_lookups_total",
+        "Cache Lookups By Cache And Result",
+        ["cache", "result"],
+        registry=REGISTRY
+    )
+    SINGLEFLIGHT_CALLS = Counter(
+        "singleflight_calls_total",
+        "Outbound Calls Started (Leader) Or Coalesced Onto An In-Flight Call (Shared)",
+        ["source", "result"],
+        registry=REGISTRY
+    )
+    SOURCE_OUTCOMES = Counter(
+        "forecast_source_outcomes_total",
+        "Forecast Data Sources By Outcome (Arrived, Missed Deadline Or Failed)",
+        ["source", "result"],
+        registry=REGISTRY
+    )
 else:
-    AGENT_DURATION = AGENT_DURATION_LABELED = TOOL_CALLS = ERRORS = None
+    AGENT_DURATION = AGENT_DURATION_LABELED = TOOL_CALLS = ERRORS = CACHE_LOOKUPS = SINGLEFLIGHT_CALLS = SOURCE_OUTCOMES = None
 
 
 def metrics_response():
@@ -182,7 +200,52 @@ def inc_error(agent_name: str):
         ERRORS.labels(agent=agent_name).inc()
 
 
+def inc_cache(cache_name: str, result: str):
+    """
+    Increment Cache Lookup Counter.
+
+    Records Hits And Misses For The Local Caches (Geocoding, Weather, NASA POWER)
+    So Warm-Path Efficiency Can Be Tracked From The /metrics Endpoint.
+
+    Args:
+        cache_name: Name Of The Cache Being Queried
+        result: Lookup Outcome (E.g. 'hit', 'miss', 'disk_hit', 'negative_hit')
+    """
+    if _PROM_AVAILABLE and CACHE_LOOKUPS is not None:
+        CACHE_LOOKUPS.labels(cache=cache_name, result=result).inc()
+
+
+def inc_singleflight(source: str, result: str):
+    """
+    Increment Single-Flight Counter.
+
+    A 'shared' Result Is A Duplicate Outbound Request That Was Avoided Because
+    An Identical Call Was Already In Flight; 'leader' Is A Call That Went Out.
+
+    Args:
+        source: Upstream Being Called (E.g. 'open_meteo', 'nasa_power')
+        result: 'leader' Or 'shared'
+    """
+    if _PROM_AVAILABLE and SINGLEFLIGHT_CALLS is not None:
+        SINGLEFLIGHT_CALLS.labels(source=source, result=result).inc()
+
+
+def inc_source(source: str, result: str):
+    """
+    Increment Forecast Source Outcome Counter.
+
+    Shows How Often Each Data Source Misses Its Deadline, Which Is What
+    Lowers Forecast Confidence When Sources Are Fetched Concurrently.
+
+    Args:
+        source: Data Source Name (E.g. 'WeatherTool', 'CopernicusTool')
+        result: 'ok', 'timeout' Or 'error'
+    """
+    if _PROM_AVAILABLE and SOURCE_OUTCOMES is not None:
+        SOURCE_OUTCOMES.labels(source=source, result=result).inc()
+
+
 __all__ = [
     "setup_tracing", "use_span", "record_agent_duration",
-    "inc_tool", "inc_error", "metrics_response"
+    "inc_tool", "inc_error", "inc_cache", "inc_singleflight", "inc_source", "metrics_response"
 ]
\ No newline at end of file
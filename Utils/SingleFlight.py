@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from Utils.Observability import inc_singleflight
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce Identical In-Flight Async Calls.
+
+    The First Caller For A (Source, Key) Pair Becomes The Leader And Starts The
+    Underlying Coroutine As A Task; Every Concurrent Caller With The Same Pair
+    Awaits That Same Task Instead Of Issuing Its Own Request. The Entry Is
+    Dropped As Soon As The Task Finishes, So Nothing Is Cached Beyond The
+    Lifetime Of The Call Itself.
+
+    The Shared Task Is Shielded: A Caller Being Cancelled (E.g. A Client
+    Disconnecting) Does Not Cancel The Request Other Callers Are Waiting On.
+    Exceptions Propagate To Every Caller Of The Flight.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+
+    async def do(self, source: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn Once For All Concurrent Callers Sharing (source, key).
+
+        Args:
+            source: Upstream Name Used For Metrics (E.g. 'open_meteo')
+            key: Hashable, Normalised Request Parameters
+            fn: Zero-Argument Callable Returning The Awaitable To Share
+
+        Returns:
+            The Result Of The Shared Call
+        """
+        flight_key = (source, key)
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(flight_key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            inc_singleflight(source, "shared")
+            return await asyncio.shield(task)
+
+        inc_singleflight(source, "leader")
+        task = loop.create_task(fn())
+        self._inflight[flight_key] = task
+        task.add_done_callback(lambda t: self._finish(flight_key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, flight_key: Tuple[str, Hashable], task: asyncio.Task) -> None:
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        # Mark The Exception As Retrieved When Every Waiter Was Cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def inflight(self) -> int:
+        """Number Of Calls Currently In Flight."""
+        return len(self._inflight)
+
+
+# Singleton Accessor
+_singleflight: Optional[SingleFlight] = None
+
+
+def get_singleflight() -> SingleFlight:
+    global _singleflight
+    if _singleflight is None:
+        _singleflight = SingleFlight()
+    return _singleflight
+
+
+__all__ = ["SingleFlight", "get_singleflight"]
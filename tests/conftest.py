@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make The Project Packages (Agents, Services, Tools, Config) Importable From The Tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,294 @@
+"""
+Parity Tests For The Vectorised Risk Engine.
+
+The Rule Table (Config/RiskRules.json) Replaced Two Hand-Written Scalar
+Implementations: ForecastAgent.ComputeRiskFromSources And WeatherTool's
+_AnalyzeAgriculturalRisks. Both Are Frozen Below, As They Were Before The
+Move, And Every Randomised Farm Must Get Identical Levels And Confidences
+From The Batch Path.
+"""
+
+import os
+import random
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pytest
+
+from Services.RiskEngine import RiskColumns, evaluate_risks
+from Services.RiskRules import LEVELS, RiskRules
+
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Config", "RiskRules.json")
+
+FARMS = 20_000
+
+
+@pytest.fixture(scope="module")
+def rules() -> RiskRules:
+    return RiskRules.load(RULES_PATH)
+
+
+# ===== Frozen Scalar References =====
+
+_REGIONS = (
+    (("punjab", "haryana", "delhi", "uttar pradesh", "rajasthan"), -1),
+    (("gujarat", "maharashtra", "goa"), 1),
+    (("karnataka", "tamil nadu", "kerala", "andhra pradesh", "telangana"), 0),
+    (("west bengal", "odisha", "bihar", "jharkhand"), 0),
+    (("assam", "meghalaya", "tripura", "manipur", "nagaland", "arunachal pradesh", "sikkim"), 0),
+    (("madhya pradesh", "chhattisgarh"), 1),
+)
+
+
+def _drought_modifier(location: str) -> int:
+    lowered = location.lower()
+    for keywords, modifier in _REGIONS:
+        if any(k in lowered for k in keywords):
+            return modifier
+    return 0
+
+
+def reference_forecast_risks(weather, satellite, copernicus, soil, location: str, ndvi: Optional[float] = None) -> Dict[str, Any]:
+    """ForecastAgent.ComputeRiskFromSources Before The Rule Table (Only The Drought Modifier Was Ever Applied)."""
+    levels = dict.fromkeys(
+        ("Drought", "Flood", "Heat", "Disease", "Pest", "Erosion", "Leaching", "Cold", "Stress"), "Low"
+    )
+    precip_total = weather.get("Precipitation", {}).get("Total", 0)
+    precip_prob = weather.get("Precipitation", {}).get("Probability", 0)
+    tmax = weather.get("Temperature", {}).get("Max", 0)
+    humidity = weather.get("Humidity", {}).get("Average", weather.get("Humidity", {}).get("Mean", 0))
+    nasa_precip = satellite.get("Precipitation", {}).get("Total", 0)
+    nasa_temp = satellite.get("Temperature", {}).get("Average", 0)
+    soil_level = (copernicus.get("SoilMoisture", {}) if copernicus else {}).get("Level", None)
+    et = copernicus.get("Evapotranspiration", {}).get("Rate", None) if copernicus else None
+    ndvi_value = copernicus.get("VegetationHealth", {}).get("NDVI", None) if copernicus else None
+    if ndvi_value is None:
+        ndvi_value = ndvi
+    profile = soil.get("SoilProfile", {}) if soil else {}
+    ph = profile.get("pH", None)
+    texture = profile.get("SoilTexture", "")
+
+    drought = 0
+    if soil_level is not None and soil_level < 30:
+        drought += 3
+    elif precip_total < 10 and nasa_precip < 10:
+        drought += 2
+    if et is not None and et >= 6:
+        drought += 2
+    if texture:
+        if "Sandy" in texture:
+            drought += 1
+        elif "Clay" in texture:
+            drought -= 1
+    drought += _drought_modifier(location)
+    if drought >= 4:
+        levels["Drought"] = "High"
+    elif drought >= 2:
+        levels["Drought"] = "Medium"
+
+    if precip_total is not None and precip_total > 200:
+        levels["Flood"] = "High"
+    elif precip_total > 100 or precip_prob > 70:
+        levels["Flood"] = "Medium"
+
+    if precip_prob > 65 and ndvi_value is not None and ndvi_value < 0.5:
+        levels["Erosion"] = "Medium"
+    if precip_prob > 75 and ndvi_value is not None and ndvi_value < 0.45:
+        levels["Erosion"] = "High"
+
+    leaching = 0
+    if precip_total > 120 and soil_level is not None and soil_level > 60:
+        leaching += 2
+    if precip_total > 180 and soil_level is not None and soil_level > 70:
+        leaching += 2
+    if texture:
+        if "Sandy" in texture:
+            leaching += 2
+        elif "Clay" in texture:
+            leaching -= 1
+    if leaching >= 3:
+        levels["Leaching"] = "High"
+    elif leaching >= 1:
+        levels["Leaching"] = "Medium"
+
+    if tmax >= 40 or nasa_temp >= 38:
+        levels["Heat"] = "High"
+    elif tmax >= 35:
+        levels["Heat"] = "Medium"
+
+    if tmax <= 20 or nasa_temp <= 18:
+        levels["Cold"] = "Medium"
+    if tmax <= 15 or nasa_temp <= 15:
+        levels["Cold"] = "High"
+
+    disease = 0
+    if humidity >= 80 and 20 <= nasa_temp <= 35:
+        disease += 3
+    elif humidity >= 65:
+        disease += 2
+    if ph is not None and (ph < 5.5 or ph > 8.0):
+        disease += 1
+    if disease >= 3:
+        levels["Disease"] = "High"
+    elif disease >= 1:
+        levels["Disease"] = "Medium"
+
+    if ndvi_value is not None and ndvi_value < 0.45:
+        levels["Pest"] = "Medium"
+
+    if ndvi_value is not None and ndvi_value < 0.50 and (et and et > 5 or tmax > 37):
+        levels["Stress"] = "Medium"
+    if ndvi_value is not None and ndvi_value < 0.45 and (et and et > 6 or tmax > 39):
+        levels["Stress"] = "High"
+
+    sources = sum(1 for source in (weather, satellite, copernicus, soil) if source)
+    base = {1: 65, 2: 75, 3: 85, 4: 95}.get(sources, 60)
+    categories = (
+        ("DroughtRisk", "Drought", 0), ("FloodRisk", "Flood", 0), ("PestOutbreakRisk", "Pest", 5),
+        ("DiseaseRisk", "Disease", 5), ("HeatStressRisk", "Heat", 0), ("SoilErosionRisk", "Erosion", 5),
+        ("NutrientLeachingRisk", "Leaching", 5), ("ColdStressRisk", "Cold", 5), ("VegetationStressRisk", "Stress", 5),
+    )
+    return {
+        "OverallRiskLevel": max(levels.values(), key=LEVELS.index),
+        "RiskCategories": {name: {"Level": levels[key], "Confidence": base - penalty} for name, key, penalty in categories},
+    }
+
+
+def reference_weather_risks(weather: Dict[str, Any]) -> Dict[str, Any]:
+    """WeatherTool._AnalyzeAgriculturalRisks Before The Rule Table (Risk Levels And Confidence Only)."""
+    temp, precip, humidity = weather.get("Temperature", {}), weather.get("Precipitation", {}), weather.get("Humidity", {})
+    tmax = temp.get("Max", 30)
+    total = precip.get("Total", 0)
+    average = humidity.get("Average", 70)
+    drought = "High" if total < 10 else "Medium" if total < 30 else "Low"
+    flood = "High" if total > 200 else "Medium" if total > 100 else "Low"
+    heat = "High" if tmax > 40 else "Medium" if tmax > 35 else "Low"
+    disease = "High" if average > 80 and 20 < tmax < 35 else "Medium" if average > 70 else "Low"
+    return {
+        "DroughtRisk": drought,
+        "FloodRisk": flood,
+        "HeatStressRisk": heat,
+        "DiseaseRisk": disease,
+        "Confidence": 90 if all([temp, precip, humidity]) else 70,
+    }
+
+
+# ===== Random Inputs Clustered On The Thresholds =====
+
+LOCATIONS = (
+    "Ludhiana, Punjab", "Pune, Maharashtra", "Mysuru, Karnataka", "Patna, Bihar", "Jorhat, Assam",
+    "Indore, Madhya Pradesh", "Jaipur Rajasthan", "Nashik", "Goa", "Somewhere Else", "",
+)
+TEXTURES = ("", "Sandy Loam", "Clay", "Silty Clay", "Loam", "Loamy Sand")
+
+
+def _value(rng: random.Random, edges, low: float, high: float) -> float:
+    """A Threshold Itself, A Hair Either Side Of One, Or Anything In Range."""
+    roll = rng.random()
+    if roll < 0.3:
+        return float(rng.choice(edges))
+    if roll < 0.5:
+        return rng.choice(edges) + rng.choice((-0.01, 0.01))
+    return round(rng.uniform(low, high), 2)
+
+
+def _maybe(rng: random.Random, p: float = 0.8) -> bool:
+    return rng.random() < p
+
+
+def random_farm(rng: random.Random):
+    weather: Dict[str, Any] = {}
+    if _maybe(rng):
+        weather["Precipitation"] = {}
+        if _maybe(rng):
+            weather["Precipitation"]["Total"] = _value(rng, (10, 30, 100, 120, 180, 200), 0, 260)
+        if _maybe(rng):
+            weather["Precipitation"]["Probability"] = _value(rng, (65, 70, 75), 0, 100)
+    if _maybe(rng):
+        weather["Temperature"] = {"Max": _value(rng, (15, 20, 35, 37, 39, 40), 5, 48)} if _maybe(rng) else {}
+    if _maybe(rng):
+        key = "Average" if _maybe(rng) else "Mean"
+        weather["Humidity"] = {key: _value(rng, (65, 70, 80), 20, 100)}
+
+    satellite: Dict[str, Any] = {}
+    if _maybe(rng):
+        satellite = {
+            "Precipitation": {"Total": _value(rng, (10,), 0, 60)},
+            "Temperature": {"Average": _value(rng, (15, 18, 20, 35, 38), 5, 45)},
+        }
+
+    copernicus: Dict[str, Any] = {}
+    if _maybe(rng, 0.7):
+        if _maybe(rng):
+            copernicus["SoilMoisture"] = {"Level": _value(rng, (30, 60, 70), 0, 100)}
+        if _maybe(rng):
+            copernicus["Evapotranspiration"] = {"Rate": _value(rng, (0, 5, 6), 0, 9)}
+        if _maybe(rng, 0.6):
+            copernicus["VegetationHealth"] = {"NDVI": _value(rng, (0.45, 0.5), 0.1, 0.9)}
+
+    soil: Dict[str, Any] = {}
+    if _maybe(rng, 0.7):
+        profile: Dict[str, Any] = {"SoilTexture": rng.choice(TEXTURES)}
+        if _maybe(rng):
+            profile["pH"] = _value(rng, (5.5, 8.0), 4.0, 9.5)
+        soil = {"SoilProfile": profile}
+
+    ndvi = _value(rng, (0.45, 0.5), 0.1, 0.9) if _maybe(rng, 0.5) else None
+    return weather, satellite, copernicus, soil, rng.choice(LOCATIONS), ndvi
+
+
+# ===== Tests =====
+
+def test_forecast_batch_matches_scalar_reference(rules):
+    rng = random.Random(20251117)
+    farms = [random_farm(rng) for _ in range(FARMS)]
+    batch = evaluate_risks(RiskColumns.from_sources(farms), rules=rules).records()
+    mismatches = [
+        (farm, got, expected)
+        for farm, got in zip(farms, batch)
+        if got != (expected := reference_forecast_risks(*farm))
+    ]
+    assert not mismatches, f"{len(mismatches)} Of {FARMS} Farms Differ, First: {mismatches[0]}"
+
+
+def test_single_farm_is_a_batch_of_one(rules):
+    rng = random.Random(7)
+    farms = [random_farm(rng) for _ in range(200)]
+    batch = evaluate_risks(RiskColumns.from_sources(farms), rules=rules).records()
+    for farm, expected in zip(farms, batch):
+        assert evaluate_risks(RiskColumns.from_sources([farm]), rules=rules).record(0) == expected
+
+
+def test_weather_ruleset_matches_scalar_reference(rules):
+    rng = random.Random(11)
+    compiled = rules.ruleset("weather")
+    for _ in range(FARMS // 4):
+        weather, *_ = random_farm(rng)
+        temp, precip, humidity = weather.get("Temperature", {}), weather.get("Precipitation", {}), weather.get("Humidity", {})
+        levels, confidence = compiled.evaluate(
+            {
+                "tmax": np.array([float(temp.get("Max", 30))]),
+                "precip_total": np.array([float(precip.get("Total", 0))]),
+                "humidity": np.array([float(humidity.get("Average", 70))]),
+            },
+            region=np.array([0]),
+            sources=np.array([sum(1 for part in (temp, precip, humidity) if part)]),
+        )
+        got = {name: LEVELS[int(level[0])] for name, level in levels.items()}
+        got["Confidence"] = int(confidence[0])
+        assert got == reference_weather_risks(weather), weather
+
+
+def test_weather_ruleset_uses_strict_comparisons(rules):
+    """The Weather Rules Use > Where The Forecast Rules Use >= (Kept From The Original Code)."""
+    compiled = rules.ruleset("weather")
+    levels, _ = compiled.evaluate(
+        {"tmax": np.array([40.0, 35.0, 40.01]), "precip_total": np.array([10.0, 200.0, 200.01]), "humidity": np.array([70.0, 80.0, 80.01])},
+        region=np.zeros(3, dtype=int),
+        sources=np.full(3, 3),
+    )
+    assert [LEVELS[i] for i in levels["HeatStressRisk"]] == ["Medium", "Low", "High"]
+    assert [LEVELS[i] for i in levels["DroughtRisk"]] == ["Medium", "Low", "Low"]
+    assert [LEVELS[i] for i in levels["FloodRisk"]] == ["Low", "Medium", "High"]
+    assert [LEVELS[i] for i in levels["DiseaseRisk"]] == ["Low", "Medium", "Medium"]